@@ -0,0 +1,66 @@
+''' Compare the sliding window aggregate of <AggregateQueue> with keeping the
+    window in a <collections.deque> and recomputing the aggregate after every
+    step.
+
+    Usage: python benchmarks/aggregate_benchmark.py [value count] [window size] '''
+
+import os
+import random
+import sys
+import timeit
+from collections import deque
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from stacks import AggregateQueue
+
+
+
+RECOMPUTE = {'min': min, 'max': max, 'sum': sum}
+
+
+
+def aggregate_queue(values, window, operation):
+    queue = AggregateQueue(operation)
+    results = []
+
+    for val in values:
+        queue.push(val)
+
+        if len(queue) > window:
+            queue.pop()
+
+        results.append(queue.aggregate())
+
+    return results
+
+
+def recomputed_deque(values, window, operation):
+    recompute = RECOMPUTE[operation]
+    queue = deque(maxlen=window)
+    results = []
+
+    for val in values:
+        queue.append(val)
+        results.append(recompute(queue))
+
+    return results
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    window = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+    values = [random.random() for _ in range(n)]
+
+    print(f'window of {window}')
+    print(f'{"operation":<12}{"implementation":<20}{"seconds":>10}{"Msteps/s":>10}')
+
+    for operation in ('min', 'max', 'sum'):
+        for benchmark in (aggregate_queue, recomputed_deque):
+            seconds = min(timeit.repeat(lambda: benchmark(values, window, operation), number=1, repeat=3))
+            print(f'{operation:<12}{benchmark.__name__:<20}{seconds:>10.3f}{n / seconds / 1e6:>10.2f}')
+
+
+if __name__ == '__main__':
+    main()
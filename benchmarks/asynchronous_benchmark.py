@@ -0,0 +1,82 @@
+''' Compare <AsyncDeque> and <AsyncStack> with <asyncio.Queue> and
+    <asyncio.LifoQueue>, with several producer and consumer tasks passing
+    items through a bounded buffer on one event loop.
+
+    Usage: python benchmarks/asynchronous_benchmark.py [item count] [producers] [consumers] [capacity] '''
+
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from asynchronous import AsyncDeque, AsyncStack
+
+
+
+STOP = object()
+
+
+
+async def produce(push, count):
+    for i in range(count):
+        await push(i)
+
+
+async def consume(pop):
+    while await pop() is not STOP:
+        pass
+
+
+async def consume_many(buffer, batch):
+    while True:
+        values = await buffer.get_many(batch)
+
+        if STOP in values:
+            for _ in range(values.count(STOP) - 1):   # Leave the other stop markers for the other consumers
+                await buffer.push(STOP)
+
+            return
+
+
+async def run(buffer, push, make_consumer, n, producers, consumers):
+    start = time.perf_counter()
+
+    consumer_tasks = [asyncio.create_task(make_consumer(buffer)) for _ in range(consumers)]
+    await asyncio.gather(*(produce(push, n // producers) for _ in range(producers)))
+
+    for _ in range(consumers):
+        await push(STOP)
+
+    await asyncio.gather(*consumer_tasks)
+
+    return time.perf_counter() - start
+
+
+async def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    producers = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    consumers = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+    capacity = int(sys.argv[4]) if len(sys.argv) > 4 else 1024
+
+    candidates = {
+        'asyncio.Queue': (lambda: asyncio.Queue(capacity), 'put', lambda buffer: consume(buffer.get)),
+        'asyncio.LifoQueue': (lambda: asyncio.LifoQueue(capacity), 'put', lambda buffer: consume(buffer.get)),
+        'AsyncDeque': (lambda: AsyncDeque(capacity), 'push', lambda buffer: consume(buffer.pop)),
+        'AsyncDeque x64': (lambda: AsyncDeque(capacity), 'push', lambda buffer: consume_many(buffer, 64)),
+        'AsyncStack': (lambda: AsyncStack(capacity), 'push', lambda buffer: consume(buffer.pop)),
+        'AsyncStack x64': (lambda: AsyncStack(capacity), 'push', lambda buffer: consume_many(buffer, 64)),
+    }
+
+    print(f'{producers} producers, {consumers} consumers, capacity {capacity}')
+    print(f'{"buffer":<20}{"seconds":>10}{"Mitems/s":>10}')
+
+    for name, (make_buffer, push_name, make_consumer) in candidates.items():
+        buffer = make_buffer()
+        seconds = await run(buffer, getattr(buffer, push_name), make_consumer, n, producers, consumers)
+        print(f'{name:<20}{seconds:>10.3f}{n / seconds / 1e6:>10.2f}')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,126 @@
+''' Compare the throughput of <BlockingQueue> and <BlockingStack> with
+    <queue.Queue>, <queue.LifoQueue> and a <collections.deque> guarded by a
+    single condition variable, with several producer and consumer threads
+    passing items through a bounded buffer.
+
+    Usage: python benchmarks/blocking_benchmark.py [item count] [producers] [consumers] [capacity] '''
+
+import os
+import queue
+import sys
+import threading
+import time
+from collections import deque
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from blocking import BlockingQueue, BlockingStack
+
+
+
+class LockedDeque:
+    ''' <collections.deque> behind one lock, the usual way to share it between
+        producers and consumers '''
+
+    def __init__(self, capacity):
+        self.items = deque()
+        self.capacity = capacity
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self.not_full = threading.Condition(self.lock)
+
+
+    def push(self, val):
+        with self.not_full:
+            while len(self.items) >= self.capacity:
+                self.not_full.wait()
+
+            self.items.append(val)
+            self.not_empty.notify()
+
+
+    def pop(self):
+        with self.not_empty:
+            while not self.items:
+                self.not_empty.wait()
+
+            val = self.items.popleft()
+            self.not_full.notify()
+
+        return val
+
+
+
+STOP = object()
+
+
+
+def produce(push, count):
+    for i in range(count):
+        push(i)
+
+
+def consume(pop):
+    while pop() is not STOP:
+        pass
+
+
+def consume_many(buffer, batch):
+    while True:
+        values = buffer.pop_many(batch)
+
+        if STOP in values:
+            for _ in range(values.count(STOP) - 1):   # Leave the other stop markers for the other consumers
+                buffer.push(STOP)
+
+            return
+
+
+def run(buffer, push, make_consumer, n, producers, consumers):
+    threads = [threading.Thread(target=produce, args=(push, n // producers)) for _ in range(producers)]
+    threads += [threading.Thread(target=make_consumer(buffer)) for _ in range(consumers)]
+
+    start = time.perf_counter()
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads[:producers]:
+        thread.join()
+
+    for _ in range(consumers):
+        push(STOP)
+
+    for thread in threads[producers:]:
+        thread.join()
+
+    return time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    producers = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    consumers = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+    capacity = int(sys.argv[4]) if len(sys.argv) > 4 else 1024
+
+    candidates = {
+        'queue.Queue': (lambda: queue.Queue(capacity), 'put', lambda buffer: lambda: consume(buffer.get)),
+        'queue.LifoQueue': (lambda: queue.LifoQueue(capacity), 'put', lambda buffer: lambda: consume(buffer.get)),
+        'deque + one lock': (lambda: LockedDeque(capacity), 'push', lambda buffer: lambda: consume(buffer.pop)),
+        'BlockingQueue': (lambda: BlockingQueue(capacity), 'push', lambda buffer: lambda: consume(buffer.pop)),
+        'BlockingQueue x64': (lambda: BlockingQueue(capacity), 'push', lambda buffer: lambda: consume_many(buffer, 64)),
+        'BlockingStack': (lambda: BlockingStack(capacity), 'push', lambda buffer: lambda: consume(buffer.pop)),
+        'BlockingStack x64': (lambda: BlockingStack(capacity), 'push', lambda buffer: lambda: consume_many(buffer, 64)),
+    }
+
+    print(f'{producers} producers, {consumers} consumers, capacity {capacity}')
+    print(f'{"buffer":<20}{"seconds":>10}{"Mitems/s":>10}')
+
+    for name, (make_buffer, push_name, make_consumer) in candidates.items():
+        buffer = make_buffer()
+        seconds = run(buffer, getattr(buffer, push_name), make_consumer, n, producers, consumers)
+        print(f'{name:<20}{seconds:>10.3f}{n / seconds / 1e6:>10.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+''' Compare <LRUCache> and <LFUCache> with an <OrderedDict> based LRU cache
+    and <functools.lru_cache> on a skewed (Zipf-like) key distribution.
+
+    Usage: python benchmarks/caches_benchmark.py [lookup count] [capacity] '''
+
+import functools
+import os
+import random
+import sys
+import time
+from collections import OrderedDict
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from caches import LFUCache, LRUCache
+
+
+
+def load(key):
+    return key
+
+
+
+def run_cache(cache, keys):
+    for key in keys:
+        value = cache.get(key)
+
+        if value is None:
+            cache.put(key, load(key))
+
+    return cache.hits / len(keys)
+
+
+def run_ordered_dict(capacity, keys):
+    cache = OrderedDict()
+    hits = 0
+
+    for key in keys:
+        if key in cache:
+            cache.move_to_end(key)
+            hits += 1
+
+        else:
+            cache[key] = load(key)
+
+            if len(cache) > capacity:
+                cache.popitem(last=False)
+
+    return hits / len(keys)
+
+
+def run_lru_cache(capacity, keys):
+    cached_load = functools.lru_cache(maxsize=capacity)(load)
+
+    for key in keys:
+        cached_load(key)
+
+    return cached_load.cache_info().hits / len(keys)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    capacity = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+    generator = random.Random(42)
+    keys = [int(generator.paretovariate(1.1)) for _ in range(n)]
+
+    candidates = {
+        'LRUCache': lambda: run_cache(LRUCache(capacity), keys),
+        'LFUCache': lambda: run_cache(LFUCache(capacity), keys),
+        'OrderedDict LRU': lambda: run_ordered_dict(capacity, keys),
+        'functools.lru_cache': lambda: run_lru_cache(capacity, keys),
+    }
+
+    print(f'{"cache":<22}{"seconds":>10}{"Mops/s":>10}{"hit rate":>10}')
+
+    for name, run in candidates.items():
+        start = time.perf_counter()
+        hit_rate = run()
+        seconds = time.perf_counter() - start
+        print(f'{name:<22}{seconds:>10.3f}{n / seconds / 1e6:>10.2f}{hit_rate:>10.3f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+''' Compare memory per element, traced allocations and queue throughput of
+    <AdvancedDoublyLinkedList> and <CompactDoublyLinkedList> holding numbers.
+
+    Usage: python benchmarks/compact_benchmark.py [element count] '''
+
+import gc
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from compact_linked_lists import CompactDoublyLinkedList
+from linked_lists import AdvancedDoublyLinkedList
+
+
+
+def bytes_per_element(factory, n):
+    ''' Memory allocated by the list including its payloads '''
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    linked_list = factory(range(10**9, 10**9 + n))   # Large ints are not cached by the interpreter
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del linked_list
+    return (after - before) / n
+
+
+def gc_tracked_objects(factory, n):
+    gc.collect()
+    before = len(gc.get_objects())
+    linked_list = factory(range(n))
+    after = len(gc.get_objects())
+
+    del linked_list
+    return after - before
+
+
+def churn(factory, n):
+    ''' Steady state queue workload: append at the end, remove from the front '''
+
+    linked_list = factory(range(1000))
+
+    for i in range(n):
+        linked_list.insert_at_end(i)
+        linked_list.remove_at_beginning()
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    factories = {
+        'AdvancedDoublyLinkedList': AdvancedDoublyLinkedList,
+        'Compact (q)': lambda iterable: CompactDoublyLinkedList(iterable, typecode='q'),
+        'Compact (d)': lambda iterable: CompactDoublyLinkedList(map(float, iterable), typecode='d'),
+    }
+
+    print(f'{"list":<26}{"bytes/elem":>12}{"gc objects":>12}{"iter s":>10}{"churn s":>10}')
+
+    for name, factory in factories.items():
+        memory = bytes_per_element(factory, n)
+        objects = gc_tracked_objects(factory, n)
+        linked_list = factory(range(n))
+        iteration = min(timeit.repeat(lambda: sum(linked_list), number=1, repeat=3))
+        queue = min(timeit.repeat(lambda: churn(factory, n // 10), number=1, repeat=3))
+        print(f'{name:<26}{memory:>12.1f}{objects:>12}{iteration:>10.3f}{queue:>10.3f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+''' Compare <PriorityQueue> with a sorted <AdvancedDoublyLinkedList>
+    (<insert_sorted> and <remove_at_beginning>) and <heapq>, as a scheduler
+    queue holding a given count of pending items while items are added and
+    taken.
+
+    Usage: python benchmarks/heaps_benchmark.py [pending items] [operation count] '''
+
+import heapq
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from heaps import PriorityQueue
+from linked_lists import AdvancedDoublyLinkedList
+
+
+
+def sorted_linked_list(pending, priorities):
+    queue = AdvancedDoublyLinkedList(sorted(pending))
+    queue.is_sorted = True
+    start = time.perf_counter()
+
+    for priority in priorities:
+        queue.insert_sorted(priority)
+        queue.remove_at_beginning()
+
+    return time.perf_counter() - start
+
+
+def priority_queue(pending, priorities, arity=4):
+    queue = PriorityQueue(pending, arity=arity)
+    start = time.perf_counter()
+
+    for priority in priorities:
+        queue.push(priority)
+        queue.pop()
+
+    return time.perf_counter() - start
+
+
+def binary_priority_queue(pending, priorities):
+    return priority_queue(pending, priorities, arity=2)
+
+
+def heapq_list(pending, priorities):
+    queue = list(pending)
+    heapq.heapify(queue)
+    start = time.perf_counter()
+
+    for priority in priorities:
+        heapq.heappush(queue, priority)
+        heapq.heappop(queue)
+
+    return time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    m = int(sys.argv[2]) if len(sys.argv) > 2 else 2_000
+
+    pending = [random.random() for _ in range(n)]
+    priorities = [random.random() for _ in range(m)]
+
+    start = time.perf_counter()
+    PriorityQueue(pending)
+    print(f'heapify of {n} items: {time.perf_counter() - start:.3f} s')
+
+    print(f'{"queue":<24}{"us per push+pop":>16}')
+
+    for benchmark in (sorted_linked_list, priority_queue, binary_priority_queue, heapq_list):
+        seconds = min(benchmark(pending, priorities) for _ in range(3))
+        print(f'{benchmark.__name__:<24}{seconds / m * 1e6:>16.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+''' Compare <MappedDoublyLinkedList> with an in-memory
+    <AdvancedDoublyLinkedList> and with a file of one pickle per element:
+    appending, reopening and iterating forward and backward.
+
+    Usage: python benchmarks/mapped_benchmark.py [element count] [payload size] '''
+
+import os
+import pickle
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from linked_lists import AdvancedDoublyLinkedList
+from mapped_linked_lists import MappedDoublyLinkedList
+
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def consume(iterable):
+    for _ in iterable:
+        pass
+
+
+def run_mapped(path, payloads, payload_size):
+    results = {}
+
+    mapped = MappedDoublyLinkedList(path, payload_size=payload_size)
+    results['append'] = timed(lambda: mapped.extend(payloads))
+    mapped.close()
+
+    mapped = MappedDoublyLinkedList.open(path)
+    results['forward'] = timed(lambda: consume(mapped))
+    results['reverse'] = timed(lambda: consume(reversed(mapped)))
+    mapped.close()
+
+    return results
+
+
+def run_pickled(path, payloads):
+    results = {}
+
+    def append():
+        with open(path, 'wb') as file:
+            for payload in payloads:
+                pickle.dump(payload, file)
+
+    def forward():
+        with open(path, 'rb') as file:
+            try:
+                while True:
+                    pickle.load(file)
+
+            except EOFError:
+                pass
+
+    results['append'] = timed(append)
+    results['forward'] = timed(forward)
+
+    return results
+
+
+def run_in_memory(payloads):
+    results = {}
+    linked_list = AdvancedDoublyLinkedList()
+
+    results['append'] = timed(lambda: linked_list.extend(payloads))
+    results['forward'] = timed(lambda: consume(linked_list))
+    results['reverse'] = timed(lambda: consume(reversed(linked_list)))
+
+    return results
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    payload_size = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+
+    payloads = [str(i).encode().ljust(payload_size, b'.') for i in range(n)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        candidates = {
+            'Mapped': run_mapped(os.path.join(directory, 'list.mdll'), payloads, payload_size),
+            'pickle per element': run_pickled(os.path.join(directory, 'list.pickle'), payloads),
+            'AdvancedDLL (RAM)': run_in_memory(payloads),
+        }
+
+    print(f'{n} elements of {payload_size} bytes, seconds')
+    print(f'{"list":<20}{"append":>10}{"forward":>10}{"reverse":>10}')
+
+    for name, results in candidates.items():
+        columns = ''.join(f'{results[column]:>10.3f}' if column in results else f'{"-":>10}'
+                          for column in ('append', 'forward', 'reverse'))
+        print(f'{name:<20}{columns}')
+
+
+if __name__ == '__main__':
+    main()
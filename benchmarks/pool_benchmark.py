@@ -0,0 +1,55 @@
+''' Measure a high-churn queue workload on <AdvancedDoublyLinkedList> and a
+    push/pop workload on <Stack>, with and without a shared <NodePool>.
+
+    Usage: python benchmarks/pool_benchmark.py [operation count] '''
+
+import gc
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from linked_lists import AdvancedDoublyLinkedList, DoublyLinkedNode, NodePool, SinglyLinkedNode
+from stacks import Stack
+
+
+
+def queue_churn(pool, n):
+    queue = AdvancedDoublyLinkedList(range(1000), pool=pool)
+
+    for i in range(n):
+        queue.insert_at_end(i)
+        queue.remove_at_beginning()
+
+
+def stack_churn(pool, n):
+    stack = Stack(pool=pool)
+
+    for i in range(n // 100):
+        stack.push_many(range(100))
+        stack.pop_many(100)
+
+
+def gc_collections():
+    return sum(generation['collections'] for generation in gc.get_stats())
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    print(f'{"workload":<14}{"pool":<8}{"seconds":>10}{"gc runs":>10}{"hit rate":>10}')
+
+    for workload, node_class in ((queue_churn, DoublyLinkedNode), (stack_churn, SinglyLinkedNode)):
+        for use_pool in (False, True):
+            gc.collect()
+            pool = NodePool(node_class, max_size=4096) if use_pool else None
+            collections = gc_collections()
+            seconds = min(timeit.repeat(lambda: workload(pool, n), number=1, repeat=3))
+            collections = gc_collections() - collections
+            hit_rate = f'{pool.stats()["hit_rate"]:.3f}' if use_pool else '-'
+            print(f'{workload.__name__:<14}{"yes" if use_pool else "no":<8}{seconds:>10.3f}{collections:>10}{hit_rate:>10}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+''' Compare <RingBufferDeque> used as a FIFO queue with
+    <AdvancedDoublyLinkedList> (<insert_at_end> and <remove_at_beginning>)
+    and <collections.deque>, one element at a time and in batches.
+
+    Usage: python benchmarks/queues_benchmark.py [operation count] [batch size] '''
+
+import os
+import sys
+import timeit
+from collections import deque
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from linked_lists import AdvancedDoublyLinkedList
+from queues import RingBufferDeque
+
+
+
+def churn_linked_list(n, window):
+    fifo = AdvancedDoublyLinkedList(range(window))
+
+    for i in range(n):
+        fifo.insert_at_end(i)
+        fifo.remove_at_beginning()
+
+
+def churn_deque(n, window):
+    fifo = deque(range(window))
+
+    for i in range(n):
+        fifo.append(i)
+        fifo.popleft()
+
+
+def churn_ring_buffer(n, window):
+    fifo = RingBufferDeque(window + 1, iterable=range(window))
+
+    for i in range(n):
+        fifo.push(i)
+        fifo.pop()
+
+
+def batches_deque(n, batch):
+    fifo = deque()
+    values = list(range(batch))
+    popleft = fifo.popleft
+
+    for _ in range(n // batch):
+        fifo.extend(values)
+        [popleft() for _ in range(batch)]
+
+
+def batches_ring_buffer(n, batch):
+    fifo = RingBufferDeque(batch + batch // 2)   # Batches wrap around the end of the buffer
+    values = list(range(batch))
+
+    for _ in range(n // batch):
+        fifo.put_many(values)
+        fifo.get_many(batch)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    batch = int(sys.argv[2]) if len(sys.argv) > 2 else 256
+
+    print(f'{"benchmark":<24}{"seconds":>10}{"Mops/s":>10}')
+
+    for benchmark, argument in ((churn_linked_list, 1000), (churn_deque, 1000), (churn_ring_buffer, 1000),
+                                (batches_deque, batch), (batches_ring_buffer, batch)):
+        seconds = min(timeit.repeat(lambda: benchmark(n, argument), number=1, repeat=3))
+        print(f'{benchmark.__name__:<24}{seconds:>10.3f}{2 * n / seconds / 1e6:>10.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+''' Compare <SharedQueue> and <SharedStack> with <multiprocessing.Queue>,
+    with producer processes passing small byte payloads to consumer
+    processes, one at a time and in batches.
+
+    Usage: python benchmarks/shared_benchmark.py [item count] [producers] [consumers] '''
+
+import multiprocessing
+import os
+import queue
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from shared_stacks import SharedQueue, SharedStack
+
+
+
+PAYLOAD = b'x' * 32
+STOP = b''
+BATCH = 64
+
+
+
+def produce_one(buffer, count):
+    for _ in range(count):
+        while True:
+            try:
+                buffer.push(PAYLOAD)
+                break
+
+            except queue.Full:
+                time.sleep(0)
+
+
+def produce_many(buffer, count):
+    batch = [PAYLOAD] * BATCH
+
+    for _ in range(count // BATCH):
+        while True:
+            try:
+                buffer.push_many(batch)
+                break
+
+            except queue.Full:
+                time.sleep(0)
+
+
+def consume_one(buffer):
+    while True:
+        try:
+            if buffer.pop() == STOP:
+                return
+
+        except IndexError:
+            time.sleep(0)
+
+
+def consume_many(buffer):
+    while True:
+        payloads = buffer.pop_many(BATCH)
+
+        if STOP in payloads:
+            buffer.push_many([STOP] * (payloads.count(STOP) - 1))   # Leave the other stop markers for the other consumers
+            return
+
+        if not payloads:
+            time.sleep(0)
+
+
+def produce_mp_queue(buffer, count):
+    for _ in range(count):
+        buffer.put(PAYLOAD)
+
+
+def consume_mp_queue(buffer):
+    while buffer.get() != STOP:
+        pass
+
+
+def run(buffer, produce, consume, stop, n, producers, consumers):
+    start = time.perf_counter()
+
+    processes = [multiprocessing.Process(target=consume, args=(buffer,)) for _ in range(consumers)]
+    processes += [multiprocessing.Process(target=produce, args=(buffer, n // producers)) for _ in range(producers)]
+
+    for process in processes:
+        process.start()
+
+    for process in processes[consumers:]:
+        process.join()
+
+    for _ in range(consumers):
+        stop(buffer)
+
+    for process in processes[:consumers]:
+        process.join()
+
+    return time.perf_counter() - start
+
+
+def push_stop(buffer):
+    while not buffer.is_empty():   # A stop marker pushed onto a stack would hide the payloads under it
+        time.sleep(0)
+
+    while True:
+        try:
+            buffer.push(STOP)
+            return
+
+        except queue.Full:
+            time.sleep(0)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    producers = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+    consumers = int(sys.argv[3]) if len(sys.argv) > 3 else 2
+
+    candidates = {
+        'multiprocessing.Queue': (lambda: multiprocessing.Queue(4096), produce_mp_queue, consume_mp_queue, lambda buffer: buffer.put(STOP)),
+        'SharedQueue': (lambda: SharedQueue(4096, len(PAYLOAD)), produce_one, consume_one, push_stop),
+        f'SharedQueue x{BATCH}': (lambda: SharedQueue(4096, len(PAYLOAD)), produce_many, consume_many, push_stop),
+        'SharedStack': (lambda: SharedStack(4096, len(PAYLOAD)), produce_one, consume_one, push_stop),
+        f'SharedStack x{BATCH}': (lambda: SharedStack(4096, len(PAYLOAD)), produce_many, consume_many, push_stop),
+    }
+
+    print(f'{producers} producers, {consumers} consumers, {os.cpu_count()} CPUs, {len(PAYLOAD)}-byte payloads')
+    print(f'{"buffer":<24}{"seconds":>10}{"Mitems/s":>10}')
+
+    for name, (make_buffer, produce, consume, stop) in candidates.items():
+        buffer = make_buffer()
+        seconds = run(buffer, produce, consume, stop, n, producers, consumers)
+        print(f'{name:<24}{seconds:>10.3f}{n / seconds / 1e6:>10.2f}')
+
+        if isinstance(buffer, (SharedQueue, SharedStack)):
+            buffer.close()
+            buffer.unlink()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+''' Compare the linked and the array backends of <Stack>.
+
+    Usage: python benchmarks/stacks_benchmark.py [operation count] '''
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from stacks import Stack
+
+
+
+def push_pop(backend, n):
+    stack = Stack(backend)
+
+    for i in range(n):
+        stack.push(i)
+
+    while not stack.is_empty():
+        stack.pop()
+
+
+def push_pop_many(backend, n, batch=1000):
+    stack = Stack(backend)
+    values = range(batch)
+
+    for _ in range(n // batch):
+        stack.push_many(values)
+
+    while stack.pop_many(batch):
+        pass
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    print(f'{"benchmark":<16}{"backend":<10}{"seconds":>10}{"Mops/s":>10}')
+
+    for benchmark in (push_pop, push_pop_many):
+        for backend in ('linked', 'array'):
+            seconds = min(timeit.repeat(lambda: benchmark(backend, n), number=1, repeat=3))
+            print(f'{benchmark.__name__:<16}{backend:<10}{seconds:>10.3f}{2 * n / seconds / 1e6:>10.2f}')
+
+
+if __name__ == '__main__':
+    main()
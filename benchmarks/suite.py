@@ -0,0 +1,459 @@
+''' Benchmark suite covering the public methods of <BasicSinglyLinkedList>,
+    <AdvancedSinglyLinkedList>, <AdvancedDoublyLinkedList> and <Stack>, with
+    <list> and <collections.deque> running the same operations as baselines.
+
+    Every case is run for every input size and input kind (random, sorted,
+    reversed and duplicate-heavy values). A fresh structure is built before
+    each timed run, and the garbage collector is paused while timing, so the
+    results of separate runs can be compared. The results can be written as
+    JSON and two JSON files can be compared, flagging operations that got
+    slower by more than a threshold.
+
+    Usage:
+        python benchmarks/suite.py run [--sizes 10,1000,100000 | all] [--inputs random,sorted]
+                                       [--filter TEXT] [--repeat 3] [--output results.json]
+        python benchmarks/suite.py compare BASELINE.json CURRENT.json [--threshold 0.1]
+        python benchmarks/suite.py list
+
+    <--sizes all> runs the sizes 10, 100, ..., 10M, which needs several GB of
+    memory and a long time. <--filter> keeps the cases whose
+    "structure.operation" name contains the given text. <compare> exits with
+    status 1 if any regression is found. The threshold should be above the
+    run-to-run noise of the machine, which comparing two runs of the same
+    commit shows '''
+
+import argparse
+import bisect
+import gc
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from collections import deque, namedtuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from linked_lists import AdvancedDoublyLinkedList, AdvancedSinglyLinkedList, BasicSinglyLinkedList
+from stacks import Stack
+
+
+
+DEFAULT_SIZES = (10, 1000, 100_000)
+ALL_SIZES = tuple(10 ** exponent for exponent in range(1, 8))
+
+OPERATION_COUNT = 1000   # Calls timed per run of a per-element case
+WORK_LIMIT = 10_000_000  # Rough limit of elements visited per run of an O(n) case
+MINIMUM_TIMED = 0.02     # Short cases are run more times, until this many seconds have been timed in total,
+CASE_BUDGET = 1.0        # unless the runs, building included, have taken this many seconds
+LINEAR_OPERATIONS = {'get_size', 'remove', 'remove_by_value', 'insert_at_index', 'remove_at_index',
+                     'insert_sorted', '__contains__', '__getitem__', '__setitem__', 'node_at', 'cursor'}
+
+INPUTS = {
+    'random': lambda n, rng: rng.sample(range(n), n),
+    'sorted': lambda n, rng: list(range(n)),
+    'reversed': lambda n, rng: list(range(n, 0, -1)),
+    'duplicates': lambda n, rng: [rng.randrange(max(1, n // 100)) for _ in range(n)],
+}
+
+Case = namedtuple('Case', 'structure operation make arguments call')
+CASES = []
+
+
+
+def case(structure, operation, make, arguments, call=None):
+    ''' Register a benchmark case. <make(values)> builds the structure,
+        <arguments(target, values, rng, count)> returns the list of argument
+        tuples of the timed calls and <call(target)> returns the function that
+        is called with each of them, the method named <operation> by default '''
+
+    if call is None:
+        call = lambda target: getattr(target, operation)
+
+    CASES.append(Case(structure, operation, make, arguments, call))
+
+
+
+# Arguments of the timed calls
+
+def once(*arguments):
+    return lambda target, values, rng, count: [arguments]
+
+
+def once_with(function):
+    return lambda target, values, rng, count: [function(target, values)]
+
+
+def no_arguments(target, values, rng, count):
+    return [()] * count
+
+
+def sampled_values(target, values, rng, count):
+    return [(rng.choice(values),) for _ in range(count)]
+
+
+def distinct_values(target, values, rng, count):
+    return [(value,) for value in rng.sample(values, count)]
+
+
+def indexes(target, values, rng, count):
+    return [(rng.randrange(len(values)),) for _ in range(count)]
+
+
+def shrinking_indexes(target, values, rng, count):
+    return [(rng.randrange(len(values) - k),) for k in range(count)]
+
+
+def growing_indexes_with_values(target, values, rng, count):
+    return [(rng.randrange(len(values) + k + 1), rng.choice(values)) for k in range(count)]
+
+
+def indexes_with_values(target, values, rng, count):
+    return [(rng.randrange(len(values)), rng.choice(values)) for _ in range(count)]
+
+
+def sampled_nodes(target, values, rng, count):
+    return [(node,) for node in rng.choices(list(walk_nodes(target)), k=count)]
+
+
+def distinct_nodes(target, values, rng, count):
+    return [(node,) for node in rng.sample(list(walk_nodes(target)), count)]
+
+
+def sampled_nodes_with_values(target, values, rng, count):
+    return [(node, rng.choice(values)) for node in rng.choices(list(walk_nodes(target)), k=count)]
+
+
+def walk_nodes(linked_list):
+    current_node = linked_list.head
+
+    while current_node is not None:
+        yield current_node
+        current_node = current_node.next
+
+
+def consume(iterable):
+    for _ in iterable:
+        pass
+
+
+
+# Builders
+
+def make_basic(values):
+    basic_list = BasicSinglyLinkedList()
+
+    for value in reversed(values):
+        basic_list.add(value)
+
+    return basic_list
+
+
+def make_sorted(make):
+    def make_and_sort(values):
+        target = make(values)
+        target.sort()
+        return target
+
+    return make_and_sort
+
+
+def make_stack(backend):
+    def make(values):
+        stack = Stack(backend)
+        stack.push_many(values)
+        return stack
+
+    return make
+
+
+
+# Cases
+
+case('BasicSinglyLinkedList', 'add', make_basic, sampled_values)
+case('BasicSinglyLinkedList', 'remove', make_basic, distinct_values)
+case('BasicSinglyLinkedList', 'get_size', make_basic, once())
+
+
+for linked_list_class in (AdvancedSinglyLinkedList, AdvancedDoublyLinkedList):
+    name = linked_list_class.__name__
+
+    case(name, '__len__', linked_list_class, no_arguments)
+    case(name, '__iter__', linked_list_class, once(), lambda target: lambda: consume(target))
+    case(name, 'insert_at_beginning', linked_list_class, sampled_values)
+    case(name, 'insert_at_end', linked_list_class, sampled_values)
+    case(name, 'insert_at_index', linked_list_class, growing_indexes_with_values)
+    case(name, 'insert_sorted', make_sorted(linked_list_class), sampled_values)
+    case(name, 'extend', linked_list_class, once_with(lambda target, values: (values,)))
+    case(name, 'extendleft', linked_list_class, once_with(lambda target, values: (values,)))
+    case(name, 'splice', linked_list_class, once_with(lambda target, values: (type(target)(values),)))
+    case(name, 'concat', linked_list_class, once_with(lambda target, values: (type(target)(values), type(target)(values))),
+         lambda target: type(target).concat)
+    case(name, 'split_at', linked_list_class, once_with(lambda target, values: (len(values) // 2,)))
+    case(name, 'reverse', linked_list_class, once())
+    case(name, 'sort', linked_list_class, once())
+    case(name, 'delete', linked_list_class, once())
+    case(name, 'to_bytes', linked_list_class, once())
+    case(name, 'from_buffer', linked_list_class, once_with(lambda target, values: (target.to_bytes(),)),
+         lambda target: type(target).from_buffer)
+    case(name, 'cursor', linked_list_class, indexes)
+    case(name, 'remove_if', linked_list_class, once(lambda value: value % 2))
+    case(name, 'remove_all', linked_list_class, once_with(lambda target, values: (values[::2],)))
+    case(name, 'merge_sorted', linked_list_class, once_with(lambda target, values: (target, type(target)(values))),
+         lambda target: type(target).merge_sorted)
+    case(name, 'union', linked_list_class, once_with(lambda target, values: (type(target)(values[::2]),)))
+    case(name, 'intersection', linked_list_class, once_with(lambda target, values: (type(target)(values[::2]),)))
+    case(name, 'difference', linked_list_class, once_with(lambda target, values: (type(target)(values[::2]),)))
+    case(name, 'dedupe', linked_list_class, once())
+    case(name, 'parallel_sort', linked_list_class, once())
+
+
+case('AdvancedSinglyLinkedList', 'remove', AdvancedSinglyLinkedList, distinct_values)
+
+case('AdvancedDoublyLinkedList', '__reversed__', AdvancedDoublyLinkedList, once(), lambda target: lambda: consume(reversed(target)))
+case('AdvancedDoublyLinkedList', '__contains__', AdvancedDoublyLinkedList, sampled_values)
+case('AdvancedDoublyLinkedList', '__getitem__', AdvancedDoublyLinkedList, indexes)
+case('AdvancedDoublyLinkedList', '__setitem__', AdvancedDoublyLinkedList, indexes_with_values)
+case('AdvancedDoublyLinkedList', 'remove_at_beginning', AdvancedDoublyLinkedList, no_arguments)
+case('AdvancedDoublyLinkedList', 'remove_at_end', AdvancedDoublyLinkedList, no_arguments)
+case('AdvancedDoublyLinkedList', 'remove_at_index', AdvancedDoublyLinkedList, shrinking_indexes)
+case('AdvancedDoublyLinkedList', 'remove_by_value', AdvancedDoublyLinkedList, distinct_values)
+case('AdvancedDoublyLinkedList', 'node_at', AdvancedDoublyLinkedList, indexes)
+case('AdvancedDoublyLinkedList', 'insert_after', AdvancedDoublyLinkedList, sampled_nodes_with_values)
+case('AdvancedDoublyLinkedList', 'remove_node', AdvancedDoublyLinkedList, distinct_nodes)
+case('AdvancedDoublyLinkedList', 'move_to_beginning', AdvancedDoublyLinkedList, sampled_nodes)
+case('AdvancedDoublyLinkedList', 'move_to_end', AdvancedDoublyLinkedList, sampled_nodes)
+
+
+for backend in ('linked', 'array'):
+    name = f'Stack[{backend}]'
+    make = make_stack(backend)
+
+    case(name, 'push', make, sampled_values)
+    case(name, 'push_many', make, once_with(lambda target, values: (values,)))
+    case(name, 'pop', make, no_arguments)
+    case(name, 'pop_many', make, once_with(lambda target, values: (len(values),)))
+    case(name, 'peek', make, no_arguments)
+    case(name, 'is_empty', make, no_arguments)
+    case(name, 'snapshot', make, once())
+
+
+# Baselines, registered under the operation names of the linked lists they stand in for
+
+for baseline_class in (list, deque):
+    name = baseline_class.__name__
+
+    case(name, '__len__', baseline_class, no_arguments)
+    case(name, '__iter__', baseline_class, once(), lambda target: lambda: consume(target))
+    case(name, '__reversed__', baseline_class, once(), lambda target: lambda: consume(reversed(target)))
+    case(name, '__contains__', baseline_class, sampled_values)
+    case(name, '__getitem__', baseline_class, indexes)
+    case(name, '__setitem__', baseline_class, indexes_with_values)
+    case(name, 'insert_at_end', baseline_class, sampled_values, lambda target: target.append)
+    case(name, 'insert_at_index', baseline_class, growing_indexes_with_values, lambda target: target.insert)
+    case(name, 'remove_at_end', baseline_class, no_arguments, lambda target: target.pop)
+    case(name, 'remove_at_index', baseline_class, shrinking_indexes, lambda target: target.__delitem__)
+    case(name, 'remove_by_value', baseline_class, distinct_values, lambda target: target.remove)
+    case(name, 'extend', baseline_class, once_with(lambda target, values: (values,)))
+    case(name, 'reverse', baseline_class, once())
+    case(name, 'delete', baseline_class, once(), lambda target: target.clear)
+    case(name, 'push', baseline_class, sampled_values, lambda target: target.append)
+    case(name, 'pop', baseline_class, no_arguments)
+
+case('list', 'insert_at_beginning', list, sampled_values, lambda target: lambda value: target.insert(0, value))
+case('list', 'insert_sorted', sorted, sampled_values, lambda target: lambda value: bisect.insort(target, value))
+case('list', 'remove_at_beginning', list, no_arguments, lambda target: lambda: target.pop(0))
+case('list', 'extendleft', list, once_with(lambda target, values: (values,)),
+     lambda target: lambda values: target.__setitem__(slice(0, 0), values[::-1]))
+case('list', 'sort', list, once())
+case('deque', 'insert_at_beginning', deque, sampled_values, lambda target: target.appendleft)
+case('deque', 'remove_at_beginning', deque, no_arguments, lambda target: target.popleft)
+case('deque', 'extendleft', deque, once_with(lambda target, values: (values,)))
+
+
+
+def run_case(case, values, repeat, seed):
+    ''' Time <case> on <values> and return the best time of at least <repeat>
+        runs and the count of timed calls. Cases too short to time reliably
+        get more runs '''
+
+    n = len(values)
+    count = min(n, OPERATION_COUNT)
+
+    if case.operation in LINEAR_OPERATIONS:
+        count = max(1, min(count, WORK_LIMIT // max(n, 1)))
+
+    best = None
+    runs = 0
+    timed = 0.0
+    case_start = time.perf_counter()
+    gc.collect()
+
+    while runs < repeat or (timed < MINIMUM_TIMED and time.perf_counter() - case_start < CASE_BUDGET):
+        rng = random.Random(seed)
+        target = case.make(values)
+        arguments = case.arguments(target, values, rng, count)
+        function = case.call(target)
+
+        gc.disable()   # Collections run between the timed parts instead
+
+        try:
+            start = time.perf_counter()
+
+            for argument in arguments:
+                function(*argument)
+
+            seconds = time.perf_counter() - start
+
+        finally:
+            gc.enable()
+
+        best = seconds if best is None else min(best, seconds)
+        runs += 1
+        timed += seconds
+
+    return best, len(arguments)
+
+
+def selected_cases(text):
+    return [case for case in CASES if text is None or text in f'{case.structure}.{case.operation}']
+
+
+def metadata():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+
+    except OSError:
+        commit = None
+
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'commit': commit,
+    }
+
+
+def command_run(options):
+    sizes = ALL_SIZES if options.sizes == 'all' else tuple(int(size) for size in options.sizes.split(','))
+    inputs = options.inputs.split(',')
+
+    for input_name in inputs:
+        if input_name not in INPUTS:
+            raise SystemExit(f'unknown input kind: {input_name}')
+
+    cases = selected_cases(options.filter)
+    results = []
+
+    print(f'{"structure":<26}{"operation":<22}{"input":<12}{"size":>10}{"calls":>8}{"ns/call":>14}')
+
+    for size in sizes:
+        for input_name in inputs:
+            values = INPUTS[input_name](size, random.Random(options.seed))
+
+            for case in cases:
+                seconds, calls = run_case(case, values, options.repeat, options.seed)
+                ns_per_call = seconds / calls * 1e9
+
+                results.append({
+                    'structure': case.structure,
+                    'operation': case.operation,
+                    'input': input_name,
+                    'size': size,
+                    'calls': calls,
+                    'seconds': seconds,
+                    'ns_per_call': ns_per_call,
+                })
+
+                print(f'{case.structure:<26}{case.operation:<22}{input_name:<12}{size:>10}{calls:>8}{ns_per_call:>14.1f}')
+
+    if options.output is not None:
+        with open(options.output, 'w') as file:
+            json.dump({'metadata': metadata(), 'results': results}, file, indent=1)
+
+        print(f'results written to {options.output}')
+
+
+def command_compare(options):
+    with open(options.baseline) as file:
+        baseline = json.load(file)
+
+    with open(options.current) as file:
+        current = json.load(file)
+
+    def key(result):
+        return (result['structure'], result['operation'], result['input'], result['size'])
+
+    baseline_results = {key(result): result for result in baseline['results']}
+    regressions = improvements = compared = 0
+
+    print(f'{"structure":<26}{"operation":<22}{"input":<12}{"size":>10}{"before":>12}{"after":>12}{"change":>9}')
+
+    for result in current['results']:
+        before = baseline_results.get(key(result))
+
+        if before is None:
+            continue
+
+        compared += 1
+        change = result['ns_per_call'] / before['ns_per_call'] - 1
+
+        if change > options.threshold:
+            flag = 'REGRESSION'
+            regressions += 1
+
+        elif change < -options.threshold:
+            flag = 'faster'
+            improvements += 1
+
+        else:
+            continue
+
+        print(f'{result["structure"]:<26}{result["operation"]:<22}{result["input"]:<12}{result["size"]:>10}'
+              f'{before["ns_per_call"]:>12.1f}{result["ns_per_call"]:>12.1f}{change:>+9.1%}  {flag}')
+
+    print(f'{compared} results compared, {regressions} regressions, {improvements} improvements '
+          f'(threshold {options.threshold:.0%})')
+
+    return 1 if regressions else 0
+
+
+def command_list(options):
+    for case in selected_cases(options.filter):
+        print(f'{case.structure}.{case.operation}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark suite of the data structures')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='run the benchmarks')
+    run_parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                            help="comma separated input sizes, or 'all' for 10 to 10M")
+    run_parser.add_argument('--inputs', default=','.join(INPUTS), help='comma separated input kinds')
+    run_parser.add_argument('--filter', help='run only the cases whose name contains this text')
+    run_parser.add_argument('--repeat', type=int, default=3, help='timed runs per case, the best one is kept')
+    run_parser.add_argument('--seed', type=int, default=42)
+    run_parser.add_argument('--output', help='write the results to this JSON file')
+
+    compare_parser = commands.add_parser('compare', help='compare two JSON result files')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=0.1, help='relative slowdown flagged as a regression')
+
+    list_parser = commands.add_parser('list', help='list the benchmark cases')
+    list_parser.add_argument('--filter', help='list only the cases whose name contains this text')
+
+    options = parser.parse_args()
+    command = {'run': command_run, 'compare': command_compare, 'list': command_list}[options.command]
+
+    sys.exit(command(options))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+''' Compare memory per element and iteration throughput of
+    <AdvancedDoublyLinkedList> and <UnrolledDoublyLinkedList>.
+
+    Usage: python benchmarks/unrolled_benchmark.py [element count] '''
+
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from linked_lists import AdvancedDoublyLinkedList, UnrolledDoublyLinkedList
+
+
+
+def bytes_per_element(factory, values):
+    ''' Memory allocated by the list structure itself, excluding payloads '''
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    linked_list = factory(values)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del linked_list
+    return (after - before) / len(values)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    values = list(range(n))
+
+    factories = {
+        'AdvancedDoublyLinkedList': AdvancedDoublyLinkedList,
+        'Unrolled (block_size=16)': lambda iterable: UnrolledDoublyLinkedList(iterable, block_size=16),
+        'Unrolled (block_size=64)': lambda iterable: UnrolledDoublyLinkedList(iterable, block_size=64),
+    }
+
+    print(f'{"list":<28}{"bytes/elem":>12}{"iter Melem/s":>14}{"contains s":>12}')
+
+    for name, factory in factories.items():
+        memory = bytes_per_element(factory, values)
+        linked_list = factory(values)
+        iteration = min(timeit.repeat(lambda: sum(1 for _ in linked_list), number=1, repeat=3))
+        contains = min(timeit.repeat(lambda: -1 in linked_list, number=1, repeat=3))
+        print(f'{name:<28}{memory:>12.1f}{n / iteration / 1e6:>14.2f}{contains:>12.4f}')
+
+
+if __name__ == '__main__':
+    main()
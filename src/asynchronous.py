@@ -0,0 +1,276 @@
+import asyncio
+
+from linked_lists import AdvancedDoublyLinkedList
+from stacks import Stack
+
+
+
+class AsyncBuffer:
+    ''' Common part of the asyncio buffers: awaitable <pop> that waits for an
+        element, awaitable <push> that waits for room when the buffer holds
+        <capacity> elements (<None> for no limit), batch <get_many>, <close>
+        and draining with <async for>. Subclasses set <_put> and <_get> to
+        the functions that store and take the elements.
+
+        Waiting coroutines are kept in doubly linked lists of futures and are
+        woken one at a time, the longest waiting first. A woken coroutine that
+        finds the buffer full or empty again (another coroutine got there
+        first without waiting) goes back to the beginning of the list, so it
+        does not lose its turn. A cancelled waiter unlinks its own node in
+        O(1) time, or passes its wake-up on if it had already been woken.
+
+        The buffer must be used from one event loop thread only '''
+
+    def __init__(self, capacity=None):
+        if capacity is not None and capacity <= 0:
+            raise ValueError('capacity must be positive')
+
+        self.capacity = capacity
+        self.count = 0
+        self.closed = False
+
+        self.getters = AdvancedDoublyLinkedList()   # Futures of coroutines waiting for an element
+        self.putters = AdvancedDoublyLinkedList()   # Futures of coroutines waiting for room
+
+
+    def __len__(self):
+        return self.count
+
+
+    def __aiter__(self):
+        return self
+
+
+    async def __anext__(self):
+        ''' Return the next element, waiting for one. Iteration stops when the
+            buffer is closed and empty '''
+
+        try:
+            return await self.pop()
+
+        except asyncio.QueueEmpty:
+            raise StopAsyncIteration from None
+
+
+    def is_empty(self):
+        return self.count == 0
+
+
+    def is_full(self):
+        return self.capacity is not None and self.count >= self.capacity
+
+
+    def close(self):
+        ''' Stop accepting new elements. Waiting producers get <ValueError>,
+            and waiting consumers get <asyncio.QueueEmpty> once the elements
+            left in the buffer run out '''
+
+        self.closed = True
+
+        for waiters in (self.getters, self.putters):
+            while waiters.head is not None:
+                _wake_next(waiters)
+
+
+    async def push(self, val):
+        ''' Add an element, waiting for room if the buffer is full '''
+
+        await self._push(val, self._put)
+
+
+    def push_nowait(self, val):
+        ''' Add an element, raise <asyncio.QueueFull> if the buffer is full '''
+
+        self._push_nowait(val, self._put)
+
+
+    async def pop(self):
+        ''' Remove and return an element, waiting for one if the buffer is empty '''
+
+        return await self._pop(self._get)
+
+
+    def pop_nowait(self):
+        ''' Remove and return an element, raise <asyncio.QueueEmpty> if the
+            buffer is empty '''
+
+        return self._pop_nowait(self._get)
+
+
+    async def get_many(self, max_items, timeout=None):
+        ''' Remove up to <max_items> elements and return them as a list, in the
+            order <pop> would return them. Waits at most <timeout> seconds for
+            the first element (<None> for no limit) and returns an empty list
+            if none arrives in time or the buffer is closed and empty '''
+
+        if not (isinstance(max_items, int)):
+            raise TypeError('count must be an integer')
+
+        if max_items < 0:
+            raise ValueError('count must be non-negative')
+
+        if max_items == 0:
+            return []
+
+        try:
+            if timeout is None:
+                values = [await self.pop()]
+
+            else:
+                values = [await asyncio.wait_for(self.pop(), timeout)]
+
+        except (asyncio.TimeoutError, asyncio.QueueEmpty):
+            return []
+
+        while len(values) < max_items and self.count > 0:
+            values.append(self.pop_nowait())
+
+        return values
+
+
+    async def _push(self, val, put):
+        if self.capacity is not None and self.count >= self.capacity and not self.closed:
+            await _wait_in_line(self.putters, at_beginning=False)
+
+            while self.is_full() and not self.closed:
+                await _wait_in_line(self.putters, at_beginning=True)
+
+            self._push_nowait(val, put)
+
+            if not self.is_full() and self.putters.head is not None:
+                _wake_next(self.putters)   # Room is left, let the next producer in
+
+        else:
+            self._push_nowait(val, put)
+
+
+    def _push_nowait(self, val, put):
+        if self.closed:
+            raise ValueError('push to a closed buffer')
+
+        if self.capacity is not None and self.count >= self.capacity:
+            raise asyncio.QueueFull
+
+        put(val)
+        self.count += 1
+
+        if self.getters.head is not None:
+            _wake_next(self.getters)
+
+
+    async def _pop(self, get):
+        if self.count == 0 and not self.closed:
+            await _wait_in_line(self.getters, at_beginning=False)
+
+            while self.count == 0 and not self.closed:
+                await _wait_in_line(self.getters, at_beginning=True)
+
+            val = self._pop_nowait(get)
+
+            if self.count > 0 and self.getters.head is not None:
+                _wake_next(self.getters)   # Elements are left, let the next consumer in
+
+            return val
+
+        return self._pop_nowait(get)
+
+
+    def _pop_nowait(self, get):
+        if self.count == 0:
+            raise asyncio.QueueEmpty
+
+        val = get()
+        self.count -= 1
+
+        if self.putters.head is not None:
+            _wake_next(self.putters)
+
+        return val
+
+
+
+class AsyncStack(AsyncBuffer):
+    ''' asyncio Stack, <pop> returns the most recently pushed element. Elements
+        are kept in a <Stack> with the given <backend> '''
+
+    def __init__(self, capacity=None, backend='linked'):
+        super().__init__(capacity)
+        self.items = Stack(backend)
+        self._put = self.items.push
+        self._get = self.items.pop
+
+
+    def peek(self):
+        ''' Get the top element without removing it, <None> if the stack is empty '''
+
+        return self.items.peek()
+
+
+
+class AsyncDeque(AsyncBuffer):
+    ''' asyncio double-ended queue kept in an <AdvancedDoublyLinkedList>.
+        <push> adds to the end and <pop> removes from the beginning, so used
+        with these two it is a FIFO queue. <push_front> and <pop_back> work on
+        the other ends and share the capacity and the waiting lines '''
+
+    def __init__(self, capacity=None):
+        super().__init__(capacity)
+        self.items = AdvancedDoublyLinkedList()
+        self._put = self.items.insert_at_end
+        self._get = self.items.remove_at_beginning
+
+
+    async def push_front(self, val):
+        ''' Add an element to the beginning, waiting for room if the deque is full '''
+
+        await self._push(val, self.items.insert_at_beginning)
+
+
+    def push_front_nowait(self, val):
+        self._push_nowait(val, self.items.insert_at_beginning)
+
+
+    async def pop_back(self):
+        ''' Remove and return the last element, waiting for one if the deque is empty '''
+
+        return await self._pop(self.items.remove_at_end)
+
+
+    def pop_back_nowait(self):
+        return self._pop_nowait(self.items.remove_at_end)
+
+
+
+async def _wait_in_line(waiters, at_beginning):
+    ''' Wait until woken by <_wake_next>, queued at the beginning or at the
+        end of <waiters> '''
+
+    future = asyncio.get_running_loop().create_future()
+    node = waiters.insert_at_beginning(future) if at_beginning else waiters.insert_at_end(future)
+
+    try:
+        await future
+
+    except asyncio.CancelledError:
+        if node.data is not None:
+            waiters.remove_node(node)   # Still in line, nobody has woken it
+
+        elif not future.cancelled():
+            _wake_next(waiters)   # Woken but cancelled before it could act, pass the turn on
+
+        raise
+
+
+def _wake_next(waiters):
+    ''' Wake the first coroutine in <waiters> that is still waiting. Every node
+        taken out of the line gets its <data> cleared, which tells a cancelled
+        waiter that it no longer has to unlink it '''
+
+    while waiters.head is not None:
+        node = waiters.head
+        future = waiters.remove_node(node)
+        node.data = None
+
+        if not future.done():
+            future.set_result(None)
+            return
@@ -0,0 +1,261 @@
+import queue
+import threading
+
+from linked_lists import SinglyLinkedNode
+from stacks import Stack
+
+
+
+class BlockingStack:
+    ''' Thread-safe Stack for producer-consumer use. Pushes and pops both work
+        on the top of the stack, so all operations share one lock. <pop> waits
+        for an element when the stack is empty and <push> waits for room when
+        the stack holds <capacity> elements (<None> for no limit).
+
+        A wait can be limited with <timeout> in seconds. If it runs out, or if
+        <block> is false and the operation would have to wait, <queue.Empty>
+        or <queue.Full> is raised '''
+
+    def __init__(self, capacity=None, backend='linked'):
+        if capacity is not None and capacity <= 0:
+            raise ValueError('capacity must be positive')
+
+        self.items = Stack(backend)
+        self.capacity = capacity
+        self.count = 0
+
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self.not_full = threading.Condition(self.lock)
+
+
+    def __len__(self):
+        return self.count
+
+
+    def push(self, val, block=True, timeout=None):
+        ''' Add an element to the stack, waiting for room if it is full '''
+
+        with self.lock:
+            _wait(self.not_full, self._has_room, block, timeout, queue.Full)
+            self.items.push(val)
+            self.count += 1
+            self.not_empty.notify()
+
+
+    def pop(self, block=True, timeout=None):
+        ''' Remove and return the top element, waiting for one if the stack is
+            empty '''
+
+        with self.lock:
+            _wait(self.not_empty, self._has_elements, block, timeout, queue.Empty)
+            val = self.items.pop()
+            self.count -= 1
+            self.not_full.notify()
+
+        return val
+
+
+    def pop_many(self, n, block=True, timeout=None):
+        ''' Remove up to <n> elements under a single acquisition of the lock
+            and return them as a list, starting with the top element. Waits
+            only for the first element and returns an empty list if none
+            arrives in time '''
+
+        if not (isinstance(n, int)):
+            raise TypeError('count must be an integer')
+
+        if n < 0:
+            raise ValueError('count must be non-negative')
+
+        with self.lock:
+            if n == 0 or not _wait_for(self.not_empty, self._has_elements, block, timeout):
+                return []
+
+            values = self.items.pop_many(n)
+            self.count -= len(values)
+            self.not_full.notify(len(values))
+
+        return values
+
+
+    def peek(self):
+        ''' Get the top element without removing it, <None> if the stack is empty '''
+
+        with self.lock:
+            return self.items.peek()
+
+
+    def is_empty(self):
+        return self.count == 0
+
+
+    def _has_room(self):
+        return self.capacity is None or self.count < self.capacity
+
+
+    def _has_elements(self):
+        return self.count > 0
+
+
+
+class BlockingQueue:
+    ''' Thread-safe FIFO queue with separate locks for its two ends (two-lock
+        queue). Elements are kept in a singly linked list that starts with a
+        dummy node: <push> links a node after <tail> holding only the tail
+        lock, and <pop> makes the first element node the new dummy holding
+        only the head lock, so producers and consumers do not wait for each
+        other. <pop> waits for an element when the queue is empty and <push>
+        waits for room when the queue holds <capacity> elements (<None> for
+        no limit). <timeout> and <block> work as in <BlockingStack>.
+
+        The length is the difference of two counters, <pushed> which only
+        changes under the tail lock and <popped> which only changes under the
+        head lock, so neither end has to take the other lock to keep it. A
+        lock of the other end is taken only to wake up its waiters, and only
+        after the own lock has been released '''
+
+    def __init__(self, capacity=None):
+        if capacity is not None and capacity <= 0:
+            raise ValueError('capacity must be positive')
+
+        self.head = self.tail = SinglyLinkedNode(None)   # Dummy node, the first element is in <head.next>
+        self.capacity = capacity
+        self.pushed = 0
+        self.popped = 0
+
+        self.head_lock = threading.Lock()
+        self.tail_lock = threading.Lock()
+        self.not_empty = threading.Condition(self.head_lock)
+        self.not_full = threading.Condition(self.tail_lock)
+
+
+    def __len__(self):
+        popped = self.popped   # Read before <pushed>, so the difference is never negative
+        return self.pushed - popped
+
+
+    def push(self, val, block=True, timeout=None):
+        ''' Add an element to the end of the queue, waiting for room if it is full '''
+
+        with self.tail_lock:
+            _wait(self.not_full, self._has_room, block, timeout, queue.Full)
+
+            new_node = SinglyLinkedNode(val)
+            self.tail.next = new_node   # Node is visible to consumers before it is counted
+            self.tail = new_node
+            self.pushed += 1
+
+            size = self.pushed - self.popped
+
+            if self.capacity is not None and size < self.capacity:
+                self.not_full.notify()   # Let another waiting producer use the remaining room
+
+        if size == 1:   # Queue was empty, consumers may be waiting
+            with self.head_lock:
+                self.not_empty.notify()
+
+
+    def pop(self, block=True, timeout=None):
+        ''' Remove and return the first element, waiting for one if the queue is empty '''
+
+        with self.head_lock:
+            _wait(self.not_empty, self._has_elements, block, timeout, queue.Empty)
+            val = self._pop_nodes(1)[0]
+            size = self.pushed - self.popped
+
+            if size > 0:
+                self.not_empty.notify()   # Let another waiting consumer take the rest
+
+        if self.capacity is not None and size + 1 >= self.capacity:   # Queue was full, producers may be waiting
+            with self.tail_lock:
+                self.not_full.notify()
+
+        return val
+
+
+    def pop_many(self, n, block=True, timeout=None):
+        ''' Remove up to <n> elements from the beginning of the queue under a
+            single acquisition of the head lock and return them as a list.
+            Waits only for the first element and returns an empty list if
+            none arrives in time '''
+
+        if not (isinstance(n, int)):
+            raise TypeError('count must be an integer')
+
+        if n < 0:
+            raise ValueError('count must be non-negative')
+
+        with self.head_lock:
+            if n == 0 or not _wait_for(self.not_empty, self._has_elements, block, timeout):
+                return []
+
+            values = self._pop_nodes(min(n, self.pushed - self.popped))
+            size = self.pushed - self.popped
+
+            if size > 0:
+                self.not_empty.notify()
+
+        if self.capacity is not None and size + len(values) >= self.capacity:
+            with self.tail_lock:
+                self.not_full.notify(len(values))
+
+        return values
+
+
+    def peek(self):
+        ''' Get the first element without removing it, <None> if the queue is empty '''
+
+        with self.head_lock:
+            first_node = self.head.next
+            return None if first_node is None else first_node.data
+
+
+    def is_empty(self):
+        return len(self) == 0
+
+
+    def _pop_nodes(self, count):
+        ''' Unlink <count> element nodes following the dummy node, the last of
+            them becomes the new dummy node. The caller holds the head lock
+            and has made sure that the queue has at least <count> elements '''
+
+        values = []
+        current_node = self.head
+
+        for _ in range(count):
+            current_node = current_node.next
+            values.append(current_node.data)
+
+        current_node.data = None   # New dummy node must not keep the value alive
+        self.head = current_node
+        self.popped += count
+
+        return values
+
+
+    def _has_room(self):
+        return self.capacity is None or self.pushed - self.popped < self.capacity
+
+
+    def _has_elements(self):
+        return self.pushed - self.popped > 0
+
+
+
+def _wait_for(condition, predicate, block, timeout):
+    ''' Wait on <condition> until <predicate> holds, return <False> if it does
+        not hold when the wait is over. The caller holds the lock of <condition> '''
+
+    if predicate():
+        return True
+
+    if not block:
+        return False
+
+    return condition.wait_for(predicate, timeout)
+
+
+def _wait(condition, predicate, block, timeout, error):
+    if not _wait_for(condition, predicate, block, timeout):
+        raise error
@@ -0,0 +1,306 @@
+import time
+
+from linked_lists import AdvancedDoublyLinkedList
+
+
+
+class CacheEntry:
+    __slots__ = ('key', 'value', 'weight', 'expires_at', 'bucket')
+
+    def __init__(self, key, value, weight, expires_at):
+        self.key = key
+        self.value = value
+        self.weight = weight
+        self.expires_at = expires_at   # Timer reading after which the entry is stale, <None> for no expiry
+        self.bucket = None             # Node of the frequency bucket holding the entry (LFU only)
+
+
+
+class FrequencyBucket:
+    __slots__ = ('frequency', 'entries')
+
+    def __init__(self, frequency):
+        self.frequency = frequency
+        self.entries = AdvancedDoublyLinkedList()   # Most recently used entry first
+
+
+
+class Cache:
+    ''' Common part of the caches: key lookup, capacity by entry count and/or
+        by total weight, TTL expiry, eviction callback and statistics. The
+        eviction policy is defined by subclasses through the <_touch>,
+        <_attach>, <_detach> and <_victim> methods (the latter never picking
+        the node it is told to exclude).
+
+        <capacity>   -- maximum count of entries, <None> for no limit
+        <max_weight> -- maximum total weight of entries, <None> for no limit
+        <weigher>    -- function of (key, value) giving the weight of an entry,
+                        every entry weighs 1 if it is not given
+        <ttl>        -- default time to live of entries in seconds, <None> for
+                        entries that never expire
+        <on_evict>   -- function of (key, value) called for every entry that is
+                        evicted or expires
+        <timer>      -- function returning the current time in seconds '''
+
+    def __init__(self, capacity=None, max_weight=None, weigher=None, ttl=None, on_evict=None, timer=time.monotonic):
+        if capacity is not None and capacity < 0:
+            raise ValueError('capacity must be non-negative')
+
+        if max_weight is not None and max_weight < 0:
+            raise ValueError('max_weight must be non-negative')
+
+        self.capacity = capacity
+        self.max_weight = max_weight
+        self.weigher = weigher
+        self.ttl = ttl
+        self.on_evict = on_evict
+        self.timer = timer
+
+        self.entries = {}   # Key -> node holding the entry of that key
+        self.total_weight = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+
+    def __len__(self):
+        return len(self.entries)
+
+
+    def __contains__(self, key):
+        ''' Return <True> if <key> has an entry that has not expired yet. Does
+            not count as an access of the entry '''
+
+        node = self.entries.get(key)
+        return node is not None and not self._expired(node.data)
+
+
+    def get(self, key, default=None):
+        ''' Return the value cached for <key>, or <default> if there is none,
+            in O(1) time '''
+
+        node = self.entries.get(key)
+
+        if node is None:
+            self.misses += 1
+            return default
+
+        entry = node.data
+
+        if self._expired(entry):
+            self._expire(node)
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        self._touch(node)
+
+        return entry.value
+
+
+    def put(self, key, value, ttl=None):
+        ''' Cache <value> for <key> in O(1) time, evicting entries if the cache
+            grows over its capacity. <ttl> overrides the default time to live
+            of the cache for this entry. An entry that can never fit (heavier
+            than <max_weight>, or any entry if <capacity> is 0) is not cached
+            and no other entry is evicted for it, only an older entry of <key>
+            is removed '''
+
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = None if ttl is None else self.timer() + ttl
+        weight = 1 if self.weigher is None else self.weigher(key, value)
+        node = self.entries.get(key)
+
+        if self.capacity == 0 or (self.max_weight is not None and weight > self.max_weight):
+            if node is not None:
+                self._remove(node)
+
+            return
+
+        if node is None:
+            while self.entries and self._over_capacity(1, weight):
+                self._evict()   # Before attaching, so the new entry is never its own victim
+
+            self.entries[key] = self._attach(CacheEntry(key, value, weight, expires_at))
+
+        else:
+            entry = node.data
+            self.total_weight -= entry.weight
+            entry.value = value
+            entry.weight = weight
+            entry.expires_at = expires_at
+            self._touch(node)
+
+        self.total_weight += weight
+
+        while self._over_capacity():   # Only a heavier value of an existing entry gets here
+            self._evict(exclude=node)
+
+
+    def remove(self, key):
+        ''' Remove the entry of <key> and return its value in O(1) time '''
+
+        node = self.entries.get(key)
+
+        if node is None:
+            raise KeyError(key)
+
+        self._remove(node)
+        return node.data.value
+
+
+    def clear(self):
+        ''' Remove all entries without calling the eviction callback '''
+
+        for node in list(self.entries.values()):
+            self._remove(node)
+
+
+    def purge_expired(self):
+        ''' Remove all entries that have expired in O(n) time '''
+
+        for node in list(self.entries.values()):
+            if self._expired(node.data):
+                self._expire(node)
+
+
+    def stats(self):
+        ''' Return hit, miss, eviction and expiration counts and the hit rate '''
+
+        lookups = self.hits + self.misses
+
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'size': len(self.entries),
+            'total_weight': self.total_weight,
+        }
+
+
+    def _over_capacity(self, extra_count=0, extra_weight=0):
+        return ((self.capacity is not None and len(self.entries) + extra_count > self.capacity) or
+                (self.max_weight is not None and self.total_weight + extra_weight > self.max_weight))
+
+
+    def _evict(self, exclude=None):
+        victim = self._victim(exclude)
+        self._remove(victim)
+        self.evictions += 1
+
+        if self.on_evict is not None:
+            self.on_evict(victim.data.key, victim.data.value)
+
+
+    def _expired(self, entry):
+        return entry.expires_at is not None and self.timer() >= entry.expires_at
+
+
+    def _expire(self, node):
+        self._remove(node)
+        self.expirations += 1
+
+        if self.on_evict is not None:
+            self.on_evict(node.data.key, node.data.value)
+
+
+    def _remove(self, node):
+        del self.entries[node.data.key]
+        self.total_weight -= node.data.weight
+        self._detach(node)
+
+
+
+class LRUCache(Cache):
+    ''' Least Recently Used cache. Entries are kept in a doubly linked list in
+        the order of use, the most recently used first, and the cache keeps a
+        direct reference to the node of every entry, so a lookup, a move to
+        the front of the list and an eviction from its end all take O(1) time '''
+
+    def __init__(self, capacity=None, max_weight=None, weigher=None, ttl=None, on_evict=None, timer=time.monotonic):
+        super().__init__(capacity, max_weight, weigher, ttl, on_evict, timer)
+        self.order = AdvancedDoublyLinkedList()
+
+
+    def _touch(self, node):
+        self.order.move_to_beginning(node)
+
+
+    def _attach(self, entry):
+        return self.order.insert_at_beginning(entry)
+
+
+    def _detach(self, node):
+        self.order.remove_node(node)
+
+
+    def _victim(self, exclude=None):
+        victim = self.order.tail
+        return victim.prev if victim is exclude else victim
+
+
+
+class LFUCache(Cache):
+    ''' Least Frequently Used cache. Entries with the same use count share a
+        frequency bucket, and buckets are kept in a doubly linked list ordered
+        by the use count, so promoting an entry to the next bucket and finding
+        the eviction victim take O(1) time. Among the least frequently used
+        entries, the least recently used one is evicted first '''
+
+    def __init__(self, capacity=None, max_weight=None, weigher=None, ttl=None, on_evict=None, timer=time.monotonic):
+        super().__init__(capacity, max_weight, weigher, ttl, on_evict, timer)
+        self.buckets = AdvancedDoublyLinkedList()   # Lowest use count first
+
+
+    def _touch(self, node):
+        entry = node.data
+        bucket_node = entry.bucket
+        next_bucket_node = bucket_node.next
+        frequency = bucket_node.data.frequency + 1
+
+        if len(bucket_node.data.entries) == 1 and (next_bucket_node is None or next_bucket_node.data.frequency != frequency):
+            bucket_node.data.frequency = frequency   # Sole entry of its bucket, the bucket can move up with it
+            return
+
+        if next_bucket_node is None or next_bucket_node.data.frequency != frequency:
+            next_bucket_node = self.buckets.insert_after(bucket_node, FrequencyBucket(frequency))
+
+        bucket_node.data.entries.remove_node(node)
+
+        if len(bucket_node.data.entries) == 0:
+            self.buckets.remove_node(bucket_node)
+
+        entry.bucket = next_bucket_node
+        self.entries[entry.key] = next_bucket_node.data.entries.insert_at_beginning(entry)
+
+
+    def _attach(self, entry):
+        bucket_node = self.buckets.head
+
+        if bucket_node is None or bucket_node.data.frequency != 1:
+            bucket_node = self.buckets.insert_at_beginning(FrequencyBucket(1))
+
+        entry.bucket = bucket_node
+        return bucket_node.data.entries.insert_at_beginning(entry)
+
+
+    def _detach(self, node):
+        bucket_node = node.data.bucket
+        bucket_node.data.entries.remove_node(node)
+
+        if len(bucket_node.data.entries) == 0:
+            self.buckets.remove_node(bucket_node)
+
+
+    def _victim(self, exclude=None):
+        bucket_node = self.buckets.head
+        victim = bucket_node.data.entries.tail
+
+        if victim is exclude:   # Just touched, so it is the only entry of its bucket
+            victim = bucket_node.next.data.entries.tail
+
+        return victim
@@ -0,0 +1,578 @@
+import array
+
+from linked_lists import _pack_values, _unpack_buffer
+
+
+NIL = -1   # Link value standing for "no node"
+
+
+
+class CompactDoublyLinkedList:
+    ''' Implementation of the Doubly Linked List abstract data type (ADT) for
+        numeric payloads, stored as a "struct of arrays": the payloads and the
+        links of all nodes are kept in parallel typed arrays instead of one
+        Python object per node. A node is identified by its slot (an index into
+        the arrays), links hold slot numbers and slots of removed nodes are
+        reused through a free list.
+
+        <typecode>      -- <array> type code of the payloads, e.g. 'q' for
+                           64-bit integers or 'd' for floats
+        <link_typecode> -- <array> type code of the links, 'i' (32-bit) limits
+                           the list to 2**31-1 slots
+
+        While the list is compact (the n-th node of the list sits in slot n,
+        which holds after building it, sorting it or calling <compact>, and is
+        kept by appending to and removing from the end), positional access
+        takes O(1) time and the payloads form one contiguous buffer that can
+        be handed to vectorized code through <view> '''
+
+    def __init__(self, iterable=None, typecode='q', link_typecode='i'):
+        self.typecode = typecode
+        self.link_typecode = link_typecode
+
+        self.data = array.array(typecode)
+        self.next = array.array(link_typecode)
+        self.prev = array.array(link_typecode)
+        self.free_slots = array.array(link_typecode)   # Stack of slots available for reuse
+
+        self.head = NIL
+        self.tail = NIL
+        self.length = 0
+        self.is_sorted = False
+        self.is_compact = True
+
+        # Initialize a linked list to the elements of a given iterable object
+
+        if iterable is not None:
+            self.extend(iterable)
+
+
+    def __len__(self):
+        return self.length
+
+
+    def __iter__(self):
+        ''' Traverse throught the list one node at a time '''
+
+        if self.is_compact:
+            return iter(self.data)
+
+        return self._walk(self.head, self.next)
+
+
+    def __reversed__(self):
+        ''' Traverse throught the list from the end to the beginning (in a
+            reverse order) one node at a time '''
+
+        if self.is_compact:
+            return reversed(self.data)
+
+        return self._walk(self.tail, self.prev)
+
+
+    def __contains__(self, value):
+        ''' Return <True> if <value> is contained in at least one of the nodes
+            of linked list, otherwise return <False> '''
+
+        if self.is_compact:
+            return value in self.data
+
+        data = self.data
+        next_slots = self.next
+        slot = self.head
+
+        while slot != NIL:
+            if data[slot] == value:
+                return True
+
+            slot = next_slots[slot]
+
+        return False
+
+
+    def __getitem__(self, index):
+        ''' Get the value at given <index> of the list in O(1) time if the list
+            is compact, otherwise in O(n) time '''
+
+        return self.data[self._slot_at(self._normalize_index(index))]
+
+
+    def __setitem__(self, index, value):
+        ''' Replace the value at given <index> of the list in O(1) time if the
+            list is compact, otherwise in O(n) time '''
+
+        self.data[self._slot_at(self._normalize_index(index))] = value
+        self.is_sorted = False
+
+
+    def __reduce__(self):
+        ''' Pickle the list compacted, as one array of its values '''
+
+        return (self.__class__, (self.to_array(), self.typecode, self.link_typecode), {'is_sorted': self.is_sorted})
+
+
+    def insert_at_beginning(self, value):
+        ''' Insert <value> at the beginning of the list in O(1) time and return
+            the slot of the new node '''
+
+        slot = self._new_slot(value)
+        self._link(slot, NIL)
+        self.is_sorted = False
+
+        return slot
+
+
+    def insert_at_end(self, value):
+        ''' Insert <value> at the end of the list in O(1) time and return the
+            slot of the new node '''
+
+        slot = self._new_slot(value)
+        self._link(slot, self.tail)
+        self.is_sorted = False
+
+        return slot
+
+
+    def insert_at_index(self, index, value):
+        ''' Insert <value> at given <index> of the list in O(n) time, walking
+            from whichever end of the list is closer to <index>, and return the
+            slot of the new node '''
+
+        if not (isinstance(index, int)):
+            raise TypeError('list indices must be integers')
+
+        if not (0 <= index <= self.length):
+            raise IndexError('list index out of range')
+
+        if index == 0:
+            previous_slot = NIL
+
+        elif index == self.length:
+            previous_slot = self.tail
+
+        else:
+            previous_slot = self._slot_at(index-1)
+
+        slot = self._new_slot(value)
+        self._link(slot, previous_slot)
+        self.is_sorted = False
+
+        return slot
+
+
+    def insert_sorted(self, value):
+        ''' Insert <value> into the sorted list in the correct sorted position.
+            If the list is currently not sorted, sort it '''
+
+        if not self.is_sorted:
+            self.insert_at_end(value)
+            self.sort()
+            return
+
+        previous_slot = NIL
+        slot = self.head
+
+        while slot != NIL and self.data[slot] <= value:
+            previous_slot = slot
+            slot = self.next[slot]
+
+        self._link(self._new_slot(value), previous_slot)
+
+
+    def remove_at_beginning(self):
+        ''' Remove node from the beginning of the list and return its value in
+            O(1) time '''
+
+        if self.head == NIL:
+            raise IndexError('list index out of range')
+
+        return self.remove_node(self.head)
+
+
+    def remove_at_end(self):
+        ''' Remove node from the end of the list and return its value in O(1)
+            time '''
+
+        if self.tail == NIL:
+            raise IndexError('list index out of range')
+
+        return self.remove_node(self.tail)
+
+
+    def remove_at_index(self, index):
+        ''' Remove node at given <index> of the list and return its value in
+            O(n) time, walking from whichever end of the list is closer '''
+
+        if not (isinstance(index, int)):
+            raise TypeError('list indices must be integers')
+
+        if not (0 <= index < self.length):
+            raise IndexError('list index out of range')
+
+        return self.remove_node(self._slot_at(index))
+
+
+    def remove_by_value(self, value):
+        ''' Find a node by value and remove it '''
+
+        if self.is_compact:
+            try:
+                slot = self.data.index(value)
+
+            except ValueError:
+                raise ValueError('value not in list') from None
+
+            self.remove_node(slot)
+            return
+
+        slot = self.head
+
+        while slot != NIL:
+            if self.data[slot] == value:
+                self.remove_node(slot)
+                return
+
+            slot = self.next[slot]
+
+        raise ValueError('value not in list')
+
+
+    def extend(self, iterable):
+        ''' Insert all elements of <iterable> at the end of the list in O(k)
+            time. The values are copied into the payload array in one go '''
+
+        values = array.array(self.typecode, iterable)
+
+        if values:
+            self._append_slots(values, self.tail)
+            self.is_sorted = False
+
+
+    def extendleft(self, iterable):
+        ''' Insert all elements of <iterable> at the beginning of the list, one
+            after another, in O(k) time. As with <collections.deque>, the
+            elements end up in the reverse order '''
+
+        values = array.array(self.typecode, iterable)
+
+        if values:
+            values.reverse()
+            self._append_slots(values, NIL)
+            self.is_sorted = False
+
+
+    def reverse(self):
+        ''' Reverse the list in O(1) time by swapping the arrays of links '''
+
+        self.next, self.prev = self.prev, self.next
+        self.head, self.tail = self.tail, self.head
+        self.is_sorted = False
+        self.is_compact = self.is_compact and self.length <= 1
+
+
+    def delete(self):
+        ''' Delete all nodes of the list and release the arrays '''
+
+        self.data = array.array(self.typecode)
+        self.next = array.array(self.link_typecode)
+        self.prev = array.array(self.link_typecode)
+        self.free_slots = array.array(self.link_typecode)
+
+        self.head = NIL
+        self.tail = NIL
+        self.length = 0
+        self.is_sorted = False
+        self.is_compact = True
+
+
+    def sort(self, key=None, reverse=False):
+        ''' Sort the list in O(n log n) time. The payloads are sorted as one
+            array and written back in slot order, which also compacts the list '''
+
+        if self.is_sorted and key is None and not reverse:
+            return
+
+        self._rebuild(sorted(self, key=key, reverse=reverse))
+        self.is_sorted = key is None and not reverse
+
+
+    def compact(self):
+        ''' Move the nodes so that the n-th node of the list sits in slot n and
+            release the free slots, in O(n) time '''
+
+        if not self.is_compact:
+            is_sorted = self.is_sorted
+            self._rebuild(self)
+            self.is_sorted = is_sorted
+
+
+    def to_array(self):
+        ''' Return a new <array> with the values of the list in order '''
+
+        if self.is_compact:
+            return self.data[:]
+
+        return array.array(self.typecode, self)
+
+
+    def view(self):
+        ''' Compact the list and return a memoryview of its payloads in order,
+            without copying them, e.g. for <numpy.frombuffer>. The list can not
+            grow or shrink while the view is alive '''
+
+        self.compact()
+        return memoryview(self.data)
+
+
+    def to_bytes(self):
+        ''' Return the values of the list as a short header followed by the
+            packed values in the native byte order, the same format as
+            <AdvancedDoublyLinkedList.to_bytes> '''
+
+        return _pack_values(self.to_array(), self.typecode)
+
+
+    @classmethod
+    def from_buffer(cls, buffer, link_typecode='i'):
+        ''' Build a compact list from the output of <to_bytes> held by any
+            object supporting the buffer protocol. The payloads are copied
+            from the buffer as a block, not one value at a time '''
+
+        view = _unpack_buffer(buffer)
+        values = array.array(view.format)
+        values.frombytes(view.cast('B'))
+
+        new_list = cls(typecode=view.format, link_typecode=link_typecode)
+        new_list.extend(values)
+
+        return new_list
+
+
+    def node_at(self, index):
+        ''' Return the slot of the node at given <index> of the list '''
+
+        return self._slot_at(self._normalize_index(index))
+
+
+    def insert_after(self, slot, value):
+        ''' Insert <value> right after the node in <slot> (at the very beginning
+            of the list if <slot> is <NIL>) in O(1) time and return the slot of
+            the new node '''
+
+        new_slot = self._new_slot(value)
+        self._link(new_slot, slot)
+        self.is_sorted = False
+
+        return new_slot
+
+
+    def remove_node(self, slot):
+        ''' Remove the node in <slot> and return its value in O(1) time '''
+
+        value = self.data[slot]
+        self._unlink(slot)
+
+        if self.is_compact:   # Only the last slot can be removed from a compact list
+            self.data.pop()
+            self.next.pop()
+            self.prev.pop()
+
+        else:
+            self.free_slots.append(slot)
+
+        return value
+
+
+    def move_to_beginning(self, slot):
+        ''' Move the node in <slot> to the beginning of the list in O(1) time '''
+
+        if slot != self.head:
+            self._unlink(slot)
+            self._link(slot, NIL)
+            self.is_sorted = False
+            self.is_compact = False
+
+
+    def move_to_end(self, slot):
+        ''' Move the node in <slot> to the end of the list in O(1) time '''
+
+        if slot != self.tail:
+            self._unlink(slot)
+            self._link(slot, self.tail)
+            self.is_sorted = False
+            self.is_compact = False
+
+
+    def _walk(self, slot, links):
+        ''' Utility method generating the values from <slot> onwards, following
+            given array of <links> '''
+
+        data = self.data
+
+        while slot != NIL:
+            yield data[slot]
+            slot = links[slot]
+
+
+    def _normalize_index(self, index):
+        ''' Utility method validating <index> and converting a negative index
+            into the corresponding non-negative one '''
+
+        if not (isinstance(index, int)):
+            raise TypeError('list indices must be integers')
+
+        if index < 0:
+            index += self.length
+
+        if not (0 <= index < self.length):
+            raise IndexError('list index out of range')
+
+        return index
+
+
+    def _slot_at(self, index):
+        ''' Utility method locating the slot of the node at given valid
+            <index>, walking from whichever end of the list is closer to it '''
+
+        if self.is_compact:
+            return index
+
+        if index < self.length // 2:
+            slot = self.head
+            next_slots = self.next
+
+            for _ in range(index):
+                slot = next_slots[slot]
+
+        else:
+            slot = self.tail
+            previous_slots = self.prev
+
+            for _ in range(self.length - 1 - index):
+                slot = previous_slots[slot]
+
+        return slot
+
+
+    def _new_slot(self, value):
+        ''' Utility method storing <value> in a free slot, or a new one if none
+            is free, and returning the slot '''
+
+        if self.free_slots:
+            slot = self.free_slots.pop()
+            self.data[slot] = value
+
+        else:
+            slot = len(self.data)
+            self.data.append(value)
+            self.next.append(NIL)
+            self.prev.append(NIL)
+
+        return slot
+
+
+    def _append_slots(self, values, previous_slot):
+        ''' Utility method storing <values> in new consecutive slots, chained in
+            that order, and linking the chain right after <previous_slot> (at
+            the very beginning of the list if it is <NIL>) '''
+
+        start = len(self.data)
+        count = len(values)
+        end = start + count - 1
+
+        self.data.extend(values)
+        self.next.extend(range(start + 1, start + count + 1))
+        self.prev.extend(range(start - 1, end))
+
+        next_slot = self.head if previous_slot == NIL else self.next[previous_slot]
+
+        if previous_slot == NIL:
+            self.head = start
+
+        else:
+            self.next[previous_slot] = start
+
+        self.prev[start] = previous_slot
+        self.next[end] = next_slot
+
+        if next_slot == NIL:
+            self.tail = end
+
+        else:
+            self.prev[next_slot] = end
+
+        self.is_compact = self.is_compact and previous_slot == start - 1 and next_slot == NIL
+        self.length += count
+
+
+    def _rebuild(self, values):
+        ''' Utility method replacing the whole list with a compact one holding
+            <values> in order '''
+
+        data = array.array(self.typecode, values)
+        count = len(data)
+
+        self.delete()
+
+        if count:
+            self.data = data
+            self.next = array.array(self.link_typecode, range(1, count + 1))
+            self.prev = array.array(self.link_typecode, range(-1, count - 1))
+            self.next[-1] = NIL
+
+            self.head = 0
+            self.tail = count - 1
+            self.length = count
+
+
+    def _link(self, slot, previous_slot):
+        ''' Utility method linking the node in <slot> right after the node in
+            <previous_slot>, or at the very beginning of the list if
+            <previous_slot> is <NIL>, in O(1) time '''
+
+        if self.is_compact and (slot != self.length or previous_slot != self.tail):
+            self.is_compact = False
+
+        if previous_slot == NIL:
+            next_slot = self.head
+            self.head = slot
+
+        else:
+            next_slot = self.next[previous_slot]
+            self.next[previous_slot] = slot
+
+        self.prev[slot] = previous_slot
+        self.next[slot] = next_slot
+
+        if next_slot == NIL:
+            self.tail = slot
+
+        else:
+            self.prev[next_slot] = slot
+
+        self.length += 1
+
+
+    def _unlink(self, slot):
+        ''' Utility method detaching the node in <slot> from the list in O(1)
+            time. The slot itself is not released '''
+
+        if self.is_compact and slot != self.tail:
+            self.is_compact = False
+
+        previous_slot = self.prev[slot]
+        next_slot = self.next[slot]
+
+        if previous_slot == NIL:
+            self.head = next_slot
+
+        else:
+            self.next[previous_slot] = next_slot
+
+        if next_slot == NIL:
+            self.tail = previous_slot
+
+        else:
+            self.prev[next_slot] = previous_slot
+
+        self.length -= 1
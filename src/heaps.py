@@ -0,0 +1,310 @@
+import heapq
+import itertools
+
+
+
+class HeapEntry:
+    ''' Handle of an element of a <PriorityQueue>, returned by <push>. It stays
+        valid until the element leaves the queue and is what <decrease_key>
+        and <remove> take '''
+
+    __slots__ = ('priority', 'value', 'sort_key', 'index')
+
+    def __init__(self, priority, value, sort_key):
+        self.priority = priority
+        self.value = value
+        self.sort_key = sort_key   # What entries are ordered by, (priority, sequence number) in the stable mode
+        self.index = None   # Position in the heap array, <None> once the element has left the queue
+
+
+
+class PriorityQueue:
+    ''' Implementation of the Priority Queue abstract data type (ADT) as an
+        array-backed d-ary min-heap, <arity> being the count of children of
+        every node. A higher arity makes the heap shallower, so <push> and
+        <decrease_key> do fewer steps and <pop> does more comparisons per
+        step; 4 is usually faster than the binary heap in Python.
+
+        Every element has a priority, given to <push> or computed by <key>
+        (the element itself if <key> is <None>). Only priorities are compared,
+        never the elements. In the <stable> mode elements of equal priority
+        leave the queue in the order they were pushed, otherwise their order
+        is arbitrary. Every entry keeps its position in the array, so an
+        element can be found through its handle (<HeapEntry>) in O(1) time for
+        <decrease_key> and <remove> '''
+
+    def __init__(self, iterable=None, arity=4, key=None, stable=False):
+        if not (isinstance(arity, int)):
+            raise TypeError('arity must be an integer')
+
+        if arity < 2:
+            raise ValueError('arity must be at least 2')
+
+        self.arity = arity
+        self.key = key
+        self.stable = stable
+        self.entries = []
+        self.sequence = itertools.count()   # Push order, breaks ties in the stable mode
+
+        if iterable is not None:
+            self.extend(iterable)
+
+
+    def __len__(self):
+        return len(self.entries)
+
+
+    def is_empty(self):
+        return not self.entries
+
+
+    def push(self, value, priority=None):
+        ''' Add <value> with given <priority> (computed by <key> if <None>) in
+            O(log n) time and return its handle '''
+
+        entry = self._new_entry(value, priority)
+        entry.index = len(self.entries)
+        self.entries.append(entry)
+        self._sift_up(entry.index)
+
+        return entry
+
+
+    def extend(self, iterable):
+        ''' Add all elements of <iterable>, with priorities computed by <key>.
+            When they are at least as many as the elements already queued the
+            heap is rebuilt bottom-up (heapify) in O(n + k) time, otherwise
+            they are pushed one by one in O(k log n) time '''
+
+        entries = self.entries
+        new_entries = [self._new_entry(value, None) for value in iterable]
+        heapify = len(new_entries) >= len(entries)
+
+        for entry in new_entries:
+            entry.index = len(entries)
+            entries.append(entry)
+
+            if not heapify:
+                self._sift_up(entry.index)
+
+        if heapify:
+            for index in range((len(entries) - 2) // self.arity, -1, -1):
+                self._sift_down(index)
+
+
+    def peek(self):
+        ''' Get the element of the lowest priority without removing it in O(1)
+            time, <None> if the queue is empty '''
+
+        return self.entries[0].value if self.entries else None
+
+
+    def peek_entry(self):
+        ''' Get the handle of the element of the lowest priority, <None> if the
+            queue is empty '''
+
+        return self.entries[0] if self.entries else None
+
+
+    def pop(self):
+        ''' Remove and return the element of the lowest priority in O(log n)
+            time '''
+
+        if not self.entries:
+            raise IndexError('pop from empty priority queue')
+
+        return self._remove_at(0).value
+
+
+    def pushpop(self, value, priority=None):
+        ''' Push <value> and then pop the element of the lowest priority, in
+            one sift instead of two. If <value> would be popped right away the
+            heap is not touched at all '''
+
+        entry = self._new_entry(value, priority)
+        entries = self.entries
+
+        if not entries or not entries[0].sort_key < entry.sort_key:
+            return value
+
+        top = entries[0]
+        top.index = None
+        entry.index = 0
+        entries[0] = entry
+        self._sift_down(0)
+
+        return top.value
+
+
+    def replace(self, value, priority=None):
+        ''' Pop the element of the lowest priority and then push <value>, in
+            one sift instead of two, and return the popped element. Unlike
+            <pushpop>, the popped element may have a higher priority than
+            <value> '''
+
+        entries = self.entries
+
+        if not entries:
+            raise IndexError('replace in empty priority queue')
+
+        entry = self._new_entry(value, priority)
+        top = entries[0]
+        top.index = None
+        entry.index = 0
+        entries[0] = entry
+        self._sift_down(0)
+
+        return top.value
+
+
+    def decrease_key(self, entry, priority):
+        ''' Lower the priority of the element of handle <entry> to <priority>
+            in O(log n) time '''
+
+        self._check_entry(entry)
+
+        if priority > entry.priority:
+            raise ValueError('new priority is greater than the current one')
+
+        entry.priority = priority
+        entry.sort_key = (priority, entry.sort_key[1]) if self.stable else priority
+        self._sift_up(entry.index)
+
+
+    def remove(self, entry):
+        ''' Remove the element of handle <entry> from the queue in O(log n)
+            time and return it '''
+
+        self._check_entry(entry)
+
+        return self._remove_at(entry.index).value
+
+
+    def nsmallest(self, n):
+        ''' Return the <n> elements of the lowest priority, lowest first,
+            without removing them. Only the top of the heap is explored, which
+            takes O(n d log n) time however large the queue is '''
+
+        entries = self.entries
+        arity = self.arity
+        result = []
+        frontier = [(entries[0].sort_key, 0)] if entries and n > 0 else []   # Candidates, every one smaller than its subtree
+
+        while frontier and len(result) < n:
+            index = heapq.heappop(frontier)[1]
+            result.append(entries[index].value)
+
+            for child in range(arity * index + 1, min(arity * index + arity + 1, len(entries))):
+                heapq.heappush(frontier, (entries[child].sort_key, child))
+
+        return result
+
+
+    def nlargest(self, n):
+        ''' Return the <n> elements of the highest priority, highest first,
+            without removing them, in O(N log n) time '''
+
+        return [entry.value for entry in heapq.nlargest(n, self.entries, key=_sort_key_of)]
+
+
+    def _new_entry(self, value, priority):
+        if priority is None:
+            priority = value if self.key is None else self.key(value)
+
+        return HeapEntry(priority, value, (priority, next(self.sequence)) if self.stable else priority)
+
+
+    def _check_entry(self, entry):
+        index = entry.index
+
+        if index is None or index >= len(self.entries) or self.entries[index] is not entry:
+            raise ValueError('entry is not in the priority queue')
+
+
+    def _remove_at(self, index):
+        ''' Utility method removing the entry at <index> of the heap array, by
+            moving the last entry into its place, and returning it '''
+
+        entries = self.entries
+        entry = entries[index]
+        last_entry = entries.pop()
+        entry.index = None
+
+        if last_entry is not entry:
+            last_entry.index = index
+            entries[index] = last_entry
+
+            if index and last_entry.sort_key < entries[(index - 1) // self.arity].sort_key:
+                self._sift_up(index)
+
+            else:
+                self._sift_down(index)
+
+        return entry
+
+
+    def _sift_up(self, index):
+        ''' Utility method moving the entry at <index> up until its parent is
+            not greater, shifting the parents down instead of swapping '''
+
+        entries = self.entries
+        arity = self.arity
+        entry = entries[index]
+        sort_key = entry.sort_key
+
+        while index:
+            parent_index = (index - 1) // arity
+            parent = entries[parent_index]
+
+            if not sort_key < parent.sort_key:
+                break
+
+            entries[index] = parent
+            parent.index = index
+            index = parent_index
+
+        entries[index] = entry
+        entry.index = index
+
+
+    def _sift_down(self, index):
+        ''' Utility method moving the entry at <index> down until none of its
+            children is smaller, shifting the children up instead of swapping '''
+
+        entries = self.entries
+        arity = self.arity
+        length = len(entries)
+        entry = entries[index]
+        sort_key = entry.sort_key
+
+        while True:
+            first_child = arity * index + 1
+
+            if first_child >= length:
+                break
+
+            smallest_index = first_child
+            smallest_key = entries[first_child].sort_key
+
+            for child in range(first_child + 1, min(first_child + arity, length)):
+                child_key = entries[child].sort_key
+
+                if child_key < smallest_key:
+                    smallest_index = child
+                    smallest_key = child_key
+
+            if not smallest_key < sort_key:
+                break
+
+            child = entries[smallest_index]
+            entries[index] = child
+            child.index = index
+            index = smallest_index
+
+        entries[index] = entry
+        entry.index = index
+
+
+
+def _sort_key_of(entry):
+    return entry.sort_key
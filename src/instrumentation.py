@@ -0,0 +1,393 @@
+''' Opt-in instrumentation of the list and stack classes.
+
+    <instrument(target)> switches one list (or stack) object over to an
+    instrumented subclass of its class, which counts the calls of every
+    public method, the nodes traversed by each call, the comparisons and the
+    merge depth of every sort and the high-water mark of the length. The
+    classes themselves are never changed, so objects that are not
+    instrumented run exactly the same code as before and pay nothing.
+
+    Traversed nodes are counted by turning the <next> and <prev> links of the
+    node classes into counting properties while at least one object is
+    instrumented. That slows down link reads of all lists in the process
+    meanwhile, and makes the counts approximate when several threads use
+    instrumented lists at the same time. Lazy iteration (<__iter__>,
+    <__reversed__>) is counted as a call, its traversal is not.
+
+    Hooks passed to <instrument> are called with a <CallEvent> after every
+    call, e.g. to feed a metrics exporter '''
+
+import time
+from collections import namedtuple
+
+from linked_lists import DoublyLinkedNode, SinglyLinkedNode, SkipNode, UnrolledNode
+
+
+
+CallEvent = namedtuple('CallEvent', 'target method seconds traversed length comparisons merge_depth')
+
+COUNTED_LINKS = ((SinglyLinkedNode, 'next'), (DoublyLinkedNode, 'next'), (DoublyLinkedNode, 'prev'),
+                 (UnrolledNode, 'next'), (UnrolledNode, 'prev'), (SkipNode, 'next'), (SkipNode, 'down'))
+
+INSTRUMENTED_DUNDERS = ('__len__', '__iter__', '__reversed__', '__contains__', '__getitem__', '__setitem__')
+
+
+
+class Traversals:
+    ''' Nodes traversed by the calls of one method: total, maximum and a
+        histogram with power-of-two buckets (a call traversing 5 to 8 nodes
+        goes to bucket 8) '''
+
+    __slots__ = ('total', 'maximum', 'histogram')
+
+    def __init__(self):
+        self.total = 0
+        self.maximum = 0
+        self.histogram = {}
+
+
+    def add(self, traversed):
+        bucket = 1 << (traversed - 1).bit_length() if traversed else 0
+
+        self.total += traversed
+        self.maximum = max(self.maximum, traversed)
+        self.histogram[bucket] = self.histogram.get(bucket, 0) + 1
+
+
+
+class InstrumentationStats:
+    ''' Statistics collected for one instrumented object '''
+
+    def __init__(self, hooks=()):
+        self.hooks = list(hooks)
+        self.reset()
+
+
+    def reset(self):
+        self.calls = {}        # Method name -> count of calls
+        self.traversed = {}    # Method name -> <Traversals>
+        self.sorts = 0
+        self.comparisons = 0
+        self.max_merge_depth = 0
+        self.length_high_water = 0
+        self.merges = 0        # Merges of sorted runs so far, the merge depth of a sort is derived from it
+
+
+    def as_dict(self):
+        ''' Return the statistics as plain dictionaries, e.g. for JSON '''
+
+        return {
+            'calls': dict(self.calls),
+            'traversed': {method: {'total': traversals.total, 'maximum': traversals.maximum,
+                                   'histogram': dict(sorted(traversals.histogram.items()))}
+                          for method, traversals in self.traversed.items()},
+            'sorts': self.sorts,
+            'comparisons': self.comparisons,
+            'max_merge_depth': self.max_merge_depth,
+            'length_high_water': self.length_high_water,
+        }
+
+
+    def record(self, target, method, seconds, traversed, length, comparisons=None, merge_depth=None):
+        self.calls[method] = self.calls.get(method, 0) + 1
+
+        traversals = self.traversed.get(method)
+
+        if traversals is None:
+            traversals = self.traversed[method] = Traversals()
+
+        traversals.add(traversed)
+
+        if length > self.length_high_water:
+            self.length_high_water = length
+
+        for hook in self.hooks:
+            hook(CallEvent(target, method, seconds, traversed, length, comparisons, merge_depth))
+
+
+
+class LinkCounter:
+    __slots__ = ('count',)
+
+    def __init__(self):
+        self.count = 0
+
+
+
+class CountedKey:
+    ''' Sort key counting the comparisons made between keys '''
+
+    __slots__ = ('key', 'counter')
+
+    def __init__(self, key, counter):
+        self.key = key
+        self.counter = counter
+
+
+    def __lt__(self, other):
+        self.counter.count += 1
+        return self.key < other.key
+
+
+
+_links = LinkCounter()
+_original_links = {}         # (node class, link name) -> slot descriptor replaced by a counting property
+_instrumented_objects = 0
+_instrumented_classes = {}   # Class -> its instrumented subclass
+
+
+
+def instrument(target, hooks=()):
+    ''' Start collecting statistics of <target> and return its
+        <InstrumentationStats>. Calling it again for the same object only adds
+        <hooks> '''
+
+    stats = getattr(target, '_instrumentation', None)
+
+    if stats is not None:
+        stats.hooks.extend(hooks)
+        return stats
+
+    global _instrumented_objects
+
+    stats = InstrumentationStats(hooks)
+    target.__class__ = _instrumented_class(_original_class(target))   # Fails for some layouts, before any global state changes
+    target._instrumentation = stats
+
+    if _instrumented_objects == 0:
+        _count_links()
+
+    _instrumented_objects += 1
+
+    return stats
+
+
+def uninstrument(target):
+    ''' Stop collecting statistics of <target> and return the collected
+        <InstrumentationStats> '''
+
+    stats = getattr(target, '_instrumentation', None)
+
+    if stats is None:
+        raise ValueError('object is not instrumented')
+
+    global _instrumented_objects
+
+    target.__class__ = _original_class(target)
+    del target._instrumentation
+    _instrumented_objects -= 1
+
+    if _instrumented_objects == 0:
+        _restore_links()
+
+    return stats
+
+
+def stats(target):
+    ''' Return the <InstrumentationStats> of <target>, <None> if it is not
+        instrumented '''
+
+    return getattr(target, '_instrumentation', None)
+
+
+def _original_class(target):
+    return getattr(type(target), '_instrumented_from', type(target))
+
+
+def _count_links():
+    for node_class, name in COUNTED_LINKS:
+        link = node_class.__dict__[name]
+        _original_links[node_class, name] = link
+        setattr(node_class, name, property(_counting_reader(link), link.__set__))
+
+
+def _restore_links():
+    for (node_class, name), link in _original_links.items():
+        setattr(node_class, name, link)
+
+    _original_links.clear()
+
+
+def _counting_reader(link):
+    read = link.__get__
+
+    def counting_read(node):
+        _links.count += 1
+        return read(node)
+
+    return counting_read
+
+
+def _instrumented_class(cls):
+    ''' Utility function returning the subclass of <cls> whose public methods
+        record their calls, creating it on first use '''
+
+    instrumented = _instrumented_classes.get(cls)
+
+    if instrumented is not None:
+        return instrumented
+
+    namespace = {'_instrumentation': None,   # Objects created by the instrumented class itself (e.g. by <split_at>) are not instrumented
+                 '_instrumented_from': cls}
+    length_of = cls.__len__
+
+    for name in dir(cls):
+        if name.startswith('_') and name not in INSTRUMENTED_DUNDERS:
+            continue
+
+        defined = next((vars(base)[name] for base in cls.__mro__[:-1] if name in vars(base)), None)
+
+        if isinstance(defined, classmethod):   # Alternative constructors build lists of the original class
+            namespace[name] = staticmethod(getattr(cls, name))
+            continue
+
+        if not callable(defined) or isinstance(defined, (type, staticmethod)):
+            continue   # Not a method, a staticmethod, or inherited from <object>
+
+        method = getattr(cls, name)
+        namespace[name] = _sort_wrapper(method, length_of) if name == 'sort' else _wrapper(name, method, length_of)
+
+    if hasattr(cls, '_merge'):
+        namespace['_merge'] = _merge_wrapper(cls._merge)
+
+    if any('__reduce__' in vars(base) for base in cls.__mro__[:-1]):
+        namespace['__reduce__'] = _reduce_wrapper(cls)
+
+    instrumented = type(f'Instrumented{cls.__name__}', (cls,), namespace)
+    _instrumented_classes[cls] = instrumented
+
+    return instrumented
+
+
+def _wrapper(name, method, length_of):
+    def instrumented_method(self, *args, **kwargs):
+        stats = self._instrumentation
+
+        if stats is None:
+            return _original_results(method(self, *args, **kwargs))
+
+        links_before = _links.count
+        start = time.perf_counter()
+
+        try:
+            return _original_results(method(self, *args, **kwargs))
+
+        finally:
+            seconds = time.perf_counter() - start
+            stats.record(self, name, seconds, _links.count - links_before, length_of(self))
+
+    instrumented_method.__name__ = name
+    instrumented_method.__doc__ = method.__doc__
+
+    return instrumented_method
+
+
+def _original_results(result):
+    ''' Utility function switching the new lists returned by an instrumented
+        method (e.g. the parts made by <split_at>), which were built by the
+        instrumented class, back to the original class '''
+
+    for item in result if type(result) is tuple else (result,):
+        original_class = getattr(type(item), '_instrumented_from', None)
+
+        if original_class is not None and item._instrumentation is None:
+            item.__class__ = original_class
+
+    return result
+
+
+def _sort_wrapper(method, length_of):
+    ''' Utility function wrapping <sort> to count its comparisons without
+        changing the path it takes: a key given by the caller is wrapped in a
+        <CountedKey>, and without one the values of the nodes are wrapped for
+        the duration of the sort, so the merge sort still runs on the nodes
+        themselves rather than on a chain decorated with keys '''
+
+    def sort(self, key=None, reverse=False):
+        stats = self._instrumentation
+
+        if stats is None:
+            return method(self, key=key, reverse=reverse)
+
+        counter = LinkCounter()
+        counted_key = None
+        wrapped_nodes = None
+
+        if key is None and not reverse and getattr(self, 'is_sorted', False):
+            pass   # Nothing to sort, keep the early return of the class
+
+        elif key is not None:
+            counted_key = lambda value: CountedKey(key(value), counter)
+
+        elif hasattr(self, '_merge'):
+            wrapped_nodes = _wrap_values(self.head, counter)
+
+        else:   # Array based sorts compare the same with or without a key
+            counted_key = lambda value: CountedKey(value, counter)
+
+        links_before = _links.count
+        merges_before = stats.merges
+        start = time.perf_counter()
+
+        try:
+            method(self, key=counted_key, reverse=reverse)
+
+            if counted_key is not None and key is None and hasattr(self, 'is_sorted'):
+                self.is_sorted = not reverse   # Sorting by the counting key must not look like a keyed sort
+
+        finally:
+            seconds = time.perf_counter() - start
+            traversed = _links.count - links_before
+
+            if wrapped_nodes is not None:
+                for node in wrapped_nodes:
+                    node.data = node.data.key
+
+            merge_depth = (stats.merges - merges_before).bit_length()   # Bottom-up merging of r runs takes r-1 merges in ceil(log2(r)) passes
+
+            stats.sorts += 1
+            stats.comparisons += counter.count
+            stats.max_merge_depth = max(stats.max_merge_depth, merge_depth)
+            stats.record(self, 'sort', seconds, traversed, length_of(self), counter.count, merge_depth)
+
+    sort.__doc__ = method.__doc__
+
+    return sort
+
+
+def _wrap_values(head, counter):
+    ''' Utility function replacing the value of every node of the chain
+        starting at <head> with a <CountedKey> and returning the nodes, so
+        they can be unwrapped even if the sort fails halfway '''
+
+    nodes = []
+    current_node = head
+
+    while current_node is not None:
+        current_node.data = CountedKey(current_node.data, counter)
+        nodes.append(current_node)
+        current_node = current_node.next
+
+    return nodes
+
+
+def _merge_wrapper(method):
+    def _merge(self, *args, **kwargs):
+        if self._instrumentation is not None:
+            self._instrumentation.merges += 1
+
+        return method(self, *args, **kwargs)
+
+    return _merge
+
+
+def _reduce_wrapper(cls):
+    def __reduce__(self):
+        reduced = cls.__reduce__(self)   # Pickle under the original class, the instrumentation is not kept
+
+        if reduced[0] is type(self):
+            reduced = (cls,) + reduced[1:]
+
+        return reduced
+
+    return __reduce__
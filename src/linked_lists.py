@@ -1,3 +1,21 @@
+import array
+import bisect
+import itertools
+import os
+import random
+import struct
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+
+BUFFER_HEADER = struct.Struct('<2scBc3x')   # Magic, array type code, item size and byte order of <to_bytes> output
+BUFFER_MAGIC = b'LL'
+BYTE_ORDER = b'<' if sys.byteorder == 'little' else b'>'   # Byte order of the packed values, as in <struct> formats
+
+PARALLEL_SORT_THRESHOLD = 100_000   # Lists shorter than that are sorted serially by <parallel_sort>
+
+
+
 class SinglyLinkedNode:
     __slots__ = ('data', 'next')
 
@@ -17,6 +35,462 @@ class DoublyLinkedNode:
 
 
 
+class KeyedNode(DoublyLinkedNode):
+    __slots__ = ('node',)
+
+    def __init__(self, key, node):
+        self.data = key     # Sort key of the decorated node
+        self.prev = None
+        self.next = None
+        self.node = node
+
+
+
+class SkipNode:
+    __slots__ = ('node', 'next', 'prev', 'down', 'up', 'span')
+
+    def __init__(self, node, span=0):
+        self.node = node   # Node of the underlying linked list this skip node stands for
+        self.next = None
+        self.prev = None   # Previous skip node of the lane, the last one for a sentinel
+        self.down = None
+        self.up = None
+        self.span = span   # Count of nodes between this skip node and the next one in the lane
+
+
+
+class UnrolledNode:
+    __slots__ = ('items', 'prev', 'next')
+
+    def __init__(self, items=None):
+        self.items = [] if items is None else items
+        self.prev = None
+        self.next = None
+
+
+
+class NodePool:
+    ''' Bounded pool of free nodes of one node class. Linked lists sharing the
+        pool take their new nodes from it and give their removed nodes back,
+        which saves allocating and garbage collecting a node for every insert
+        and remove under high churn. A node given back has its references
+        cleared, so the pool never keeps payloads alive. Node references held
+        outside of a list (e.g. handles returned by the insert methods) must
+        not be used after the node is removed, since it may be reused '''
+
+    def __init__(self, node_class=DoublyLinkedNode, max_size=1024):
+        if max_size < 0:
+            raise ValueError('max_size must be non-negative')
+
+        self.node_class = node_class
+        self.max_size = max_size
+        self.free_nodes = []
+        self.has_prev = 'prev' in node_class.__slots__
+
+        self.hits = 0        # Nodes handed out from the pool
+        self.misses = 0      # Nodes allocated because the pool was empty
+        self.releases = 0    # Nodes taken back into the pool
+        self.discards = 0    # Nodes left to the garbage collector because the pool was full
+
+
+    def __len__(self):
+        return len(self.free_nodes)
+
+
+    def acquire(self, value):
+        ''' Return a node holding <value>, reusing a free node if there is one '''
+
+        if self.free_nodes:
+            node = self.free_nodes.pop()
+            node.data = value
+            self.hits += 1
+            return node
+
+        self.misses += 1
+        return self.node_class(value)
+
+
+    def release(self, node):
+        ''' Take back a node that has been removed from its list '''
+
+        node.data = None
+        node.next = None
+
+        if self.has_prev:
+            node.prev = None
+
+        if len(self.free_nodes) < self.max_size:
+            self.free_nodes.append(node)
+            self.releases += 1
+
+        else:
+            self.discards += 1
+
+
+    def release_chain(self, head):
+        ''' Take back the chain of nodes starting at <head>, as many of them as
+            the pool has room for '''
+
+        current_node = head
+
+        while current_node is not None and len(self.free_nodes) < self.max_size:
+            next_node = current_node.next
+            self.release(current_node)
+            current_node = next_node
+
+
+    def stats(self):
+        ''' Return acquire and release counts and the hit rate of the pool '''
+
+        acquires = self.hits + self.misses
+
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'releases': self.releases,
+            'discards': self.discards,
+            'hit_rate': self.hits / acquires if acquires else 0.0,
+            'size': len(self.free_nodes),
+        }
+
+
+
+class LinkedListView:
+    ''' Lazy view of a slice of a linked list, returned by <__getitem__> of
+        the list classes when given a slice. The view holds only the list and
+        a <range> of indices, no nodes are copied: iteration locates the first
+        node of the slice (from whichever end of the list is closer for a
+        doubly linked list) and then steps through the links. A negative step
+        follows the <prev> links of a doubly linked list, while a singly
+        linked list is walked forward once and the nodes of the slice are
+        yielded in reverse. Slicing a view returns a view of the same list.
+
+        Values replaced through <__setitem__> show up in the view. Any change
+        of the structure of the list (insertion, removal, sort, reverse ...)
+        invalidates the view, and using it afterwards raises <RuntimeError> '''
+
+    __slots__ = ('source', 'indices', 'modifications')
+
+    def __init__(self, source, indices):
+        self.source = source
+        self.indices = indices   # <range> of the indices of the list the view stands for
+        self.modifications = source.modifications
+
+
+    def __len__(self):
+        self._check()
+        return len(self.indices)
+
+
+    def __iter__(self):
+        return self._walk(self.indices)
+
+
+    def __reversed__(self):
+        return self._walk(self.indices[::-1])
+
+
+    def __getitem__(self, index):
+        ''' Get the value at given <index> of the view, or a view of a slice of
+            the view '''
+
+        self._check()
+
+        if isinstance(index, slice):
+            return LinkedListView(self.source, self.indices[index])
+
+        if not (isinstance(index, int)):
+            raise TypeError('view indices must be integers or slices')
+
+        return self.source._node_at(self.indices[index]).data
+
+
+    def __eq__(self, other):
+        if isinstance(other, (LinkedListView, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+        return NotImplemented
+
+
+    def _check(self):
+        if self.modifications != self.source.modifications:
+            raise RuntimeError('linked list changed after the view was taken')
+
+
+    def _walk(self, indices):
+        ''' Utility method generating the values at <indices> of the list,
+            checking before every step that the list has not changed '''
+
+        self._check()
+
+        if not indices:
+            return
+
+        step = indices.step
+
+        if step > 0 or hasattr(self.source.head, 'prev'):
+            link = 'next' if step > 0 else 'prev'
+            current_node = self.source._node_at(indices[0])
+
+            for _ in range(len(indices) - 1):
+                yield current_node.data
+                self._check()
+
+                for _ in range(abs(step)):
+                    current_node = getattr(current_node, link)
+
+            yield current_node.data
+
+        else:   # Singly linked nodes, collect the nodes of the slice walking forward
+            current_node = self.source._node_at(indices[-1])
+            nodes = [current_node]
+
+            for _ in range(len(indices) - 1):
+                for _ in range(-step):
+                    current_node = current_node.next
+
+                nodes.append(current_node)
+
+            for current_node in reversed(nodes):
+                yield current_node.data
+                self._check()
+
+
+
+class SinglyLinkedCursor:
+    ''' Cursor over an <AdvancedSinglyLinkedList>, returned by its <cursor>
+        method. The cursor stands at a node of the list, or past its end, and
+        edits the list around that position in O(1) time through the linking
+        hooks of the list, so <head>, <tail> and <length> stay consistent.
+        The node before the current one is tracked as well, which makes
+        removal and insertion in front of the current node O(1) on a singly
+        linked list. Moving backward needs a doubly linked list.
+
+        Changing the structure of the list other than through the cursor
+        invalidates the cursor, and using it afterwards raises
+        <RuntimeError> '''
+
+    __slots__ = ('source', 'node', 'previous_node', 'index', 'modifications')
+
+    def __init__(self, source, node, previous_node, index):
+        self.source = source
+        self.node = node   # Current node, <None> past the end of the list
+        self.previous_node = previous_node
+        self.index = index
+        self.modifications = source.modifications
+
+
+    def at_end(self):
+        ''' Return <True> if the cursor stands past the end of the list '''
+
+        self._check()
+        return self.node is None
+
+
+    @property
+    def value(self):
+        ''' <data> value of the current node '''
+
+        return self._current().data
+
+
+    def next(self):
+        ''' Move to the next node (past the end after the last one) in O(1)
+            time '''
+
+        current_node = self._current()
+        self.previous_node = current_node
+        self.node = current_node.next
+        self.index += 1
+
+
+    def insert_before(self, value):
+        ''' Insert <value> in front of the current node (at the end of the list
+            if the cursor is past the end) in O(1) time. The cursor stays at
+            the current node '''
+
+        self._check()
+        new_node = self.source._new_node(value)
+        self.source._link(new_node, self.previous_node)
+        self.source.is_sorted = False
+        self._moved_to(self.node, new_node, self.index + 1)
+
+
+    def insert_after(self, value):
+        ''' Insert <value> right after the current node in O(1) time. The
+            cursor stays at the current node '''
+
+        current_node = self._current()
+        self.source._link(self.source._new_node(value), current_node)
+        self.source.is_sorted = False
+        self.modifications = self.source.modifications
+
+
+    def remove_current(self):
+        ''' Remove the current node and return its <data> value in O(1) time.
+            The cursor moves to the next node '''
+
+        current_node = self._current()
+        next_node = current_node.next
+        value = current_node.data
+        self.source._unlink(current_node, self.previous_node)
+
+        if self.source.pool is not None:
+            self.source.pool.release(current_node)
+
+        self._moved_to(next_node, self.previous_node, self.index)
+
+        return value
+
+
+    def replace(self, value):
+        ''' Replace <data> value of the current node and return the old one '''
+
+        current_node = self._current()
+        old_value = current_node.data
+        self.source._replace(current_node, value)
+
+        return old_value
+
+
+    def _moved_to(self, node, previous_node, index):
+        self.node = node
+        self.previous_node = previous_node
+        self.index = index
+        self.modifications = self.source.modifications
+
+
+    def _check(self):
+        if self.modifications != self.source.modifications:
+            raise RuntimeError('linked list changed outside the cursor')
+
+
+    def _current(self):
+        self._check()
+
+        if self.node is None:
+            raise IndexError('cursor is past the end of the list')
+
+        return self.node
+
+
+
+class DoublyLinkedCursor:
+    ''' Cursor over an <AdvancedDoublyLinkedList>, returned by its <cursor>
+        method. The cursor stands at a node of the list, or past its end, can
+        move both ways and edits the list around that position in O(1) time
+        through the linking hooks of the list, so <head>, <tail> and <length>
+        stay consistent.
+
+        Changing the structure of the list other than through the cursor
+        invalidates the cursor, and using it afterwards raises
+        <RuntimeError> '''
+
+    __slots__ = ('source', 'node', 'index', 'modifications')
+
+    def __init__(self, source, node, index):
+        self.source = source
+        self.node = node   # Current node, <None> past the end of the list
+        self.index = index
+        self.modifications = source.modifications
+
+
+    def at_end(self):
+        ''' Return <True> if the cursor stands past the end of the list '''
+
+        self._check()
+        return self.node is None
+
+
+    @property
+    def value(self):
+        ''' <data> value of the current node '''
+
+        return self._current().data
+
+
+    def next(self):
+        ''' Move to the next node (past the end after the last one) in O(1)
+            time '''
+
+        self.node = self._current().next
+        self.index += 1
+
+
+    def prev(self):
+        ''' Move to the previous node (to the last one from past the end) in
+            O(1) time '''
+
+        self._check()
+        previous_node = self.source.tail if self.node is None else self.node.prev
+
+        if previous_node is None:
+            raise IndexError('cursor is at the beginning of the list')
+
+        self.node = previous_node
+        self.index -= 1
+
+
+    def insert_before(self, value):
+        ''' Insert <value> in front of the current node (at the end of the list
+            if the cursor is past the end) in O(1) time. The cursor stays at
+            the current node '''
+
+        self._check()
+        previous_node = self.source.tail if self.node is None else self.node.prev
+        self.source._link(self.source._new_node(value), previous_node)
+        self.source.is_sorted = False
+        self.index += 1
+        self.modifications = self.source.modifications
+
+
+    def insert_after(self, value):
+        ''' Insert <value> right after the current node in O(1) time. The
+            cursor stays at the current node '''
+
+        current_node = self._current()
+        self.source._link(self.source._new_node(value), current_node)
+        self.source.is_sorted = False
+        self.modifications = self.source.modifications
+
+
+    def remove_current(self):
+        ''' Remove the current node and return its <data> value in O(1) time.
+            The cursor moves to the next node '''
+
+        current_node = self._current()
+        self.node = current_node.next
+        value = self.source.remove_node(current_node)
+        self.modifications = self.source.modifications
+
+        return value
+
+
+    def replace(self, value):
+        ''' Replace <data> value of the current node and return the old one '''
+
+        current_node = self._current()
+        old_value = current_node.data
+        self.source._replace(current_node, value)
+
+        return old_value
+
+
+    def _check(self):
+        if self.modifications != self.source.modifications:
+            raise RuntimeError('linked list changed outside the cursor')
+
+
+    def _current(self):
+        self._check()
+
+        if self.node is None:
+            raise IndexError('cursor is past the end of the list')
+
+        return self.node
+
+
+
 class BasicSinglyLinkedList:
     ''' Minimal implementation of the Singly Linked List abstract data type
         (ADT) showing the main concepts of this ADT '''
@@ -33,6 +507,25 @@ class BasicSinglyLinkedList:
         self.head = new_node
 
 
+    def __reduce__(self):
+        ''' Pickle the list as a flat list of its values, so that pickling
+            does not recurse through the chain of nodes '''
+
+        values = []
+        current_node = self.head
+
+        while current_node is not None:
+            values.append(current_node.data)
+            current_node = current_node.next
+
+        return (self.__class__, (), values)
+
+
+    def __setstate__(self, values):
+        for value in reversed(values):
+            self.add(value)
+
+
     def remove(self, value):
         ''' Find a node by its data value and remove it in O(n) time '''
 
@@ -70,11 +563,23 @@ class BasicSinglyLinkedList:
 
 
 class AdvancedSinglyLinkedList:
-    def __init__(self):
+    def __init__(self, iterable=None, pool=None):
         self.head = None
         self.tail = None   # Keeping track of tail enables insertion of nodes at the end of list in O(1) time
         self.length = 0
         self.is_sorted = False
+        self.modifications = 0   # Count of structural changes, a view taken before a change is no longer valid
+
+        if pool is not None and pool.node_class is not SinglyLinkedNode:
+            raise ValueError('pool must hold SinglyLinkedNode nodes')
+
+        self.pool = pool
+        self._new_node = SinglyLinkedNode if pool is None else pool.acquire
+
+        # Initialize a linked list to the elements of a given iterable object
+
+        if iterable is not None:
+            self.extend(iterable)
 
 
     def __len__(self):
@@ -91,16 +596,46 @@ class AdvancedSinglyLinkedList:
             current_node = current_node.next
 
 
+    def __reduce__(self):
+        ''' Pickle the list as a flat list of its values, which is restored
+            through the bulk building path of the constructor. A node pool is
+            not pickled '''
+
+        return (self.__class__, (list(self),), {'is_sorted': self.is_sorted})
+
+
+    def __getitem__(self, index):
+        ''' Get <data> value of the node at given <index> of the list in O(n)
+            time (O(1) time for the last node). Given a slice, return a lazy
+            <LinkedListView> of it in O(1) time '''
+
+        if isinstance(index, slice):
+            return LinkedListView(self, range(*index.indices(self.length)))
+
+        if not (isinstance(index, int)):
+            raise TypeError('list indices must be integers')
+
+        if index < 0:
+            index += self.length
+
+        if not (0 <= index < self.length):
+            raise IndexError('list index out of range')
+
+        return self._node_at(index).data
+
+
     def insert_at_beginning(self, value):
         ''' Insert <value> at the beginning of the list in O(1) time '''
 
-        self.insert_at_index(0, value)
+        self._link(self._new_node(value), None)
+        self.is_sorted = False
 
 
     def insert_at_end(self, value):
         ''' Insert <value> at the end of the list in O(1) time '''
 
-        self.insert_at_index(self.length, value)
+        self._link(self._new_node(value), self.tail)
+        self.is_sorted = False
 
 
     def insert_at_index(self, index, value):
@@ -112,31 +647,21 @@ class AdvancedSinglyLinkedList:
         if not (0 <= index <= self.length):
             raise IndexError('list index out of range')
 
-        new_node = SinglyLinkedNode(value)
-
         if index == 0:
-            new_node.next = self.head
-            self.head = new_node
-
-            if self.length == 0:   # In case of empty list
-                self.tail = new_node
+            previous_node = None
 
         elif index == self.length:
-            self.tail.next = new_node
-            self.tail = new_node
+            previous_node = self.tail
 
         else:
-            current_node = self.head
+            previous_node = self.head
             position = 1
 
             while position < index:   # Traverse to the correct position in the list
-                current_node = current_node.next
+                previous_node = previous_node.next
                 position += 1
 
-            new_node.next = current_node.next
-            current_node.next = new_node
-
-        self.length += 1
+        self._link(self._new_node(value), previous_node)
         self.is_sorted = False
 
 
@@ -145,35 +670,23 @@ class AdvancedSinglyLinkedList:
             If the list is currently not sorted, sort it '''
         
         if self.is_sorted:
-            new_node = SinglyLinkedNode(value)
             previous_node = None
             current_node = self.head
 
             while current_node is not None:
-                if current_node.data <= new_node.data:
+                if current_node.data <= value:
                     previous_node = current_node
                     current_node = current_node.next
 
                 else:
                     break
 
-            if previous_node is None:   # New node is being inserted at the very beginning of the list
-                self.head = new_node
-
-            else:
-                previous_node.next = new_node
-
-            new_node.next = current_node
-
-            if new_node.next is None:   # New node is being inserted at the very end of the list
-                self.tail = new_node
+            self._link(self._new_node(value), previous_node)
 
         else:
             self.insert_at_beginning(value)
             self.sort()
 
-        self.length += 1
-
 
     def remove(self, value):
         ''' Find a node by data value and remove it '''
@@ -183,19 +696,11 @@ class AdvancedSinglyLinkedList:
 
         while current_node is not None:
             if current_node.data == value:
-                if previous_node is None:
-                    self.head = current_node.next   # Removing the very first element of the list ...
-
-                    if current_node.next is None:   # ... which happens to be the only element in the list
-                        self.tail = None
-
-                else:
-                    previous_node.next = current_node.next
+                self._unlink(current_node, previous_node)
 
-                    if current_node.next is None:   # Removing the very last element of the list
-                        self.tail = previous_node
+                if self.pool is not None:
+                    self.pool.release(current_node)
 
-                self.length -= 1
                 return
 
             previous_node = current_node
@@ -204,135 +709,2657 @@ class AdvancedSinglyLinkedList:
         raise ValueError('value not in list')
 
 
-    def reverse(self):
-        ''' Reverse the list in O(n) time '''
-        
+    def remove_if(self, predicate):
+        ''' Remove all nodes whose <data> value satisfies <predicate> in one
+            pass, in O(n) time, and return the count of removed nodes '''
+
+        removed = 0
         previous_node = None
         current_node = self.head
-        next_node = self.head
-        self.tail = self.head
 
         while current_node is not None:
             next_node = current_node.next
-            current_node.next = previous_node
-            previous_node = current_node
+
+            if predicate(current_node.data):
+                self._unlink(current_node, previous_node)
+                removed += 1
+
+                if self.pool is not None:
+                    self.pool.release(current_node)
+
+            else:
+                previous_node = current_node
+
             current_node = next_node
 
-        self.head = previous_node
-        self.is_sorted = False
+        return removed
 
 
-    def sort(self, reverse=False):
-        ''' Sort the list using recursive merge sort algorithm '''
-        
-        if not self.is_sorted:
-            self.head = self._split(self.head, self.length)
-            self.is_sorted = True
+    def remove_all(self, values):
+        ''' Remove all nodes holding any of <values> in one pass and return
+            the count of removed nodes. Hashable <values> are looked up in a
+            set, so this takes O(n + k) time '''
 
-        if reverse:
-            self.reverse()
-            
-        else:   # Set the tail reference of the list as the final step in sorting procedure
-            self.tail = None
+        return self.remove_if(_membership(values))
+
+
+    def cursor(self, index=0):
+        ''' Return a <SinglyLinkedCursor> standing at the node at given <index>
+            (past the end if <index> is the length of the list), found in O(n)
+            time '''
+
+        if not (isinstance(index, int)):
+            raise TypeError('list indices must be integers')
+
+        if not (0 <= index <= self.length):
+            raise IndexError('list index out of range')
+
+        previous_node = None if index == 0 else self._node_at(index - 1)
+        node = self.head if previous_node is None else previous_node.next
+
+        return SinglyLinkedCursor(self, node, previous_node, index)
+
+
+    def extend(self, iterable):
+        ''' Insert all elements of <iterable> at the end of the list in O(k)
+            time. The new nodes are built into a separate chain first, which is
+            then attached to the list as a whole '''
+
+        head, tail, count = self._build_chain(iterable)
+
+        if count:
+            self._splice_chain(head, tail, count, self.tail)
+            self.is_sorted = False
+
+
+    def extendleft(self, iterable):
+        ''' Insert all elements of <iterable> at the beginning of the list, one
+            after another, in O(k) time. As with <collections.deque>, the
+            elements end up in the reverse order '''
+
+        head, tail, count = self._build_chain(iterable, reverse=True)
+
+        if count:
+            self._splice_chain(head, tail, count, None)
+            self.is_sorted = False
+
+
+    def splice(self, other):
+        ''' Move all nodes of <other> list to the end of this list in O(1) time.
+            The <other> list is left empty '''
+
+        if not isinstance(other, AdvancedSinglyLinkedList):
+            raise TypeError('can only splice a singly linked list')
+
+        if other is self:
+            raise ValueError('cannot splice a list into itself')
+
+        if other.length == 0:
+            return
+
+        is_sorted = other.is_sorted and (self.length == 0 or (self.is_sorted and not other.head.data < self.tail.data))
+        head, tail, count = other.head, other.tail, other.length
+        other._clear()
+
+        self._splice_chain(head, tail, count, self.tail)
+        self.is_sorted = is_sorted
+
+
+    @classmethod
+    def concat(cls, *lists):
+        ''' Return a new list made of all nodes of given <lists>, one list
+            after another, in O(k) time. The given lists are left empty '''
+
+        result = cls()
+
+        for other in lists:
+            result.splice(other)
+
+        return result
+
+
+    @classmethod
+    def merge_sorted(cls, *lists):
+        ''' Return a new sorted list made of all nodes of given <lists> in
+            O(n log k) time, merging them pairwise with the merge step of
+            <sort>. Lists that are not sorted are sorted first, lists whose
+            values do not overlap are joined in O(1) time. On ties nodes of
+            an earlier list go first. The given lists are left empty '''
+
+        result = cls()
+        runs = []
+        count = 0
+
+        for other in lists:
+            if not isinstance(other, AdvancedSinglyLinkedList):
+                raise TypeError('can only merge singly linked lists')
+
+            if other.length:
+                other.sort()
+                runs.append((other.head, other.tail))
+                count += other.length
+                other._clear()
+
+        if runs:
+            head, tail = result._merge_runs(runs)
+            result._splice_chain(head, tail, count, None)
+
+        result.is_sorted = True
+
+        return result
+
+
+    def union(self, other, consume=False):
+        ''' Return a new sorted list holding every value found in this list or
+            in <other> list once, in O(n + m) time. Values are equal when
+            neither is less than the other. The new list takes the node pool
+            of this list and both lists are left unchanged, a list that is not
+            sorted is sorted in a temporary copy. With <consume> set the kept
+            nodes are moved into the new list instead of being copied, so no
+            node is allocated: both lists are sorted, then left empty, and
+            every dropped node goes back to the pool of the list it came from '''
+
+        return _sorted_set_operation(self, other, AdvancedSinglyLinkedList, True, True, True, consume)
+
+
+    def intersection(self, other, consume=False):
+        ''' Return a new sorted list holding every value found both in this
+            list and in <other> list once, in O(n + m) time. See <union> for
+            <consume> '''
+
+        return _sorted_set_operation(self, other, AdvancedSinglyLinkedList, False, True, False, consume)
+
+
+    def difference(self, other, consume=False):
+        ''' Return a new sorted list holding every value of this list that is
+            not found in <other> list once, in O(n + m) time. See <union> for
+            <consume> '''
+
+        return _sorted_set_operation(self, other, AdvancedSinglyLinkedList, True, False, False, consume)
+
+
+    def dedupe(self):
+        ''' Sort the list if it is not sorted, then keep only the first node
+            holding each value, in O(n) time. Return the count of removed
+            nodes '''
+
+        self.sort()
+        length = self.length
+        head = self.head
+        self._clear()
+
+        for current_node in _sorted_set_walk(head, None, True, False, False, None if self.pool is None else self.pool.release):
+            self._link(current_node, self.tail)
+
+        self.is_sorted = True
+
+        return length - self.length
+
+
+    def to_bytes(self, typecode='q'):
+        ''' Return the values of the list, which must all fit the <array> type
+            <typecode>, as a short header followed by the packed values in the
+            native byte order, which the header records. <from_buffer> reads
+            it back on a host of either byte order '''
+
+        return _pack_values(self, typecode)
+
+
+    @classmethod
+    def from_buffer(cls, buffer, pool=None):
+        ''' Build a list from the output of <to_bytes> held by any object
+            supporting the buffer protocol (<bytes>, <bytearray>, <mmap>,
+            shared memory ...). The values are read straight from the buffer,
+            without copying it first '''
+
+        return cls(_unpack_buffer(buffer), pool)
+
+
+    def split_at(self, index):
+        ''' Split the list before given <index> and return the two parts as
+            new lists in O(n) time. The nodes are moved, not copied, so this
+            list is left empty and the new lists share its node pool '''
+
+        if not (isinstance(index, int)):
+            raise TypeError('list indices must be integers')
+
+        if not (0 <= index <= self.length):
+            raise IndexError('list index out of range')
+
+        left = type(self)(pool=self.pool)
+        right = type(self)(pool=self.pool)
+
+        head, tail, length, is_sorted = self.head, self.tail, self.length, self.is_sorted
+        last_left_node = None
+
+        if index == length:
+            last_left_node = tail
+
+        elif index > 0:
+            last_left_node = head
+
+            for _ in range(index-1):
+                last_left_node = last_left_node.next
+
+        self._clear()
+
+        if last_left_node is not None:
+            first_right_node = last_left_node.next
+            last_left_node.next = None
+            left._splice_chain(head, last_left_node, index, None)
+
+        else:
+            first_right_node = head
+
+        if first_right_node is not None:
+            right._splice_chain(first_right_node, tail, length - index, None)
+
+        left.is_sorted = is_sorted
+        right.is_sorted = is_sorted
+
+        return left, right
+
+
+    def delete(self):
+        ''' Delete all nodes of the list in O(1) time by setting head and tail
+            references to <None>. With a node pool, the nodes are first given
+            back to the pool, as many as it has room for '''
+
+        if self.pool is not None:
+            self.pool.release_chain(self.head)
+
+        self._clear()
+
+
+    def _clear(self):
+        ''' Utility method emptying the list without touching its nodes '''
+
+        self.head = None
+        self.tail = None
+        self.length = 0
+        self.is_sorted = False
+        self.modifications += 1
+
+
+    def reverse(self):
+        ''' Reverse the list in O(n) time '''
+        
+        previous_node = None
+        current_node = self.head
+        next_node = self.head
+        self.tail = self.head
+
+        while current_node is not None:
+            next_node = current_node.next
+            current_node.next = previous_node
+            previous_node = current_node
+            current_node = next_node
+
+        self.head = previous_node
+        self.is_sorted = False
+        self.modifications += 1
+
+
+    def sort(self, key=None, reverse=False):
+        ''' Sort the list using iterative natural merge sort algorithm. Runs of
+            nodes that are already in order (or in strictly reverse order) are
+            detected first and then merged bottom-up, so an already sorted or
+            nearly sorted list is sorted in close to O(n) time. The sort is
+            stable, also when <reverse> is set. With <key> given, the key of
+            every node is computed only once '''
+
+        if self.is_sorted and key is None and not reverse:
+            return
+
+        self.modifications += 1
+
+        if self.length > 1:
+            if key is None:
+                self.head, self.tail = self._merge_sort(self.head, reverse)
+
+            else:   # Sort a chain of nodes decorated with keys, then relink the nodes in the same order
+                keyed_head = None
+                keyed_tail = None
+                current_node = self.head
+
+                while current_node is not None:
+                    keyed_node = KeyedNode(key(current_node.data), current_node)
+
+                    if keyed_head is None:
+                        keyed_head = keyed_node
+
+                    else:
+                        keyed_tail.next = keyed_node
+
+                    keyed_tail = keyed_node
+                    current_node = current_node.next
+
+                keyed_node = self._merge_sort(keyed_head, reverse)[0]
+                previous_node = None
+
+                while keyed_node is not None:
+                    current_node = keyed_node.node
+
+                    if previous_node is None:
+                        self.head = current_node
+
+                    else:
+                        previous_node.next = current_node
+
+                    previous_node = current_node
+                    keyed_node = keyed_node.next
+
+                previous_node.next = None
+                self.tail = previous_node
+
+        self.is_sorted = key is None and not reverse
+
+
+    def parallel_sort(self, workers=None, threshold=PARALLEL_SORT_THRESHOLD, reverse=False):
+        ''' Sort the list using <workers> processes (all CPUs if <None>). The
+            chain is split into one chunk per worker, the workers sort the
+            values of their chunk and send back its sorting order, and the
+            nodes of every chunk are relinked into a sorted run. The runs are
+            then merged with the merge step of <sort>, so the nodes themselves
+            are kept and the sort is stable. The values must be picklable.
+            Lists shorter than <threshold>, or a single worker, fall back to
+            <sort> '''
+
+        workers = os.cpu_count() if workers is None else workers
+
+        if self.length < max(threshold, 2) or workers < 2 or (self.is_sorted and not reverse):
+            return self.sort(reverse=reverse)
+
+        runs = []
+
+        for nodes in _sorted_chunks(self.head, self.length, workers, reverse):
+            previous_node = None
+
+            for current_node in nodes:
+                if previous_node is not None:
+                    previous_node.next = current_node
+
+                previous_node = current_node
+
+            previous_node.next = None
+            runs.append((nodes[0], previous_node))
+
+        self.head, self.tail = self._merge_runs(runs, reverse)
+        self.is_sorted = not reverse
+        self.modifications += 1
+
+
+    def _node_at(self, index):
+        ''' Utility method locating the node at given valid <index>, walking
+            from the head unless it is the last node '''
+
+        if index == self.length - 1:
+            return self.tail
+
+        current_node = self.head
+
+        for _ in range(index):
+            current_node = current_node.next
+
+        return current_node
+
+
+    def _build_chain(self, iterable, reverse=False):
+        ''' Utility method building a chain of new nodes holding the elements of
+            <iterable>, in reverse order if <reverse> is set, and returning its
+            (head, tail, count) triple '''
+
+        new_node_of = self._new_node
+        sentinel = SinglyLinkedNode(None)
+        tail = sentinel
+        count = 0
+
+        if reverse:
+            head = None
+
+            for value in iterable:
+                new_node = new_node_of(value)
+
+                if head is None:
+                    tail = new_node
+
+                new_node.next = head
+                head = new_node
+                count += 1
+
+            return head, tail, count
+
+        for value in iterable:
+            new_node = new_node_of(value)
+            tail.next = new_node
+            tail = new_node
+            count += 1
+
+        if count == 0:
+            return None, None, 0
+
+        return sentinel.next, tail, count
+
+
+    def _splice_chain(self, head, tail, count, previous_node):
+        ''' Utility method linking a whole chain of <count> nodes, from <head>
+            to <tail>, right after <previous_node>, or at the very beginning of
+            the list if <previous_node> is <None>, in O(1) time '''
+
+        if previous_node is None:
+            tail.next = self.head
+            self.head = head
+
+        else:
+            tail.next = previous_node.next
+            previous_node.next = head
+
+        if tail.next is None:
+            self.tail = tail
+
+        self.length += count
+        self.modifications += 1
+
+
+    def _replace(self, node, value):
+        ''' Utility method replacing <data> value of <node> '''
+
+        node.data = value
+        self.is_sorted = False
+
+
+    def _link(self, new_node, previous_node):
+        ''' Utility method linking <new_node> right after <previous_node>, or
+            at the very beginning of the list if <previous_node> is <None>, in
+            O(1) time '''
+
+        if previous_node is None:
+            new_node.next = self.head
+            self.head = new_node
+
+        else:
+            new_node.next = previous_node.next
+            previous_node.next = new_node
+
+        if new_node.next is None:   # New node is being linked at the very end of the list
+            self.tail = new_node
+
+        self.length += 1
+        self.modifications += 1
+
+
+    def _unlink(self, current_node, previous_node):
+        ''' Utility method detaching <current_node>, which follows
+            <previous_node> (<None> for the very first node), from the list in
+            O(1) time '''
+
+        if previous_node is None:
+            self.head = current_node.next
+
+        else:
+            previous_node.next = current_node.next
+
+        if current_node.next is None:   # Removing the very last element of the list
+            self.tail = previous_node
+
+        self.length -= 1
+        self.modifications += 1
+
+
+    def _merge_sort(self, head, reverse=False):
+        ''' Utility method sorting the chain of nodes starting at <head> and
+            returning the (head, tail) pair of the sorted chain '''
+
+        runs = []   # (head, tail) pairs of the ordered runs of nodes
+        current_node = head
+
+        while current_node is not None:
+            run_head = current_node
+            run_tail = current_node
+            current_node = current_node.next
+
+            # A strictly descending run is reversed while it is being walked
+
+            while current_node is not None and (run_head.data < current_node.data if reverse else current_node.data < run_head.data):
+                next_node = current_node.next
+                current_node.next = run_head
+                run_head = current_node
+                current_node = next_node
+
+            if run_head is run_tail:
+                while current_node is not None and not (run_tail.data < current_node.data if reverse else current_node.data < run_tail.data):
+                    run_tail = current_node
+                    current_node = current_node.next
+
+            run_tail.next = None
+            runs.append((run_head, run_tail))
+
+        return self._merge_runs(runs, reverse)
+
+
+    def _merge_runs(self, runs, reverse=False):
+        ''' Utility method merging neighbouring sorted runs of nodes, given as
+            (head, tail) pairs, pairwise until a single run is left and
+            returning its (head, tail) pair '''
+
+        while len(runs) > 1:
+            merged_runs = []
+
+            for i in range(0, len(runs) - 1, 2):
+                merged_runs.append(self._merge(runs[i], runs[i+1], reverse))
+
+            if len(runs) % 2:
+                merged_runs.append(runs[-1])
+
+            runs = merged_runs
+
+        return runs[0]
+
+
+    def _merge(self, sorted_left, sorted_right, reverse=False):
+        ''' Utility method merging two sorted runs of nodes, given as (head,
+            tail) pairs, into one and returning its (head, tail) pair. On ties
+            nodes of <sorted_left> go first, which keeps merge sort stable '''
+
+        left_node, left_tail = sorted_left
+        right_node, right_tail = sorted_right
+
+        if not (left_tail.data < right_node.data if reverse else right_node.data < left_tail.data):
+            left_tail.next = right_node   # Runs are already in order, just join them
+            return left_node, right_tail
+
+        if (left_node.data < right_node.data if reverse else right_node.data < left_node.data):
+            result_head = right_node
+            right_node = right_node.next
+
+        else:
+            result_head = left_node
+            left_node = left_node.next
+
+        result_tail = result_head
+
+        while left_node is not None and right_node is not None:
+            if (left_node.data < right_node.data if reverse else right_node.data < left_node.data):
+                result_tail.next = right_node
+                result_tail = right_node
+                right_node = right_node.next
+
+            else:
+                result_tail.next = left_node
+                result_tail = left_node
+                left_node = left_node.next
+
+        if left_node is not None:   # Attach the rest of whichever run is not exhausted yet
+            result_tail.next = left_node
+            result_tail = left_tail
+
+        else:
+            result_tail.next = right_node
+            result_tail = right_tail
+
+        return result_head, result_tail
+
+
+
+class HashedSinglyLinkedList(AdvancedSinglyLinkedList):
+    ''' Singly Linked List keeping a hash index that maps every <data> value
+        to the nodes holding it (several nodes in case of duplicates), which
+        makes membership test and removal by value take O(1) average time.
+        It also maps every node to its predecessor, so a node found through
+        the index is unlinked in place. Sorting and reversing rebuild that map
+        in O(n) time. The values stored in this list must be hashable '''
+
+    def __init__(self, iterable=None, pool=None):
+        self.nodes_by_value = {}   # Value -> insertion ordered set (dict) of nodes
+        self.previous_nodes = {}   # Node -> the node before it, <None> for the head
+        super().__init__(iterable, pool)
+
+
+    def __contains__(self, value):
+        ''' Return <True> if <value> is contained in at least one of the nodes
+            of linked list in O(1) average time '''
+
+        return value in self.nodes_by_value
+
+
+    def remove(self, value):
+        ''' Find the first node holding <value> and remove it. Takes O(1)
+            average time if a single node holds <value>, with duplicates the
+            list is walked up to the first of them '''
+
+        nodes = self.nodes_by_value.get(value)
+
+        if not nodes:
+            raise ValueError('value not in list')
+
+        if len(nodes) == 1:
+            current_node = next(iter(nodes))
+
+        else:
+            current_node = self.head
+
+            while current_node not in nodes:
+                current_node = current_node.next
+
+        self._unlink(current_node, self.previous_nodes[current_node])
+
+        if self.pool is not None:
+            self.pool.release(current_node)
+
+
+    def reverse(self):
+        ''' Reverse the list in O(n) time '''
+
+        super().reverse()
+        self._index_predecessors()
+
+
+    def sort(self, key=None, reverse=False):
+        ''' Sort the list using iterative natural merge sort algorithm '''
+
+        modifications = self.modifications
+        super().sort(key=key, reverse=reverse)
+
+        if self.modifications != modifications:
+            self._index_predecessors()
+
+
+    def parallel_sort(self, workers=None, threshold=PARALLEL_SORT_THRESHOLD, reverse=False):
+        ''' Sort the list using <workers> processes, see
+            <AdvancedSinglyLinkedList.parallel_sort> '''
+
+        modifications = self.modifications
+        super().parallel_sort(workers, threshold, reverse)
+
+        if self.modifications != modifications:
+            self._index_predecessors()
+
+
+    def _clear(self):
+        super()._clear()
+        self.nodes_by_value = {}
+        self.previous_nodes = {}
+
+
+    def _splice_chain(self, head, tail, count, previous_node):
+        current_node = head
+        chain_previous_node = previous_node
+
+        for _ in range(count):
+            self._index_node(current_node)
+            self.previous_nodes[current_node] = chain_previous_node
+            chain_previous_node = current_node
+            current_node = current_node.next
+
+        super()._splice_chain(head, tail, count, previous_node)
+
+        if tail.next is not None:
+            self.previous_nodes[tail.next] = tail
+
+
+    def _link(self, new_node, previous_node):
+        super()._link(new_node, previous_node)
+        self._index_node(new_node)
+        self.previous_nodes[new_node] = previous_node
+
+        if new_node.next is not None:
+            self.previous_nodes[new_node.next] = new_node
+
+
+    def _unlink(self, current_node, previous_node):
+        super()._unlink(current_node, previous_node)
+        self._unindex_node(current_node)
+        del self.previous_nodes[current_node]
+
+        if current_node.next is not None:
+            self.previous_nodes[current_node.next] = previous_node
+
+
+    def _replace(self, node, value):
+        self._unindex_node(node)
+        super()._replace(node, value)
+        self._index_node(node)
+
+
+    def _index_node(self, node):
+        ''' Utility method adding <node> to the hash index '''
+
+        nodes = self.nodes_by_value.get(node.data)
+
+        if nodes is None:
+            self.nodes_by_value[node.data] = {node: None}
+
+        else:
+            nodes[node] = None
+
+
+    def _unindex_node(self, node):
+        ''' Utility method removing <node> from the hash index '''
+
+        nodes = self.nodes_by_value[node.data]
+        del nodes[node]
+
+        if not nodes:
+            del self.nodes_by_value[node.data]
+
+
+    def _index_predecessors(self):
+        ''' Utility method rebuilding the map of predecessors in O(n) time,
+            after the whole chain has been relinked '''
+
+        self.previous_nodes = {}
+        previous_node = None
+        current_node = self.head
+
+        while current_node is not None:
+            self.previous_nodes[current_node] = previous_node
+            previous_node = current_node
+            current_node = current_node.next
+
+
+
+class PersistentSinglyLinkedList:
+    ''' Immutable (persistent) singly linked list. Operations never change a
+        list, they return a new version of it instead. <push> and <pop> work
+        on the head in O(1) time and the new version shares all of its other
+        nodes with the old one, so keeping any number of old versions costs
+        only the nodes that differ between them. As nodes are never changed
+        once linked, a version can be read by any number of threads without
+        locking.
+
+        Versions that share a suffix are compared in the time it takes to
+        reach the first shared node, as the rest of both lists is then known
+        to be the same '''
+
+    __slots__ = ('head', 'length')
+
+    def __init__(self, iterable=None):
+        self.head = None
+        self.length = 0
+
+        if iterable is not None:
+            values = list(iterable)
+
+            for value in reversed(values):   # Build from the end, so the first element ends up at the head
+                new_node = SinglyLinkedNode(value)
+                new_node.next = self.head
+                self.head = new_node
+
+            self.length = len(values)
+
+
+    @classmethod
+    def _from_chain(cls, head, length):
+        ''' Wrap an existing chain of <length> nodes starting at <head> in O(1)
+            time. The chain must never be changed afterwards '''
+
+        new_list = cls.__new__(cls)
+        new_list.head = head
+        new_list.length = length
+
+        return new_list
+
+
+    def __len__(self):
+        return self.length
+
+
+    def __iter__(self):
+        current_node = self.head
+
+        while current_node is not None:
+            yield current_node.data
+            current_node = current_node.next
+
+
+    def __getitem__(self, index):
+        ''' Get the value at <index> in O(n) time '''
+
+        if not (isinstance(index, int)):
+            raise TypeError('list indices must be integers')
+
+        if index < 0:
+            index += self.length
+
+        if not (0 <= index < self.length):
+            raise IndexError('list index out of range')
+
+        current_node = self.head
+
+        for _ in range(index):
+            current_node = current_node.next
+
+        return current_node.data
+
+
+    def __eq__(self, other):
+        ''' Compare values one by one in O(n) time, stopping early at the first
+            node shared by both lists '''
+
+        if not isinstance(other, PersistentSinglyLinkedList):
+            return NotImplemented
+
+        if self.length != other.length:
+            return False
+
+        node = self.head
+        other_node = other.head
+
+        while node is not other_node:   # Lengths are equal, so shared nodes are met at the same position
+            if node.data != other_node.data:
+                return False
+
+            node = node.next
+            other_node = other_node.next
+
+        return True
+
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+
+    def __reduce__(self):
+        return (self.__class__, (list(self),))
+
+
+    def push(self, value):
+        ''' Return a new version with <value> added at the head in O(1) time '''
+
+        new_node = SinglyLinkedNode(value)
+        new_node.next = self.head
+
+        return self._from_chain(new_node, self.length + 1)
+
+
+    def pop(self):
+        ''' Return a new version without the head element in O(1) time '''
+
+        if self.head is None:
+            raise IndexError('pop from empty list')
+
+        return self._from_chain(self.head.next, self.length - 1)
+
+
+    def peek(self):
+        ''' Get the head element in O(1) time '''
+
+        if self.head is None:
+            raise IndexError('peek from empty list')
+
+        return self.head.data
+
+
+    def is_empty(self):
+        return self.head is None
+
+
+    def reverse(self):
+        ''' Return a new version with the elements in the reverse order in O(n)
+            time '''
+
+        head = None
+
+        for value in self:
+            new_node = SinglyLinkedNode(value)
+            new_node.next = head
+            head = new_node
+
+        return self._from_chain(head, self.length)
+
+
+
+class AdvancedDoublyLinkedList:
+    ''' Implementation of the Doubly Linked List abstract data type (ADT) '''
+
+    def __init__(self, iterable=None, pool=None):
+        self.head = None
+        self.tail = None
+        self.length = 0
+        self.is_sorted = False
+        self.modifications = 0   # Count of structural changes, a view taken before a change is no longer valid
+
+        if pool is not None and pool.node_class is not DoublyLinkedNode:
+            raise ValueError('pool must hold DoublyLinkedNode nodes')
+
+        self.pool = pool
+        self._new_node = DoublyLinkedNode if pool is None else pool.acquire
+
+        # Initialize a linked list to the elements of a given iterable object
+
+        if iterable is not None:
+            self.extend(iterable)
+
+
+    def __len__(self):
+        return self.length
+
+
+    def __iter__(self, reverse=False):
+        ''' Traverse throught the list one node at a time '''
+
+        current_node = self.head
+
+        while current_node is not None:
+            yield current_node.data
+            current_node = current_node.next
+
+
+    def __reversed__(self):
+        ''' Traverse throught the list from the end to the beginning (in a
+            reverse order) one node at a time '''
+        
+        current_node = self.tail
+            
+        while current_node is not None:
+            yield current_node.data
+            current_node = current_node.prev
+
+
+    def __contains__(self, value):
+        ''' Return <True> if <value> is contained in at least one of the nodes
+            of linked list, otherwise return <False> '''
+        
+        current_node = self.head
+
+        while current_node is not None:
+            if current_node.data == value:
+                return True
+
+            else:
+                current_node = current_node.next
+
+        return False
+
+
+    def __getitem__(self, index):
+        ''' Get <data> value of the node at given <index> of the list in O(n)
+            time, walking from whichever end of the list is closer. Given a
+            slice, return a lazy <LinkedListView> of it in O(1) time '''
+
+        if isinstance(index, slice):
+            return LinkedListView(self, range(*index.indices(self.length)))
+
+        return self._node_at(self._normalize_index(index)).data
+
+
+    def __setitem__(self, index, value):
+        ''' Replace <data> value of the node at given <index> of the list in
+            O(n) time, walking from whichever end of the list is closer '''
+
+        self._replace(self._node_at(self._normalize_index(index)), value)
+
+
+    def __reduce__(self):
+        ''' Pickle the list as a flat list of its values, which is restored
+            through the bulk building path of the constructor. A node pool is
+            not pickled '''
+
+        return (self.__class__, (list(self),), {'is_sorted': self.is_sorted})
+
+
+    def insert_at_beginning(self, value):
+        ''' Insert <value> at the beginning of the list in O(1) time and
+            return the new node '''
+
+        new_node = self._new_node(value)
+        self._link(new_node, None)
+        self.is_sorted = False
+
+        return new_node
+
+
+    def insert_at_end(self, value):
+        ''' Insert <value> at the end of the list in O(1) time and return the
+            new node '''
+
+        new_node = self._new_node(value)
+        self._link(new_node, self.tail)
+        self.is_sorted = False
+
+        return new_node
+
+    
+    def insert_at_index(self, index, value):
+        ''' Insert <value> at given <index> of the list in O(n) time, walking
+            from whichever end of the list is closer to <index>. Return the new
+            node, which can be used as a handle for the O(1) node operations '''
+
+        if not (isinstance(index, int)):
+            raise TypeError('list indices must be integers')
+
+        if not (0 <= index <= self.length):
+            raise IndexError('list index out of range')
+
+        if index == 0:
+            previous_node = None
+
+        elif index == self.length:
+            previous_node = self.tail
+
+        else:
+            previous_node = self._node_at(index-1)
+
+        new_node = self._new_node(value)
+        self._link(new_node, previous_node)
+        self.is_sorted = False
+
+        return new_node
+
+
+    def insert_sorted(self, value):
+        ''' Insert <value> into the sorted list in the correct sorted position.
+            If the list is currently not sorted, sort it '''
+        
+        if self.is_sorted:
+            previous_node = None
+            current_node = self.head
+
+            while current_node is not None:
+                if current_node.data <= value:
+                    previous_node = current_node
+                    current_node = current_node.next
+
+                else:
+                    break
+
+            self._link(self._new_node(value), previous_node)
+
+        else:
+            self.insert_at_beginning(value)
+            self.sort()
+
+
+    def remove_at_beginning(self):
+        ''' Remove node from the beginning of the list and return <data> value
+            in O(1) time '''
+
+        current_node = self.head
+
+        if current_node is None:
+            raise IndexError('list index out of range')
+
+        value = current_node.data
+        self._unlink(current_node)
+
+        if self.pool is not None:
+            self.pool.release(current_node)
+
+        return value
+
+
+    def remove_at_end(self):
+        ''' Remove node from the end of the list and return <data> value in O(1)
+            time '''
+
+        current_node = self.tail
+
+        if current_node is None:
+            raise IndexError('list index out of range')
+
+        value = current_node.data
+        self._unlink(current_node)
+
+        if self.pool is not None:
+            self.pool.release(current_node)
+
+        return value
+
+
+    def remove_at_index(self, index):
+        ''' Remove node at given <index> of the list and return <data> value in
+            O(n) time, walking from whichever end of the list is closer. If the
+            <index> points to the beginning or the end of the list, remove the
+            node in O(1) time '''
+        
+        if not (isinstance(index, int)):
+            raise TypeError('list indices must be integers')
+
+        if not (0 <= index < self.length):
+            raise IndexError('list index out of range')
+
+        if index == 0:
+            current_node = self.head
+
+        elif index == (self.length-1):
+            current_node = self.tail
+
+        else:
+            current_node = self._node_at(index)
+
+        value = current_node.data
+        self._unlink(current_node)
+
+        if self.pool is not None:
+            self.pool.release(current_node)
+
+        return value
+
+
+    def remove_by_value(self, value):
+        ''' Find a node by <data> value and remove it '''
+
+        current_node = self.head
+
+        while current_node is not None:
+            if current_node.data == value:
+                self._unlink(current_node)
+
+                if self.pool is not None:
+                    self.pool.release(current_node)
+
+                return
+            
+            current_node = current_node.next
+
+        raise ValueError('value not in list')
+
+
+    def remove_if(self, predicate):
+        ''' Remove all nodes whose <data> value satisfies <predicate> in one
+            pass, in O(n) time, and return the count of removed nodes '''
+
+        removed = 0
+        current_node = self.head
+
+        while current_node is not None:
+            next_node = current_node.next
+
+            if predicate(current_node.data):
+                self._unlink(current_node)
+                removed += 1
+
+                if self.pool is not None:
+                    self.pool.release(current_node)
+
+            current_node = next_node
+
+        return removed
+
+
+    def remove_all(self, values):
+        ''' Remove all nodes holding any of <values> in one pass and return
+            the count of removed nodes. Hashable <values> are looked up in a
+            set, so this takes O(n + k) time '''
+
+        return self.remove_if(_membership(values))
+
+
+    def cursor(self, index=0):
+        ''' Return a <DoublyLinkedCursor> standing at the node at given <index>
+            (past the end if <index> is the length of the list), walking from
+            whichever end of the list is closer '''
+
+        if not (isinstance(index, int)):
+            raise TypeError('list indices must be integers')
+
+        if not (0 <= index <= self.length):
+            raise IndexError('list index out of range')
+
+        node = None if index == self.length else self._node_at(index)
+
+        return DoublyLinkedCursor(self, node, index)
+
+
+    def extend(self, iterable):
+        ''' Insert all elements of <iterable> at the end of the list in O(k)
+            time. The new nodes are built into a separate chain first, which is
+            then attached to the list as a whole '''
+
+        head, tail, count = self._build_chain(iterable)
+
+        if count:
+            self._splice_chain(head, tail, count, self.tail)
+            self.is_sorted = False
+
+
+    def extendleft(self, iterable):
+        ''' Insert all elements of <iterable> at the beginning of the list, one
+            after another, in O(k) time. As with <collections.deque>, the
+            elements end up in the reverse order '''
+
+        head, tail, count = self._build_chain(iterable, reverse=True)
+
+        if count:
+            self._splice_chain(head, tail, count, None)
+            self.is_sorted = False
+
+
+    def splice(self, other):
+        ''' Move all nodes of <other> list to the end of this list in O(1) time.
+            The <other> list is left empty '''
+
+        if not isinstance(other, AdvancedDoublyLinkedList):
+            raise TypeError('can only splice a doubly linked list')
+
+        if other is self:
+            raise ValueError('cannot splice a list into itself')
+
+        if other.length == 0:
+            return
+
+        is_sorted = other.is_sorted and (self.length == 0 or (self.is_sorted and not other.head.data < self.tail.data))
+        head, tail, count = other.head, other.tail, other.length
+        other._clear()
+
+        self._splice_chain(head, tail, count, self.tail)
+        self.is_sorted = is_sorted
+
+
+    @classmethod
+    def concat(cls, *lists):
+        ''' Return a new list made of all nodes of given <lists>, one list
+            after another, in O(k) time. The given lists are left empty '''
+
+        result = cls()
+
+        for other in lists:
+            result.splice(other)
+
+        return result
+
+
+    @classmethod
+    def merge_sorted(cls, *lists):
+        ''' Return a new sorted list made of all nodes of given <lists> in
+            O(n log k) time, merging them pairwise with the merge step of
+            <sort>. Lists that are not sorted are sorted first, lists whose
+            values do not overlap are joined in O(1) time. On ties nodes of
+            an earlier list go first. The given lists are left empty '''
+
+        result = cls()
+        runs = []
+        count = 0
+
+        for other in lists:
+            if not isinstance(other, AdvancedDoublyLinkedList):
+                raise TypeError('can only merge doubly linked lists')
+
+            if other.length:
+                other.sort()
+                runs.append((other.head, other.tail))
+                count += other.length
+                other._clear()
+
+        if runs:
+            head, tail = result._merge_runs(runs)
+            result._splice_chain(head, tail, count, None)
+
+        result.is_sorted = True
+
+        return result
+
+
+    def union(self, other, consume=False):
+        ''' Return a new sorted list holding every value found in this list or
+            in <other> list once, in O(n + m) time. Values are equal when
+            neither is less than the other. The new list takes the node pool
+            of this list and both lists are left unchanged, a list that is not
+            sorted is sorted in a temporary copy. With <consume> set the kept
+            nodes are moved into the new list instead of being copied, so no
+            node is allocated: both lists are sorted, then left empty, and
+            every dropped node goes back to the pool of the list it came from '''
+
+        return _sorted_set_operation(self, other, AdvancedDoublyLinkedList, True, True, True, consume)
+
+
+    def intersection(self, other, consume=False):
+        ''' Return a new sorted list holding every value found both in this
+            list and in <other> list once, in O(n + m) time. See <union> for
+            <consume> '''
+
+        return _sorted_set_operation(self, other, AdvancedDoublyLinkedList, False, True, False, consume)
+
+
+    def difference(self, other, consume=False):
+        ''' Return a new sorted list holding every value of this list that is
+            not found in <other> list once, in O(n + m) time. See <union> for
+            <consume> '''
+
+        return _sorted_set_operation(self, other, AdvancedDoublyLinkedList, True, False, False, consume)
+
+
+    def dedupe(self):
+        ''' Sort the list if it is not sorted, then keep only the first node
+            holding each value, in O(n) time. Return the count of removed
+            nodes '''
+
+        self.sort()
+        length = self.length
+        head = self.head
+        self._clear()
+
+        for current_node in _sorted_set_walk(head, None, True, False, False, None if self.pool is None else self.pool.release):
+            self._link(current_node, self.tail)
+
+        self.is_sorted = True
+
+        return length - self.length
+
+
+    def to_bytes(self, typecode='q'):
+        ''' Return the values of the list, which must all fit the <array> type
+            <typecode>, as a short header followed by the packed values in the
+            native byte order, which the header records. <from_buffer> reads
+            it back on a host of either byte order '''
+
+        return _pack_values(self, typecode)
+
+
+    @classmethod
+    def from_buffer(cls, buffer, pool=None):
+        ''' Build a list from the output of <to_bytes> held by any object
+            supporting the buffer protocol (<bytes>, <bytearray>, <mmap>,
+            shared memory ...). The values are read straight from the buffer,
+            without copying it first '''
+
+        return cls(_unpack_buffer(buffer), pool)
+
+
+    def split_at(self, index):
+        ''' Split the list before given <index> and return the two parts as
+            new lists. The nodes are moved, not copied, so this list is left
+            empty and the new lists share its node pool. Locating the split
+            point takes O(n) time, walking from whichever end of the list is
+            closer '''
+
+        if not (isinstance(index, int)):
+            raise TypeError('list indices must be integers')
+
+        if not (0 <= index <= self.length):
+            raise IndexError('list index out of range')
+
+        left = type(self)(pool=self.pool)
+        right = type(self)(pool=self.pool)
+
+        head, tail, length, is_sorted = self.head, self.tail, self.length, self.is_sorted
+        last_left_node = None if index == 0 else self._node_at(index-1)
+        self._clear()
+
+        if last_left_node is not None:
+            first_right_node = last_left_node.next
+            last_left_node.next = None
+            left._splice_chain(head, last_left_node, index, None)
+
+        else:
+            first_right_node = head
+
+        if first_right_node is not None:
+            first_right_node.prev = None
+            right._splice_chain(first_right_node, tail, length - index, None)
+
+        left.is_sorted = is_sorted
+        right.is_sorted = is_sorted
+
+        return left, right
+
+
+    def node_at(self, index):
+        ''' Return the node at given <index> of the list, walking from whichever
+            end of the list is closer '''
+
+        return self._node_at(self._normalize_index(index))
+
+
+    def insert_after(self, node, value):
+        ''' Insert <value> right after <node> of this list (at the very
+            beginning of the list if <node> is <None>) in O(1) time and return
+            the new node '''
+
+        new_node = self._new_node(value)
+        self._link(new_node, node)
+        self.is_sorted = False
+
+        return new_node
+
+
+    def remove_node(self, node):
+        ''' Remove <node> of this list and return its <data> value in O(1)
+            time '''
+
+        value = node.data
+        self._unlink(node)
+
+        if self.pool is not None:
+            self.pool.release(node)
+
+        return value
+
+
+    def move_to_beginning(self, node):
+        ''' Move <node> of this list to the beginning of the list in O(1) time '''
+
+        if node is not self.head:
+            self._unlink(node)
+            self._link(node, None)
+            self.is_sorted = False
+
+
+    def move_to_end(self, node):
+        ''' Move <node> of this list to the end of the list in O(1) time '''
+
+        if node is not self.tail:
+            self._unlink(node)
+            self._link(node, self.tail)
+            self.is_sorted = False
+
+
+    def reverse(self):
+        ''' Reverse the list in O(n) time '''
+
+        current_node = self.head
+
+        while current_node is not None:
+            current_node.next, current_node.prev = current_node.prev, current_node.next
+            current_node = current_node.prev
+
+        self.head, self.tail = self.tail, self.head
+        self.is_sorted = False
+        self.modifications += 1
+
+
+    def delete(self):
+        ''' Delete all nodes of the list in O(1) time by setting head and tail
+            references to <None>. With a node pool, the nodes are first given
+            back to the pool, as many as it has room for '''
+
+        if self.pool is not None:
+            self.pool.release_chain(self.head)
+
+        self._clear()
+
+
+    def _clear(self):
+        ''' Utility method emptying the list without touching its nodes '''
+
+        self.head = None
+        self.tail = None
+        self.length = 0
+        self.is_sorted = False
+        self.modifications += 1
+
+
+    def sort(self, key=None, reverse=False):
+        ''' Sort the list using iterative natural merge sort algorithm. Runs of
+            nodes that are already in order (or in strictly reverse order) are
+            detected first and then merged bottom-up, so an already sorted or
+            nearly sorted list is sorted in close to O(n) time. The sort is
+            stable, also when <reverse> is set. With <key> given, the key of
+            every node is computed only once '''
+
+        if self.is_sorted and key is None and not reverse:
+            return
+
+        self.modifications += 1
+
+        if self.length > 1:
+            if key is None:
+                self.head, self.tail = self._merge_sort(self.head, reverse)
+
+            else:   # Sort a chain of nodes decorated with keys, then relink the nodes in the same order
+                keyed_head = None
+                keyed_tail = None
+                current_node = self.head
+
+                while current_node is not None:
+                    keyed_node = KeyedNode(key(current_node.data), current_node)
+
+                    if keyed_head is None:
+                        keyed_head = keyed_node
+
+                    else:
+                        keyed_tail.next = keyed_node
+                        keyed_node.prev = keyed_tail
+
+                    keyed_tail = keyed_node
+                    current_node = current_node.next
+
+                keyed_node = self._merge_sort(keyed_head, reverse)[0]
+                previous_node = None
+
+                while keyed_node is not None:
+                    current_node = keyed_node.node
+                    current_node.prev = previous_node
+
+                    if previous_node is None:
+                        self.head = current_node
+
+                    else:
+                        previous_node.next = current_node
+
+                    previous_node = current_node
+                    keyed_node = keyed_node.next
+
+                previous_node.next = None
+                self.tail = previous_node
+
+        self.is_sorted = key is None and not reverse
+
+
+    def parallel_sort(self, workers=None, threshold=PARALLEL_SORT_THRESHOLD, reverse=False):
+        ''' Sort the list using <workers> processes (all CPUs if <None>). The
+            chain is split into one chunk per worker, the workers sort the
+            values of their chunk and send back its sorting order, and the
+            nodes of every chunk are relinked into a sorted run. The runs are
+            then merged with the merge step of <sort>, so the nodes themselves
+            are kept and the sort is stable. The values must be picklable.
+            Lists shorter than <threshold>, or a single worker, fall back to
+            <sort> '''
+
+        workers = os.cpu_count() if workers is None else workers
+
+        if self.length < max(threshold, 2) or workers < 2 or (self.is_sorted and not reverse):
+            return self.sort(reverse=reverse)
+
+        runs = []
+
+        for nodes in _sorted_chunks(self.head, self.length, workers, reverse):
+            previous_node = None
+
+            for current_node in nodes:
+                current_node.prev = previous_node
+
+                if previous_node is not None:
+                    previous_node.next = current_node
+
+                previous_node = current_node
+
+            previous_node.next = None
+            runs.append((nodes[0], previous_node))
+
+        self.head, self.tail = self._merge_runs(runs, reverse)
+        self.head.prev = None
+        self.is_sorted = not reverse
+        self.modifications += 1
+
+
+    def _normalize_index(self, index):
+        ''' Utility method validating <index> and converting a negative index
+            into the corresponding non-negative one '''
+
+        if not (isinstance(index, int)):
+            raise TypeError('list indices must be integers')
+
+        if index < 0:
+            index += self.length
+
+        if not (0 <= index < self.length):
+            raise IndexError('list index out of range')
+
+        return index
+
+
+    def _node_at(self, index):
+        ''' Utility method locating the node at given valid <index>, walking
+            from whichever end of the list is closer to it '''
+
+        if index < self.length // 2:
+            current_node = self.head
+
+            for _ in range(index):
+                current_node = current_node.next
+
+        else:
+            current_node = self.tail
+
+            for _ in range(self.length - 1 - index):
+                current_node = current_node.prev
+
+        return current_node
+
+
+    def _build_chain(self, iterable, reverse=False):
+        ''' Utility method building a chain of new nodes holding the elements of
+            <iterable>, in reverse order if <reverse> is set, and returning its
+            (head, tail, count) triple '''
+
+        new_node_of = self._new_node
+        sentinel = DoublyLinkedNode(None)
+        tail = sentinel
+        count = 0
+
+        if reverse:
+            head = None
+
+            for value in iterable:
+                new_node = new_node_of(value)
+
+                if head is None:
+                    tail = new_node
+
+                else:
+                    head.prev = new_node
+                    new_node.next = head
+
+                head = new_node
+                count += 1
+
+            return head, tail, count
+
+        for value in iterable:
+            new_node = new_node_of(value)
+            new_node.prev = tail
+            tail.next = new_node
+            tail = new_node
+            count += 1
+
+        if count == 0:
+            return None, None, 0
+
+        head = sentinel.next
+        head.prev = None
+
+        return head, tail, count
+
+
+    def _splice_chain(self, head, tail, count, previous_node):
+        ''' Utility method linking a whole chain of <count> nodes, from <head>
+            to <tail>, right after <previous_node>, or at the very beginning of
+            the list if <previous_node> is <None>, in O(1) time '''
+
+        if previous_node is None:
+            next_node = self.head
+            self.head = head
+
+        else:
+            next_node = previous_node.next
+            previous_node.next = head
+
+        head.prev = previous_node
+        tail.next = next_node
+
+        if next_node is None:
+            self.tail = tail
+
+        else:
+            next_node.prev = tail
+
+        self.length += count
+        self.modifications += 1
+
+
+    def _replace(self, node, value):
+        ''' Utility method replacing <data> value of <node> '''
+
+        node.data = value
+        self.is_sorted = False
+
+
+    def _link(self, new_node, previous_node):
+        ''' Utility method linking <new_node> right after <previous_node>, or
+            at the very beginning of the list if <previous_node> is <None>, in
+            O(1) time '''
+
+        if previous_node is None:
+            next_node = self.head
+            self.head = new_node
+
+        else:
+            next_node = previous_node.next
+            previous_node.next = new_node
+
+        new_node.prev = previous_node
+        new_node.next = next_node
+
+        if next_node is None:
+            self.tail = new_node
+
+        else:
+            next_node.prev = new_node
+
+        self.length += 1
+        self.modifications += 1
+
+
+    def _unlink(self, current_node):
+        ''' Utility method detaching <current_node> from the list in O(1) time '''
+
+        previous_node = current_node.prev
+        next_node = current_node.next
+
+        if previous_node is None:
+            self.head = next_node
+
+        else:
+            previous_node.next = next_node
+
+        if next_node is None:
+            self.tail = previous_node
+
+        else:
+            next_node.prev = previous_node
+
+        self.length -= 1
+        self.modifications += 1
+
+
+    def _merge_sort(self, head, reverse=False):
+        ''' Utility method sorting the chain of nodes starting at <head> and
+            returning the (head, tail) pair of the sorted chain '''
+
+        runs = []   # (head, tail) pairs of the ordered runs of nodes
+        current_node = head
+
+        while current_node is not None:
+            run_head = current_node
+            run_tail = current_node
+            current_node = current_node.next
+
+            # A strictly descending run is reversed while it is being walked
+
+            while current_node is not None and (run_head.data < current_node.data if reverse else current_node.data < run_head.data):
+                next_node = current_node.next
+                current_node.next = run_head
+                run_head.prev = current_node
+                run_head = current_node
+                current_node = next_node
+
+            if run_head is run_tail:
+                while current_node is not None and not (run_tail.data < current_node.data if reverse else current_node.data < run_tail.data):
+                    run_tail = current_node
+                    current_node = current_node.next
+
+            run_head.prev = None
+            run_tail.next = None
+            runs.append((run_head, run_tail))
+
+        return self._merge_runs(runs, reverse)
+
+
+    def _merge_runs(self, runs, reverse=False):
+        ''' Utility method merging neighbouring sorted runs of nodes, given as
+            (head, tail) pairs, pairwise until a single run is left and
+            returning its (head, tail) pair '''
+
+        while len(runs) > 1:
+            merged_runs = []
+
+            for i in range(0, len(runs) - 1, 2):
+                merged_runs.append(self._merge(runs[i], runs[i+1], reverse))
+
+            if len(runs) % 2:
+                merged_runs.append(runs[-1])
+
+            runs = merged_runs
+
+        return runs[0]
+
+
+    def _merge(self, sorted_left, sorted_right, reverse=False):
+        ''' Utility method merging two sorted runs of nodes, given as (head,
+            tail) pairs, into one and returning its (head, tail) pair. On ties
+            nodes of <sorted_left> go first, which keeps merge sort stable '''
+
+        left_node, left_tail = sorted_left
+        right_node, right_tail = sorted_right
+
+        if not (left_tail.data < right_node.data if reverse else right_node.data < left_tail.data):
+            left_tail.next = right_node   # Runs are already in order, just join them
+            right_node.prev = left_tail
+            return left_node, right_tail
+
+        if (left_node.data < right_node.data if reverse else right_node.data < left_node.data):
+            result_head = right_node
+            right_node = right_node.next
+
+        else:
+            result_head = left_node
+            left_node = left_node.next
+
+        result_tail = result_head
+
+        while left_node is not None and right_node is not None:
+            if (left_node.data < right_node.data if reverse else right_node.data < left_node.data):
+                result_tail.next = right_node
+                right_node.prev = result_tail
+                result_tail = right_node
+                right_node = right_node.next
+
+            else:
+                result_tail.next = left_node
+                left_node.prev = result_tail
+                result_tail = left_node
+                left_node = left_node.next
+
+        if left_node is not None:   # Attach the rest of whichever run is not exhausted yet
+            result_tail.next = left_node
+            left_node.prev = result_tail
+            result_tail = left_tail
+
+        else:
+            result_tail.next = right_node
+            right_node.prev = result_tail
+            result_tail = right_tail
+
+        return result_head, result_tail
+
+
+
+class IndexedDoublyLinkedList(AdvancedDoublyLinkedList):
+    ''' Doubly Linked List with an indexable skip list layered over its chain
+        of nodes. Every lane of the skip list links a random subset of nodes
+        and remembers how many nodes each link spans, which gives O(log n)
+        positional access, insertion and removal. Skip nodes also link back
+        to the previous one of their lane and up to the one above them, so
+        the position of a node given by its handle (<insert_after>,
+        <remove_node>, <move_to_end>, cursors) is found in O(log n) time and
+        the lanes stay up to date. Operations that relink the whole chain
+        (sorting, reversing, <remove_if>, splicing a chain at least as long as
+        the list) only mark the lanes as stale and they are rebuilt in O(n)
+        time on the next positional operation '''
+
+    PROMOTION_PROBABILITY = 0.25   # Chance of a node appearing in the next lane up
+
+    def __init__(self, iterable=None, pool=None):
+        self.lanes = []   # Sentinel skip nodes of every lane, the lowest lane first
+        self.towers = {}   # Node -> its skip node in the lowest lane, for nodes that have one
+        self._lanes_stale = False
+
+        super().__init__(iterable, pool)   # The lanes are built lazily on the first positional operation
+
+
+    def __contains__(self, value):
+        ''' Return <True> if <value> is contained in at least one of the nodes
+            of linked list, otherwise return <False>. Takes O(log n) time if
+            the list is sorted '''
+
+        if not self.is_sorted:
+            return super().__contains__(value)
+
+        index = self.bisect_left(value)
+        return index < self.length and self._node_at(index).data == value
+
+
+    def insert_at_beginning(self, value):
+        ''' Insert <value> at the beginning of the list and return the new
+            node. Takes O(1) time plus a span update in every lane '''
+
+        return super().insert_at_beginning(value)
+
+
+    def insert_at_end(self, value):
+        ''' Insert <value> at the end of the list and return the new node.
+            Takes O(1) time plus a span update in every lane '''
+
+        return super().insert_at_end(value)
+
+
+    def insert_at_index(self, index, value):
+        ''' Insert <value> at given <index> of the list in O(log n) time and
+            return the new node '''
+
+        if not (isinstance(index, int)):
+            raise TypeError('list indices must be integers')
+
+        if not (0 <= index <= self.length):
+            raise IndexError('list index out of range')
+
+        self._prepare_lanes()
+        predecessors, positions = self._find_predecessors(index)
+
+        if index == 0:
+            previous_node = None
+
+        elif index == self.length:
+            previous_node = self.tail
+
+        else:
+            previous_node = self._walk(predecessors, positions, index-1)
+
+        new_node = self._insert_after(predecessors, positions, previous_node, index, value)
+        self.is_sorted = False
+
+        return new_node
+
+
+    def insert_sorted(self, value):
+        ''' Insert <value> into the sorted list in the correct sorted position
+            in O(log n) time. If the list is currently not sorted, sort it '''
+
+        if not self.is_sorted:
+            super().insert_sorted(value)
+            return
+
+        self._prepare_lanes()
+        predecessors, positions, previous_node, index = self._find_value_predecessors(value, right=True)
+        self._insert_after(predecessors, positions, previous_node, index, value)
+
+
+    def remove_at_beginning(self):
+        ''' Remove node from the beginning of the list and return <data>
+            value. Takes O(1) time plus a span update in every lane '''
+
+        return super().remove_at_beginning()
+
+
+    def remove_at_end(self):
+        ''' Remove node from the end of the list and return <data> value.
+            Takes O(1) time plus a span update in every lane '''
+
+        return super().remove_at_end()
+
+
+    def remove_at_index(self, index):
+        ''' Remove node at given <index> of the list and return <data> value in
+            O(log n) time '''
+
+        if not (isinstance(index, int)):
+            raise TypeError('list indices must be integers')
+
+        if not (0 <= index < self.length):
+            raise IndexError('list index out of range')
+
+        self._prepare_lanes()
+        predecessors, positions = self._find_predecessors(index)
+
+        if index == 0:
+            current_node = self.head
+
+        elif index == (self.length-1):
+            current_node = self.tail
+
+        else:
+            current_node = self._walk(predecessors, positions, index)
+
+        self._remove_tower(predecessors, current_node)
+
+        value = current_node.data
+        AdvancedDoublyLinkedList._unlink(self, current_node)
+
+        if self.pool is not None:
+            self.pool.release(current_node)
+
+        return value
+
+
+    def remove_by_value(self, value):
+        ''' Find a node by <data> value and remove it. Takes O(log n) time if
+            the list is sorted '''
+
+        if self.is_sorted:
+            index = self.bisect_left(value)
+
+            if index < self.length and self._node_at(index).data == value:
+                self.remove_at_index(index)
+                return
+
+            raise ValueError('value not in list')
+
+        index = 0
+        current_node = self.head
+
+        while current_node is not None:
+            if current_node.data == value:
+                self.remove_at_index(index)
+                return
+
+            current_node = current_node.next
+            index += 1
+
+        raise ValueError('value not in list')
+
+
+    def remove_if(self, predicate):
+        ''' Remove all nodes whose <data> value satisfies <predicate> in one
+            pass, in O(n) time, and return the count of removed nodes. The
+            lanes are rebuilt once afterwards rather than updated for every
+            removed node '''
+
+        lanes_stale = self._lanes_stale
+        self._lanes_stale = True
+        removed = super().remove_if(predicate)
+
+        if not removed:
+            self._lanes_stale = lanes_stale
+
+        return removed
+
+
+    def reverse(self):
+        ''' Reverse the list in O(n) time '''
+
+        super().reverse()
+        self._lanes_stale = True
+
+
+    def _clear(self):
+        super()._clear()
+        self.lanes = []
+        self.towers = {}
+        self._lanes_stale = False
+
+
+    def sort(self, key=None, reverse=False):
+        ''' Sort the list using iterative natural merge sort algorithm '''
+
+        super().sort(key=key, reverse=reverse)
+        self._lanes_stale = True
+
+
+    def parallel_sort(self, workers=None, threshold=PARALLEL_SORT_THRESHOLD, reverse=False):
+        ''' Sort the list using <workers> processes, see
+            <AdvancedDoublyLinkedList.parallel_sort> '''
+
+        super().parallel_sort(workers, threshold, reverse)
+        self._lanes_stale = True
+
+
+    def bisect_left(self, value):
+        ''' Return the index of the first node whose <data> value is not less
+            than <value> in O(log n) time. The list must be sorted '''
+
+        self._prepare_lanes()
+        return self._find_value_predecessors(value, right=False)[3]
+
+
+    def bisect_right(self, value):
+        ''' Return the index of the first node whose <data> value is greater
+            than <value> in O(log n) time. The list must be sorted '''
+
+        self._prepare_lanes()
+        return self._find_value_predecessors(value, right=True)[3]
+
+
+    def _node_at(self, index):
+        ''' Utility method locating the node at given valid <index> by
+            descending through the lanes in O(log n) time '''
+
+        self._prepare_lanes()
+
+        if not self.lanes:
+            return super()._node_at(index)
+
+        skip_node = self.lanes[-1]
+        position = -1
+
+        while True:
+            while skip_node.next is not None and position + skip_node.span <= index:
+                position += skip_node.span
+                skip_node = skip_node.next
+
+            if skip_node.down is None:
+                break
+
+            skip_node = skip_node.down
+
+        if position < 0:
             current_node = self.head
-            
-            while current_node is not None:
-                if current_node.next is None:
-                    self.tail = current_node
-                
-                current_node = current_node.next
+            position = 0
 
+        else:
+            current_node = skip_node.node
 
-    def _merge(self, sorted_left, sorted_right):
-        ''' Utility method for merging two sorted lists into one for merge sort '''
-        
-        result_head = None
-        result_tail = None
+        for _ in range(index - position):
+            current_node = current_node.next
 
-        left_node = sorted_left
-        right_node = sorted_right
+        return current_node
 
-        while left_node and right_node:
-            if left_node.data <= right_node.data:
-                smaller_node = left_node
-                left_node = left_node.next
 
-            else:
-                smaller_node = right_node
-                right_node = right_node.next
+    def _splice_chain(self, head, tail, count, previous_node):
+        if self._lanes_stale or count >= self.length:   # Rebuilding the lanes costs no more than adding <count> towers
+            super()._splice_chain(head, tail, count, previous_node)
+            self._lanes_stale = True
+            return
+
+        current_node = head
+
+        for _ in range(count):
+            next_node = current_node.next
+            self._link(current_node, previous_node)
+            previous_node = current_node
+            current_node = next_node
+
+
+    def _link(self, new_node, previous_node):
+        if self._lanes_stale:
+            super()._link(new_node, previous_node)
+            return
+
+        if previous_node is None:   # The sentinels precede the new head
+            index = 0
+            predecessors = list(self.lanes)
+            positions = [-1] * len(self.lanes)
+
+        elif previous_node is self.tail:   # The last skip nodes precede the new tail, their spans reach the end
+            index = self.length
+            predecessors = [sentinel.prev for sentinel in self.lanes]
+            positions = [index - skip_node.span for skip_node in predecessors]
+
+        else:
+            index = self._position(previous_node) + 1
+            predecessors, positions = self._find_predecessors(index)
+
+        super()._link(new_node, previous_node)
+        self._add_tower(predecessors, positions, new_node, index)
 
-            if result_head is None:   # Very first node is being assigned
-                result_head = smaller_node
-                result_tail = smaller_node
+
+    def _unlink(self, current_node):
+        if not self._lanes_stale:
+            if current_node is self.head:
+                predecessors = list(self.lanes)
+
+            elif current_node is self.tail:
+                predecessors = [sentinel.prev if sentinel.prev.node is not current_node else sentinel.prev.prev
+                                for sentinel in self.lanes]
 
             else:
-                result_tail.next = smaller_node
-                result_tail = smaller_node
+                predecessors = self._find_predecessors(self._position(current_node))[0]
 
-        while left_node:
-            if result_head is None:
-                result_head = left_node
-                result_tail = left_node
+            self._remove_tower(predecessors, current_node)
+
+        super()._unlink(current_node)
+
+
+    def _position(self, node):
+        ''' Utility method returning the index of <node> in O(log n) time. It
+            walks back along the chain to the nearest node that has a skip
+            node, then back along the lanes, climbing up every taller tower
+            on the way, and adds up the spans until it reaches a sentinel '''
+
+        index = 0
+        skip_node = self.towers.get(node)
+
+        while skip_node is None:
+            node = node.prev
+
+            if node is None:
+                return index
+
+            index += 1
+            skip_node = self.towers.get(node)
+
+        while skip_node.node is not None:
+            while skip_node.up is not None:
+                skip_node = skip_node.up
+
+            skip_node = skip_node.prev
+            index += skip_node.span
+
+        return index - 1
+
+
+    def _prepare_lanes(self):
+        ''' Utility method rebuilding the lanes if the chain of nodes has been
+            changed without keeping them up to date '''
+
+        if self._lanes_stale:
+            self._build_lanes()
+            self._lanes_stale = False
+
+
+    def _build_lanes(self):
+        ''' Utility method building the lanes from scratch in O(n) time. Every
+            4th node of a lane is promoted to the lane above it, which gives a
+            perfectly balanced skip list '''
+
+        self.lanes = []
+        self.towers = {}
+        step = int(1 / self.PROMOTION_PROBABILITY)
+        lane = []   # (position, skip node) pairs of the lane being built
+        current_node = self.head
+        position = 0
+
+        while current_node is not None:
+            if position % step == 0:
+                lane.append((position, SkipNode(current_node)))
+
+            current_node = current_node.next
+            position += 1
+
+        while self.length > step ** len(self.lanes) and lane:
+            sentinel = SkipNode(None)
+            sentinel.down = self.lanes[-1] if self.lanes else None
+            previous_position = -1
+            previous_skip_node = sentinel
+
+            for position, skip_node in lane:
+                previous_skip_node.next = skip_node
+                previous_skip_node.span = position - previous_position
+                skip_node.prev = previous_skip_node
+
+                if skip_node.down is None:
+                    self.towers[skip_node.node] = skip_node
+
+                else:
+                    skip_node.down.up = skip_node   # Only once the lane is built, the last promoted lane may be dropped
+                previous_position = position
+                previous_skip_node = skip_node
+
+            previous_skip_node.span = self.length - previous_position
+            sentinel.prev = previous_skip_node
+            self.lanes.append(sentinel)
+
+            upper_lane = []
+
+            for index in range(0, len(lane), step):   # Promote every 4th skip node
+                position, skip_node = lane[index]
+                upper_skip_node = SkipNode(skip_node.node)
+                upper_skip_node.down = skip_node
+                upper_lane.append((position, upper_skip_node))
+
+            lane = upper_lane if len(upper_lane) < len(lane) else []
+
+
+    def _find_predecessors(self, index):
+        ''' Utility method returning, for every lane, the last skip node that
+            is positioned before <index> together with its position '''
+
+        predecessors = [None] * len(self.lanes)
+        positions = [None] * len(self.lanes)
+
+        if self.lanes:
+            skip_node = self.lanes[-1]
+            position = -1
+
+            for level in range(len(self.lanes)-1, -1, -1):
+                while skip_node.next is not None and position + skip_node.span < index:
+                    position += skip_node.span
+                    skip_node = skip_node.next
+
+                predecessors[level] = skip_node
+                positions[level] = position
+                skip_node = skip_node.down
+
+        return predecessors, positions
+
+
+    def _find_value_predecessors(self, value, right):
+        ''' Utility method for the sorted list returning the predecessors of
+            the insertion point of <value> (as <_find_predecessors> does), the
+            node right before that point and its index. With <right> set the
+            insertion point follows all nodes equal to <value> '''
+
+        predecessors = [None] * len(self.lanes)
+        positions = [None] * len(self.lanes)
+        previous_node = None
+        position = -1
+
+        if self.lanes:
+            skip_node = self.lanes[-1]
+
+            for level in range(len(self.lanes)-1, -1, -1):
+                while skip_node.next is not None and (
+                        skip_node.next.node.data <= value if right else skip_node.next.node.data < value):
+                    position += skip_node.span
+                    skip_node = skip_node.next
+
+                predecessors[level] = skip_node
+                positions[level] = position
+                skip_node = skip_node.down
+
+            previous_node = predecessors[0].node
+
+        next_node = self.head if previous_node is None else previous_node.next
+
+        while next_node is not None and (next_node.data <= value if right else next_node.data < value):
+            previous_node = next_node
+            next_node = next_node.next
+            position += 1
+
+        return predecessors, positions, previous_node, position + 1
+
+
+    def _walk(self, predecessors, positions, index):
+        ''' Utility method locating the node at given <index> starting from the
+            lowest lane predecessor found by <_find_predecessors> '''
+
+        if not self.lanes:
+            return AdvancedDoublyLinkedList._node_at(self, index)
+
+        if positions[0] < 0:
+            current_node = self.head
+            position = 0
+
+        else:
+            current_node = predecessors[0].node
+            position = positions[0]
+
+        for _ in range(index - position):
+            current_node = current_node.next
+
+        return current_node
+
+
+    def _insert_after(self, predecessors, positions, previous_node, index, value):
+        ''' Utility method linking a new node holding <value> at <index>, right
+            after <previous_node>, and updating the lanes '''
+
+        new_node = self._new_node(value)
+        AdvancedDoublyLinkedList._link(self, new_node, previous_node)
+        self._add_tower(predecessors, positions, new_node, index)
+
+        return new_node
+
+
+    def _add_tower(self, predecessors, positions, new_node, index):
+        ''' Utility method updating the lanes for <new_node> linked at <index>,
+            <predecessors> and <positions> being those of <_find_predecessors>
+            for that index. The node gets a tower of skip nodes of random
+            height and the spans passing over it grow by one '''
+
+        height = 0
+
+        while height <= len(self.lanes) and random.random() < self.PROMOTION_PROBABILITY:
+            height += 1
+
+        if height > len(self.lanes):   # Open a new lane on top, spanning the whole list
+            sentinel = SkipNode(None, span=self.length)
+            sentinel.down = self.lanes[-1] if self.lanes else None
+            sentinel.prev = sentinel
+            self.lanes.append(sentinel)
+            predecessors.append(sentinel)
+            positions.append(-1)
+
+        lower_skip_node = None
+
+        for level, skip_node in enumerate(predecessors):
+            if level < height:
+                new_skip_node = SkipNode(new_node, span=positions[level] + skip_node.span + 1 - index)
+                new_skip_node.next = skip_node.next
+                new_skip_node.prev = skip_node
+                new_skip_node.down = lower_skip_node
+
+                if skip_node.next is None:
+                    self.lanes[level].prev = new_skip_node
+
+                else:
+                    skip_node.next.prev = new_skip_node
+
+                skip_node.next = new_skip_node
+                skip_node.span = index - positions[level]
+
+                if lower_skip_node is None:
+                    self.towers[new_node] = new_skip_node
+
+                else:
+                    lower_skip_node.up = new_skip_node
+
+                lower_skip_node = new_skip_node
 
             else:
-                result_tail.next = left_node
-                result_tail = left_node
+                skip_node.span += 1
 
-            left_node = left_node.next
 
-        while right_node:
-            if result_head is None:
-                result_head = right_node
-                result_tail = right_node
+    def _remove_tower(self, predecessors, current_node):
+        ''' Utility method updating the lanes before <current_node> is
+            unlinked, <predecessors> being those of <_find_predecessors> for
+            its index. Its skip nodes leave their lanes and the spans passing
+            over it shrink by one '''
+
+        for level, skip_node in enumerate(predecessors):
+            next_skip_node = skip_node.next
+
+            if next_skip_node is not None and next_skip_node.node is current_node:
+                skip_node.span += next_skip_node.span - 1
+                skip_node.next = next_skip_node.next
+
+                if next_skip_node.next is None:
+                    self.lanes[level].prev = skip_node
+
+                else:
+                    next_skip_node.next.prev = skip_node
 
             else:
-                result_tail.next = right_node
-                result_tail = right_node
+                skip_node.span -= 1
 
-            right_node = right_node.next
-        
-        return result_head
+        self.towers.pop(current_node, None)
 
-    
-    def _split(self, head, length):
-        ''' Utility method for splitting the list in half for merge sort '''
-        
-        if length <= 1:
-            return head
+        while self.lanes and self.lanes[-1].next is None:   # Drop lanes left empty
+            self.lanes.pop()
+
+
+
+class HashedDoublyLinkedList(AdvancedDoublyLinkedList):
+    ''' Doubly Linked List keeping a hash index that maps every <data> value
+        to the nodes holding it (several nodes in case of duplicates), which
+        makes membership test and removal by value take O(1) average time.
+        The values stored in this list must be hashable '''
+
+    def __init__(self, iterable=None, pool=None):
+        self.nodes_by_value = {}   # Value -> insertion ordered set (dict) of nodes
+        super().__init__(iterable, pool)
+
+
+    def __contains__(self, value):
+        ''' Return <True> if <value> is contained in at least one of the nodes
+            of linked list in O(1) average time '''
+
+        return value in self.nodes_by_value
+
+
+    def remove_by_value(self, value):
+        ''' Find the first node holding <value> and remove it. Takes O(1)
+            average time if a single node holds <value>, with duplicates the
+            list is walked up to the first of them '''
+
+        nodes = self.nodes_by_value.get(value)
+
+        if not nodes:
+            raise ValueError('value not in list')
+
+        if len(nodes) == 1:
+            current_node = next(iter(nodes))
 
         else:
-            unsorted_left = head
-            unsorted_right = head
-            
-            middle = length // 2
-            left_length = length // 2
-            right_length = (length // 2) +  (length % 2)
+            current_node = self.head
 
-            position = 1
-            previous_node = None
+            while current_node not in nodes:
+                current_node = current_node.next
 
-            while position <= middle:
-                previous_node = unsorted_right
-                unsorted_right = unsorted_right.next
-                position += 1
+        self._unlink(current_node)
 
-            previous_node.next = None
+        if self.pool is not None:
+            self.pool.release(current_node)
 
-            sorted_left = self._split(unsorted_left, left_length)
-            sorted_right = self._split(unsorted_right, right_length)
 
-            return self._merge(sorted_left, sorted_right)
+    def _clear(self):
+        super()._clear()
+        self.nodes_by_value = {}
 
 
+    def _splice_chain(self, head, tail, count, previous_node):
+        current_node = head
 
-class AdvancedDoublyLinkedList:
-    ''' Implementation of the Doubly Linked List abstract data type (ADT) '''
+        for _ in range(count):
+            self._index_node(current_node)
+            current_node = current_node.next
+
+        super()._splice_chain(head, tail, count, previous_node)
+
+
+    def _link(self, new_node, previous_node):
+        super()._link(new_node, previous_node)
+        self._index_node(new_node)
+
+
+    def _unlink(self, current_node):
+        super()._unlink(current_node)
+        self._unindex_node(current_node)
+
+
+    def _replace(self, node, value):
+        self._unindex_node(node)
+        super()._replace(node, value)
+        self._index_node(node)
+
+
+    def _index_node(self, node):
+        ''' Utility method adding <node> to the hash index '''
+
+        nodes = self.nodes_by_value.get(node.data)
+
+        if nodes is None:
+            self.nodes_by_value[node.data] = {node: None}
+
+        else:
+            nodes[node] = None
+
+
+    def _unindex_node(self, node):
+        ''' Utility method removing <node> from the hash index '''
+
+        nodes = self.nodes_by_value[node.data]
+        del nodes[node]
+
+        if not nodes:
+            del self.nodes_by_value[node.data]
+
+
+
+class SortedLinkedList:
+    ''' Sorted container keeping its elements in ascending order at all times.
+        It is built on top of <IndexedDoublyLinkedList>, a skip list over a
+        doubly linked chain of nodes, so adding, removing and searching for an
+        element take O(log n) time, while traversal in either direction still
+        takes O(1) time per step '''
+
+    def __init__(self, iterable=None, pool=None):
+        self.items = IndexedDoublyLinkedList(iterable, pool)
+        self.items.sort()
+
+
+    def __len__(self):
+        return len(self.items)
+
+
+    def __iter__(self):
+        return iter(self.items)
+
+
+    def __reversed__(self):
+        return reversed(self.items)
+
+
+    def __contains__(self, value):
+        ''' Return <True> if <value> is contained in the list in O(log n) time '''
+
+        return value in self.items
+
+
+    def __getitem__(self, index):
+        ''' Get the element at given <index> of the list in O(log n) time '''
+
+        return self.items[index]
+
+
+    def add(self, value):
+        ''' Add <value> to the list, after all elements equal to it, in
+            O(log n) time '''
+
+        self.items.insert_sorted(value)
+
+
+    def remove(self, value):
+        ''' Remove an element equal to <value> from the list in O(log n) time.
+            Raise <ValueError> if there is no such element '''
+
+        self.items.remove_by_value(value)
+
+
+    def discard(self, value):
+        ''' Remove an element equal to <value> from the list in O(log n) time,
+            if there is one '''
+
+        index = self.items.bisect_left(value)
+
+        if index < len(self.items) and self.items[index] == value:
+            self.items.remove_at_index(index)
+
+
+    def bisect_left(self, value):
+        ''' Return the index at which <value> would be inserted before all
+            elements equal to it, in O(log n) time '''
+
+        return self.items.bisect_left(value)
+
+
+    def bisect_right(self, value):
+        ''' Return the index at which <value> would be inserted after all
+            elements equal to it, in O(log n) time '''
+
+        return self.items.bisect_right(value)
+
+
+    def irange(self, minimum=None, maximum=None, inclusive=(True, True), reverse=False):
+        ''' Lazily iterate over the elements between <minimum> and <maximum>.
+            Either bound can be <None> for an open range and <inclusive> tells
+            whether the bounds themselves are included. Locating the first
+            element takes O(log n) time and every further step O(1) time '''
+
+        if minimum is None:
+            start = 0
+
+        else:
+            start = self.bisect_left(minimum) if inclusive[0] else self.bisect_right(minimum)
+
+        if maximum is None:
+            stop = len(self.items)
+
+        else:
+            stop = self.bisect_right(maximum) if inclusive[1] else self.bisect_left(maximum)
+
+        return self._walk(start, stop, reverse)
+
+
+    def pop_min(self):
+        ''' Remove the smallest element of the list and return it '''
+
+        if len(self.items) == 0:
+            raise IndexError('pop from empty list')
+
+        return self.items.remove_at_beginning()
+
+
+    def pop_max(self):
+        ''' Remove the largest element of the list and return it '''
+
+        if len(self.items) == 0:
+            raise IndexError('pop from empty list')
+
+        return self.items.remove_at_end()
+
+
+    def _walk(self, start, stop, reverse):
+        ''' Utility method generating the elements with indices from <start>
+            up to (but not including) <stop>, walking along the chain of nodes '''
+
+        if start >= stop:
+            return
+
+        if reverse:
+            current_node = self.items.node_at(stop-1)
+
+            for _ in range(stop - start):
+                yield current_node.data
+                current_node = current_node.prev
+
+        else:
+            current_node = self.items.node_at(start)
+
+            for _ in range(stop - start):
+                yield current_node.data
+                current_node = current_node.next
+
+
+
+class UnrolledDoublyLinkedList:
+    ''' Unrolled variant of the Doubly Linked List ADT. Every node keeps a
+        block of up to <block_size> elements in a contiguous array, which cuts
+        the memory overhead per element and lets traversal work through whole
+        blocks instead of chasing a pointer for every element '''
+
+    def __init__(self, iterable=None, block_size=64):
+        if not (isinstance(block_size, int)):
+            raise TypeError('block size must be an integer')
+
+        if block_size < 2:
+            raise ValueError('block size must be at least 2')
 
-    def __init__(self, iterable=None):
         self.head = None
         self.tail = None
         self.length = 0
         self.is_sorted = False
+        self.block_size = block_size
 
         # Initialize a linked list to the elements of a given iterable object
 
@@ -345,43 +3372,42 @@ class AdvancedDoublyLinkedList:
         return self.length
 
 
-    def __iter__(self, reverse=False):
-        ''' Traverse throught the list one node at a time '''
-
-        current_node = self.head
-
-        while current_node is not None:
-            yield current_node.data
-            current_node = current_node.next
+    def __iter__(self):
+        ''' Traverse throught the list one block at a time. Elements within a
+            block are produced by the array iterator without Python-level
+            overhead '''
+
+        return itertools.chain.from_iterable(self._blocks())
 
 
     def __reversed__(self):
         ''' Traverse throught the list from the end to the beginning (in a
-            reverse order) one node at a time '''
-        
-        current_node = self.tail
-            
-        while current_node is not None:
-            yield current_node.data
-            current_node = current_node.prev
+            reverse order) one block at a time '''
+
+        return itertools.chain.from_iterable(map(reversed, self._blocks(reverse=True)))
 
 
     def __contains__(self, value):
-        ''' Return <True> if <value> is contained in at least one of the nodes
+        ''' Return <True> if <value> is contained in at least one of the blocks
             of linked list, otherwise return <False> '''
-        
+
         current_node = self.head
 
         while current_node is not None:
-            if current_node.data == value:
+            if value in current_node.items:
                 return True
 
-            else:
-                current_node = current_node.next
+            current_node = current_node.next
 
         return False
 
 
+    def __reduce__(self):
+        ''' Pickle the list as a flat list of its values '''
+
+        return (self.__class__, (list(self), self.block_size), {'is_sorted': self.is_sorted})
+
+
     def insert_at_beginning(self, value):
         ''' Insert <value> at the beginning of the list in O(1) time '''
 
@@ -393,9 +3419,10 @@ class AdvancedDoublyLinkedList:
 
         self.insert_at_index(self.length, value)
 
-    
+
     def insert_at_index(self, index, value):
-        ''' Insert <value> at given <index> of the list in O(n) time '''
+        ''' Insert <value> at given <index> of the list in O(n/block_size +
+            block_size) time '''
 
         if not (isinstance(index, int)):
             raise TypeError('list indices must be integers')
@@ -403,36 +3430,15 @@ class AdvancedDoublyLinkedList:
         if not (0 <= index <= self.length):
             raise IndexError('list index out of range')
 
-        new_node = DoublyLinkedNode(value)
-
-        if index == 0:
-            new_node.next = self.head
-            self.head = new_node
-
-            if self.length == 0:   # In case of empty list
-                self.tail = new_node
-
-            else:
-                self.head.next.prev = new_node
+        if self.length == 0:
+            self.head = self.tail = UnrolledNode([value])
 
         elif index == self.length:
-            new_node.prev = self.tail
-            self.tail.next = new_node
-            self.tail = new_node
+            self._insert_into_block(self.tail, len(self.tail.items), value)
 
         else:
-            current_node = self.head
-            position = 1
-
-            while position < index:   # Traverse to the correct position in the list
-                current_node = current_node.next
-                position += 1
-
-            next_node = current_node.next
-            next_node.prev = new_node
-            new_node.prev = current_node
-            current_node.next = new_node
-            new_node.next = next_node
+            current_node, offset = self._locate(index)
+            self._insert_into_block(current_node, offset, value)
 
         self.length += 1
         self.is_sorted = False
@@ -441,137 +3447,69 @@ class AdvancedDoublyLinkedList:
     def insert_sorted(self, value):
         ''' Insert <value> into the sorted list in the correct sorted position.
             If the list is currently not sorted, sort it '''
-        
-        if self.is_sorted:
-            new_node = DoublyLinkedNode(value)
-            previous_node = None
-            current_node = self.head
-
-            while current_node is not None:
-                if current_node.data <= new_node.data:
-                    previous_node = current_node
-                    current_node = current_node.next
 
-                else:
-                    break
-
-            next_node = current_node
-
-            if previous_node is None:
-                self.head = new_node
-
-            else:
-                previous_node.next = new_node
+        if not self.is_sorted:
+            self.insert_at_end(value)
+            self.sort()
+            return
 
-            new_node.next = next_node
-            new_node.prev = previous_node
+        if self.length == 0:
+            self.head = self.tail = UnrolledNode([value])
 
-            if next_node is None:
-                self.tail = new_node
+        else:
+            current_node = self.head
 
-            else:
-                next_node.prev = new_node
+            while current_node.next is not None and current_node.items[-1] <= value:   # Skip whole blocks
+                current_node = current_node.next
 
-        else:
-            self.insert_at_beginning(value)
-            self.sort()
+            offset = bisect.bisect_right(current_node.items, value)
+            self._insert_into_block(current_node, offset, value)
 
         self.length += 1
 
 
     def remove_at_beginning(self):
-        ''' Remove node from the beginning of the list and return <data> value
-            in O(1) time '''
-        
+        ''' Remove element from the beginning of the list and return it in
+            O(1) time '''
+
         return self.remove_at_index(0)
 
 
     def remove_at_end(self):
-        ''' Remove node from the end of the list and return <data> value in O(1)
-            time '''
-        
+        ''' Remove element from the end of the list and return it in O(1) time '''
+
         return self.remove_at_index(self.length-1)
 
 
     def remove_at_index(self, index):
-        ''' Remove node at given <index> of the list and return <data> value in
-            O(n) time. If the <index> points to the beginning or the end of the
-            list, remove the node in O(1) time '''
-        
+        ''' Remove element at given <index> of the list and return it in
+            O(n/block_size + block_size) time '''
+
         if not (isinstance(index, int)):
             raise TypeError('list indices must be integers')
 
         if not (0 <= index < self.length):
             raise IndexError('list index out of range')
 
-        if index == 0:
-            current_node = self.head
-            value = current_node.data
-            
-            if self.length == 1:
-                self.head = None
-                self.tail = None
-
-            else:
-                self.head = current_node.next
-                self.head.prev = None
-
-        elif index == (self.length-1):
-            current_node = self.tail
-            value = current_node.data
-            self.tail = current_node.prev
-            self.tail.next = None
+        if index == self.length-1:
+            current_node, offset = self.tail, len(self.tail.items)-1
 
         else:
-            i = 0
-            current_node = self.head
-
-            while i < index:   # Locate the node
-                current_node = current_node.next
-                i += 1
-
-            value = current_node.data
-        
-            previous_node = current_node.prev
-            next_node = current_node.next
-            previous_node.next = next_node
-            next_node.prev = previous_node
+            current_node, offset = self._locate(index)
 
-        self.length -= 1
-        return value
+        return self._remove_from_block(current_node, offset)
 
 
     def remove_by_value(self, value):
-        ''' Find a node by <data> value and remove it '''
+        ''' Find an element by value and remove it '''
 
         current_node = self.head
 
         while current_node is not None:
-            if current_node.data == value:
-                previous_node = current_node.prev
-                next_node = current_node.next
-                
-                if previous_node is None:
-                    self.head = next_node
-
-                    if next_node is None:
-                        self.tail = None
-
-                    else:
-                        next_node.prev = None
-
-                else:
-                    previous_node.next = next_node
-                    
-                    if next_node is None:
-                        self.tail = previous_node
-
-                    else:
-                        next_node.prev = previous_node
-
-                self.length -= 1
+            if value in current_node.items:
+                self._remove_from_block(current_node, current_node.items.index(value))
                 return
-            
+
             current_node = current_node.next
 
         raise ValueError('value not in list')
@@ -583,6 +3521,7 @@ class AdvancedDoublyLinkedList:
         current_node = self.head
 
         while current_node is not None:
+            current_node.items.reverse()
             current_node.next, current_node.prev = current_node.prev, current_node.next
             current_node = current_node.prev
 
@@ -591,7 +3530,7 @@ class AdvancedDoublyLinkedList:
 
 
     def delete(self):
-        ''' Delete all nodes of the list in O(1) time by setting head and tail
+        ''' Delete all blocks of the list in O(1) time by setting head and tail
             references to <None> '''
 
         self.head = None
@@ -600,107 +3539,380 @@ class AdvancedDoublyLinkedList:
         self.is_sorted = False
 
 
-    def sort(self, reverse=False):
-        ''' Sort the list using recursive merge sort algorithm '''
-        
-        if not self.is_sorted:
-            self.head = self._split(self.head, self.length)
-            self.is_sorted = True
+    def sort(self, key=None, reverse=False):
+        ''' Sort the list in O(n log n) time. The elements are gathered into a
+            single array, sorted there and written back into fully packed
+            blocks '''
 
-        if reverse:
-            self.reverse()
-            
-        else:   # Set the tail reference of the list as the final step in sorting procedure
-            self.tail = None
+        if self.is_sorted and key is None and not reverse:
+            return
+
+        values = list(self)
+        values.sort(key=key, reverse=reverse)
+
+        self.head = None
+        self.tail = None
+        previous_node = None
+
+        for start in range(0, len(values), self.block_size):
+            current_node = UnrolledNode(values[start:start+self.block_size])
+            current_node.prev = previous_node
+
+            if previous_node is None:
+                self.head = current_node
+
+            else:
+                previous_node.next = current_node
+
+            previous_node = current_node
+
+        self.tail = previous_node
+        self.is_sorted = key is None and not reverse
+
+
+    def _blocks(self, reverse=False):
+        ''' Utility method traversing the list one block at a time and
+            producing the array of elements of every block '''
+
+        current_node = self.tail if reverse else self.head
+
+        while current_node is not None:
+            yield current_node.items
+            current_node = current_node.prev if reverse else current_node.next
+
+
+    def _locate(self, index):
+        ''' Utility method returning the block holding the element at given
+            <index> and the offset of that element within the block. The search
+            starts from whichever end of the list is closer to <index> '''
+
+        if index < self.length // 2:
             current_node = self.head
-            
-            while current_node is not None:
-                if current_node.next is None:
-                    self.tail = current_node
-                
+
+            while index >= len(current_node.items):
+                index -= len(current_node.items)
                 current_node = current_node.next
 
+            return current_node, index
 
-    def _merge(self, sorted_left, sorted_right):
-        ''' Utility method for merging two sorted lists into one for merge sort '''
-        
-        result_head = None
-        result_tail = None
+        index = self.length - index   # Position counted from the end of the list
+        current_node = self.tail
 
-        left_node = sorted_left
-        right_node = sorted_right
+        while index > len(current_node.items):
+            index -= len(current_node.items)
+            current_node = current_node.prev
 
-        while left_node and right_node:
-            if left_node.data <= right_node.data:
-                smaller_node = left_node
-                left_node = left_node.next
+        return current_node, len(current_node.items) - index
 
-            else:
-                smaller_node = right_node
-                right_node = right_node.next
 
-            if result_head is None:   # Very first node is being assigned
-                result_head = smaller_node
-                result_tail = smaller_node
+    def _insert_into_block(self, current_node, offset, value):
+        ''' Utility method inserting <value> at <offset> of the block held by
+            <current_node>. A full block is split in half, unless the value is
+            being appended to either end of it, in which case a new block is
+            started instead '''
 
-            else:
-                result_tail.next = smaller_node
-                smaller_node.prev = result_tail
-                result_tail = smaller_node
+        items = current_node.items
 
-        while left_node:
-            if result_head is None:
-                result_head = left_node
-                result_tail = left_node
+        if len(items) < self.block_size:
+            items.insert(offset, value)
+
+        elif offset == len(items) and (current_node.next is None or len(current_node.next.items) == self.block_size):
+            self._link_block(UnrolledNode([value]), current_node)
+
+        elif offset == 0 and (current_node.prev is None or len(current_node.prev.items) == self.block_size):
+            self._link_block(UnrolledNode([value]), current_node.prev)
+
+        elif offset == len(items):
+            current_node.next.items.insert(0, value)
+
+        elif offset == 0:
+            current_node.prev.items.append(value)
+
+        else:
+            middle = len(items) // 2
+            new_node = UnrolledNode(items[middle:])
+            del items[middle:]
+            self._link_block(new_node, current_node)
+
+            if offset <= middle:
+                items.insert(offset, value)
 
             else:
-                result_tail.next = left_node
-                left_node.prev = result_tail
-                result_tail = left_node
+                new_node.items.insert(offset - middle, value)
+
+
+    def _remove_from_block(self, current_node, offset):
+        ''' Utility method removing the element at <offset> of the block held
+            by <current_node> and returning it. An emptied block is unlinked and
+            a block that drops below half of its capacity is merged with the
+            next one if their elements fit into a single block '''
+
+        items = current_node.items
+        value = items.pop(offset)
+        self.length -= 1
+
+        if not items:
+            self._unlink_block(current_node)
+
+        elif len(items) < self.block_size // 2:
+            next_node = current_node.next
+
+            if next_node is not None and len(items) + len(next_node.items) <= self.block_size:
+                items.extend(next_node.items)
+                self._unlink_block(next_node)
+
+        return value
+
+
+    def _link_block(self, new_node, previous_node):
+        ''' Utility method linking <new_node> right after <previous_node>, or
+            at the very beginning of the list if <previous_node> is <None> '''
+
+        if previous_node is None:
+            next_node = self.head
+            self.head = new_node
+
+        else:
+            next_node = previous_node.next
+            previous_node.next = new_node
+
+        new_node.prev = previous_node
+        new_node.next = next_node
+
+        if next_node is None:
+            self.tail = new_node
+
+        else:
+            next_node.prev = new_node
+
+
+    def _unlink_block(self, current_node):
+        ''' Utility method unlinking <current_node> from the chain of blocks '''
+
+        previous_node = current_node.prev
+        next_node = current_node.next
+
+        if previous_node is None:
+            self.head = next_node
+
+        else:
+            previous_node.next = next_node
+
+        if next_node is None:
+            self.tail = previous_node
+
+        else:
+            next_node.prev = previous_node
+
+
+
+def _sorted_set_operation(left, right, family, in_left_only, in_both, in_right_only, consume):
+    ''' Utility function building the new list of a set operation on the lists
+        <left> and <right>, which uses the pool of <left>. Which values are
+        kept is told by <in_left_only>, <in_both> and <in_right_only>. The
+        values of the kept nodes are copied into new nodes, unless <consume>
+        is set: then both lists are sorted and consumed, the kept nodes are
+        moved into the new list, the dropped ones are released to the pool of
+        the list they came from and both lists are left empty '''
+
+    if not isinstance(right, family):
+        raise TypeError(f'other must be a {family.__name__}')
 
+    result = type(left)(pool=left.pool)
+
+    if not consume:
+        left_head = _sorted_head(left, family)
+        right_head = left_head if right is left else _sorted_head(right, family)
+
+        for current_node in _sorted_set_walk(left_head, right_head, in_left_only, in_both, in_right_only):
+            result._link(result._new_node(current_node.data), result.tail)
+
+        result.is_sorted = True
+
+        return result
+
+    if right is left:
+        raise ValueError('cannot combine a list with itself')
+
+    left.sort()
+    right.sort()
+
+    left_head, right_head = left.head, right.head
+    left._clear()
+    right._clear()
+
+    left_release = None if left.pool is None else left.pool.release
+    right_release = None if right.pool is None else right.pool.release
+
+    for current_node in _sorted_set_walk(left_head, right_head, in_left_only, in_both, in_right_only,
+                                         left_release, right_release):
+        result._link(current_node, result.tail)
+
+    result.is_sorted = True
+
+    return result
+
+
+def _sorted_head(linked_list, family):
+    ''' Utility function returning the first node of the chain of
+        <linked_list> if it is sorted, otherwise of a sorted temporary copy of
+        it, which leaves <linked_list> unchanged '''
+
+    if linked_list.is_sorted:
+        return linked_list.head
+
+    sorted_copy = family(linked_list)
+    sorted_copy.sort()
+
+    return sorted_copy.head
+
+
+def _sorted_set_walk(left_node, right_node, in_left_only, in_both, in_right_only, left_release=None, right_release=None):
+    ''' Utility function walking two sorted chains of nodes (<right_node> may
+        be <None>) side by side and generating, for every distinct value that
+        is kept, the first node holding it, from the left chain if both hold
+        it. The other nodes are given to <left_release> or <right_release>,
+        depending on their chain, if it is not <None>. Every node is left
+        before it is generated, so the caller may relink it '''
+
+    while left_node is not None or right_node is not None:
+        if right_node is None or (left_node is not None and not right_node.data < left_node.data):
+            value = left_node.data
+
+        else:
+            value = right_node.data
+
+        first_node = None
+        first_release = None
+        in_left = in_right = False
+
+        while left_node is not None and not value < left_node.data:
+            current_node = left_node
             left_node = left_node.next
+            in_left = True
 
-        while right_node:
-            if result_head is None:
-                result_head = right_node
-                result_tail = right_node
+            if first_node is None:
+                first_node = current_node
+                first_release = left_release
 
-            else:
-                result_tail.next = right_node
-                right_node.prev = result_tail
-                result_tail = right_node
+            elif left_release is not None:
+                left_release(current_node)
 
+        while right_node is not None and not value < right_node.data:
+            current_node = right_node
             right_node = right_node.next
-        
-        return result_head
+            in_right = True
 
+            if first_node is None:
+                first_node = current_node
+                first_release = right_release
 
-    def _split(self, head, length):
-        ''' Utility method for splitting the list in half for merge sort '''
-        
-        if length <= 1:
-            return head
+            elif right_release is not None:
+                right_release(current_node)
 
-        else:
-            unsorted_left = head
-            unsorted_right = head
-            
-            middle = length // 2
-            left_length = length // 2
-            right_length = (length // 2) +  (length % 2)
+        if in_both if in_left and in_right else in_left_only if in_left else in_right_only:
+            yield first_node
 
-            position = 1
+        elif first_release is not None:
+            first_release(first_node)
 
-            while position <= middle:
-                unsorted_right = unsorted_right.next
-                position += 1
 
-            previous_node = unsorted_right.prev
-            previous_node.next = None
-            unsorted_right.prev = None
+def _sorted_chunks(head, length, workers, reverse):
+    ''' Utility function splitting the chain of <length> nodes starting at
+        <head> into <workers> chunks, sorting their values in a process pool
+        and returning the nodes of every chunk as a list in sorted order '''
+
+    chunk_size = -(-length // workers)
+    node_chunks = []
+    value_chunks = []
+    current_node = head
+
+    while current_node is not None:
+        nodes = []
+        values = []
+
+        for _ in range(chunk_size):
+            if current_node is None:
+                break
+
+            nodes.append(current_node)
+            values.append(current_node.data)
+            current_node = current_node.next
+
+        node_chunks.append(nodes)
+        value_chunks.append(values)
+
+    with ProcessPoolExecutor(len(value_chunks)) as executor:
+        orders = executor.map(_sorting_order, value_chunks, itertools.repeat(reverse))
+
+        return [[nodes[i] for i in order] for nodes, order in zip(node_chunks, orders)]
+
+
+def _sorting_order(values, reverse):
+    ''' Utility function run in a worker process, returning the indices of
+        <values> in stable sorted order as a compact array '''
+
+    return array.array('q', sorted(range(len(values)), key=values.__getitem__, reverse=reverse))
+
+
+def _membership(values):
+    ''' Utility function returning a predicate telling if a value is one of
+        <values>, checked in a set if they are all hashable. Unhashable
+        values probed against the set are compared with <values> one by one '''
+
+    values = list(values)
+
+    try:
+        hashed_values = set(values)
+
+    except TypeError:
+        return values.__contains__
+
+    def contains(value):
+        try:
+            return value in hashed_values
+
+        except TypeError:   # Unhashable payload
+            return value in values
+
+    return contains
+
+
+def _pack_values(values, typecode):
+    ''' Pack <values> into the <to_bytes> format: a header with the <array>
+        <typecode>, item size and byte order, then the values in the native
+        byte order '''
+
+    packed = array.array(typecode, values)
+    return BUFFER_HEADER.pack(BUFFER_MAGIC, typecode.encode('ascii'), packed.itemsize, BYTE_ORDER) + packed.tobytes()
+
+
+def _unpack_buffer(buffer):
+    ''' Return a memoryview of the values of a buffer in the <to_bytes>
+        format, cast to their type without copying them. Values packed in the
+        other byte order are copied and byte-swapped instead '''
+
+    view = memoryview(buffer).cast('B')
+
+    if len(view) < BUFFER_HEADER.size:
+        raise ValueError('buffer is too short')
+
+    magic, typecode, itemsize, byte_order = BUFFER_HEADER.unpack_from(view)
+    typecode = typecode.decode('ascii')
+
+    if magic != BUFFER_MAGIC:
+        raise ValueError('buffer does not hold packed list values')
+
+    if array.array(typecode).itemsize != itemsize:
+        raise ValueError('buffer was packed with a different item size')
 
-            sorted_left = self._split(unsorted_left, left_length)
-            sorted_right = self._split(unsorted_right, right_length)
+    if byte_order not in (b'<', b'>'):
+        raise ValueError('buffer has an unknown byte order')
 
-            return self._merge(sorted_left, sorted_right)
+    if byte_order != BYTE_ORDER:
+        values = array.array(typecode)
+        values.frombytes(view[BUFFER_HEADER.size:])
+        values.byteswap()
+        return memoryview(values)
 
+    return view[BUFFER_HEADER.size:].cast(typecode)
@@ -0,0 +1,455 @@
+import mmap
+import os
+import struct
+
+from caches import LRUCache
+from compact_linked_lists import NIL
+
+
+
+MAGIC = b'MDLL'
+VERSION = 1
+
+HEADER = struct.Struct('<4sIIqqqqq')   # Magic, version, payload size, head, tail, length, free list head, slot count
+HEADER_SIZE = 64
+LINK = struct.Struct('<q')
+NEXT_OFFSET = 0
+PREV_OFFSET = 8
+
+
+
+class MappedDoublyLinkedList:
+    ''' Implementation of the Doubly Linked List abstract data type (ADT) kept
+        in a memory-mapped file, for sequences that do not fit in memory. The
+        file holds a header followed by fixed-size node records:
+
+            next slot (8 bytes), previous slot (8 bytes),
+            payload length (4 bytes), payload (<payload_size> bytes)
+
+        A node is identified by its slot (the index of its record), links hold
+        slot numbers (the record of slot s starts at file offset
+        64 + s * record size) and records of removed nodes are chained into a
+        free list through their next links, so they are reused and the free
+        list survives a restart. Payloads are bytes-like objects of at most
+        <payload_size> bytes and are returned as <bytes>.
+
+        Iteration decodes a whole page of records with one call and keeps the
+        decoded pages in a small LRU page cache of <cache_pages> pages, so a
+        sequential walk does not go through the file one record at a time.
+
+        <path> is opened if it exists and created otherwise, <payload_size>
+        only applies to a new file. Changes are written to the mapping
+        directly, and <flush> (or <close>) writes the header and makes the
+        whole list durable. The list must not be changed while it is being
+        iterated '''
+
+    def __init__(self, path, payload_size=64, cache_pages=64):
+        if payload_size <= 0:
+            raise ValueError('payload_size must be positive')
+
+        self.path = path
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        self.file = open(path, 'r+b' if exists else 'w+b')
+
+        if exists:
+            if os.fstat(self.file.fileno()).st_size < HEADER_SIZE:
+                self.file.close()
+                raise ValueError('not a mapped linked list file')
+
+            self.map = mmap.mmap(self.file.fileno(), 0)
+            magic, version, payload_size, head, tail, length, free_head, slot_count = HEADER.unpack_from(self.map, 0)
+
+            if magic != MAGIC or version != VERSION:
+                self.map.close()   # Not <close>, which would write a header over the file
+                self.file.close()
+                raise ValueError('not a mapped linked list file')
+
+        else:
+            head = tail = free_head = NIL
+            length = slot_count = 0
+
+        self.payload_size = payload_size
+        self.record = struct.Struct(f'<qqI{payload_size}s')
+        self.record_size = self.record.size
+        self.records_per_page = max(1, mmap.PAGESIZE // self.record_size)
+
+        self.head = head
+        self.tail = tail
+        self.length = length
+        self.free_head = free_head   # First slot of the free list, <NIL> if no slot is free
+        self.slot_count = slot_count   # Count of slots ever used, free ones included
+
+        if exists:
+            self.capacity = (len(self.map) - HEADER_SIZE) // self.record_size
+
+        else:
+            self.map = None
+            self.capacity = 0
+            self._grow(self.records_per_page)
+            self.flush()
+
+        self.pages = LRUCache(cache_pages)   # Page number -> list of decoded records
+
+
+    @classmethod
+    def open(cls, path, cache_pages=64):
+        ''' Open an existing list file, raise <FileNotFoundError> if there is none '''
+
+        if not os.path.exists(path):
+            raise FileNotFoundError(path)
+
+        return cls(path, cache_pages=cache_pages)
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+    def __len__(self):
+        return self.length
+
+
+    def __iter__(self):
+        ''' Traverse throught the list one node at a time '''
+
+        return self._walk(self.head, NEXT_OFFSET)
+
+
+    def __reversed__(self):
+        ''' Traverse throught the list from the end to the beginning (in a
+            reverse order) one node at a time '''
+
+        return self._walk(self.tail, PREV_OFFSET)
+
+
+    def __contains__(self, value):
+        ''' Return <True> if <value> is contained in at least one of the nodes
+            of linked list, otherwise return <False> '''
+
+        return any(stored_value == value for stored_value in self)
+
+
+    def __getitem__(self, index):
+        ''' Get the value at given <index> of the list in O(n) time '''
+
+        return self._read_value(self.node_at(index))
+
+
+    def flush(self):
+        ''' Write the header and all changes to the file '''
+
+        HEADER.pack_into(self.map, 0, MAGIC, VERSION, self.payload_size, self.head, self.tail,
+                         self.length, self.free_head, self.slot_count)
+        self.map.flush()
+
+
+    def close(self):
+        ''' Flush the list and close its file. The list cannot be used afterwards '''
+
+        if self.map is not None and not self.map.closed:
+            if len(self.map) >= HEADER_SIZE:
+                self.flush()
+
+            self.map.close()
+
+        self.file.close()
+
+
+    def insert_at_beginning(self, value):
+        ''' Insert <value> at the beginning of the list in O(1) time and return
+            the slot of the new node '''
+
+        return self.insert_after(NIL, value)
+
+
+    def insert_at_end(self, value):
+        ''' Insert <value> at the end of the list in O(1) time and return the
+            slot of the new node '''
+
+        return self.insert_after(self.tail, value)
+
+
+    def insert_after(self, slot, value):
+        ''' Insert <value> right after the node in <slot> (at the very beginning
+            of the list if <slot> is <NIL>) in O(1) time and return the slot of
+            the new node '''
+
+        payload = self._payload(value)
+        new_slot = self._new_slot()
+
+        if slot == NIL:
+            next_slot = self.head
+            self.head = new_slot
+
+        else:
+            next_slot = self._read_link(slot, NEXT_OFFSET)
+            self._write_link(slot, NEXT_OFFSET, new_slot)
+
+        if next_slot == NIL:
+            self.tail = new_slot
+
+        else:
+            self._write_link(next_slot, PREV_OFFSET, new_slot)
+
+        self._write_record(new_slot, next_slot, slot, payload)
+        self.length += 1
+
+        return new_slot
+
+
+    def extend(self, iterable):
+        ''' Insert all elements of <iterable> at the end of the list in O(k)
+            time. The new nodes get consecutive new slots and their records are
+            written to the file as one block '''
+
+        payloads = [self._payload(value) for value in iterable]
+        count = len(payloads)
+
+        if not count:
+            return
+
+        first_slot = self.slot_count
+        last_slot = first_slot + count - 1
+
+        if last_slot >= self.capacity:
+            self._grow(max(self.capacity * 2, last_slot + 1))
+
+        pack = self.record.pack
+        records = [pack(slot + 1, slot - 1, len(payload), payload) for slot, payload in enumerate(payloads, first_slot)]
+        records[0] = pack(first_slot + 1, self.tail, len(payloads[0]), payloads[0])
+        records[-1] = pack(NIL, last_slot - 1 if count > 1 else self.tail, len(payloads[-1]), payloads[-1])
+
+        start = HEADER_SIZE + first_slot * self.record_size
+        self.map[start:start + count * self.record_size] = b''.join(records)
+
+        for page_number in range(first_slot // self.records_per_page, last_slot // self.records_per_page + 1):
+            if page_number in self.pages:
+                self.pages.remove(page_number)
+
+        if self.tail == NIL:
+            self.head = first_slot
+
+        else:
+            self._write_link(self.tail, NEXT_OFFSET, first_slot)
+
+        self.tail = last_slot
+        self.slot_count += count
+        self.length += count
+
+
+    def remove_at_beginning(self):
+        ''' Remove node from the beginning of the list and return <data> value
+            in O(1) time '''
+
+        if self.head == NIL:
+            raise IndexError('list index out of range')
+
+        return self.remove_node(self.head)
+
+
+    def remove_at_end(self):
+        ''' Remove node from the end of the list and return <data> value in O(1)
+            time '''
+
+        if self.tail == NIL:
+            raise IndexError('list index out of range')
+
+        return self.remove_node(self.tail)
+
+
+    def remove_by_value(self, value):
+        ''' Find the first node holding <value> and remove it in O(n) time '''
+
+        slot = self.head
+
+        while slot != NIL:
+            if self._read_value(slot) == value:
+                self.remove_node(slot)
+                return
+
+            slot = self._read_link(slot, NEXT_OFFSET)
+
+        raise ValueError('value not in list')
+
+
+    def remove_node(self, slot):
+        ''' Remove the node in <slot> and return its value in O(1) time. The
+            slot goes to the free list '''
+
+        value = self._read_value(slot)
+        previous_slot = self._read_link(slot, PREV_OFFSET)
+        next_slot = self._read_link(slot, NEXT_OFFSET)
+
+        if previous_slot == NIL:
+            self.head = next_slot
+
+        else:
+            self._write_link(previous_slot, NEXT_OFFSET, next_slot)
+
+        if next_slot == NIL:
+            self.tail = previous_slot
+
+        else:
+            self._write_link(next_slot, PREV_OFFSET, previous_slot)
+
+        self._write_record(slot, self.free_head, NIL, b'')
+        self.free_head = slot
+        self.length -= 1
+
+        return value
+
+
+    def node_at(self, index):
+        ''' Return the slot of the node at given <index> of the list, walking
+            from whichever end of the list is closer to it '''
+
+        if not (isinstance(index, int)):
+            raise TypeError('list indices must be integers')
+
+        if index < 0:
+            index += self.length
+
+        if not (0 <= index < self.length):
+            raise IndexError('list index out of range')
+
+        if index < self.length // 2:
+            slot, offset, steps = self.head, NEXT_OFFSET, index
+
+        else:
+            slot, offset, steps = self.tail, PREV_OFFSET, self.length - 1 - index
+
+        for _ in range(steps):
+            slot = self._read_link(slot, offset)
+
+        return slot
+
+
+    def delete(self):
+        ''' Remove all nodes and shrink the file back to one page of records '''
+
+        self.head = self.tail = self.free_head = NIL
+        self.length = self.slot_count = 0
+        self.pages.clear()
+
+        self.map.close()
+        self.file.truncate(HEADER_SIZE)
+        self.map = None
+        self.capacity = 0
+        self._grow(self.records_per_page)
+        self.flush()
+
+
+    def _walk(self, slot, offset):
+        ''' Utility method generating the values from <slot> onwards, following
+            the next (<NEXT_OFFSET>) or previous (<PREV_OFFSET>) links.
+            Consecutive records of one page are read from the same decoded
+            page '''
+
+        link = 0 if offset == NEXT_OFFSET else 1
+        records_per_page = self.records_per_page
+        first_slot = last_slot = 0   # Slots of the decoded page are first_slot <= slot < last_slot
+        page = None
+
+        while slot != NIL:
+            if not (first_slot <= slot < last_slot):
+                page_number = slot // records_per_page
+                page = self._page(page_number)
+                first_slot = page_number * records_per_page
+                last_slot = first_slot + len(page)
+
+            record = page[slot - first_slot]
+            yield record[3][:record[2]]
+            slot = record[link]
+
+
+    def _page(self, page_number):
+        ''' Utility method returning the decoded records of a page, from the
+            page cache if it is there '''
+
+        page = self.pages.get(page_number)
+
+        if page is None:
+            first_slot = page_number * self.records_per_page
+            last_slot = min(first_slot + self.records_per_page, self.slot_count)
+            start = HEADER_SIZE + first_slot * self.record_size
+            page = list(self.record.iter_unpack(self.map[start:start + (last_slot - first_slot) * self.record_size]))
+            self.pages.put(page_number, page)
+
+        return page
+
+
+    def _invalidate(self, slot):
+        ''' Utility method dropping the page of <slot> from the page cache '''
+
+        page_number = slot // self.records_per_page
+
+        if page_number in self.pages:
+            self.pages.remove(page_number)
+
+
+    def _payload(self, value):
+        ''' Utility method validating <value> and returning it as <bytes> '''
+
+        try:
+            payload = bytes(memoryview(value))
+
+        except TypeError:
+            raise TypeError('payload must be a bytes-like object') from None
+
+        if len(payload) > self.payload_size:
+            raise ValueError('payload longer than payload_size')
+
+        return payload
+
+
+    def _new_slot(self):
+        ''' Utility method taking a slot from the free list, or a new one at the
+            end of the file if none is free '''
+
+        if self.free_head != NIL:
+            slot = self.free_head
+            self.free_head = self._read_link(slot, NEXT_OFFSET)
+
+        else:
+            if self.slot_count == self.capacity:
+                self._grow(self.capacity * 2)
+
+            slot = self.slot_count
+            self.slot_count += 1
+
+        return slot
+
+
+    def _grow(self, capacity):
+        ''' Utility method resizing the file to hold <capacity> records and
+            mapping it again '''
+
+        if self.map is not None:
+            self.map.close()
+
+        self.file.truncate(HEADER_SIZE + capacity * self.record_size)
+        self.map = mmap.mmap(self.file.fileno(), 0)
+        self.capacity = capacity
+
+
+    def _read_link(self, slot, offset):
+        return LINK.unpack_from(self.map, HEADER_SIZE + slot * self.record_size + offset)[0]
+
+
+    def _read_value(self, slot):
+        _, _, size, payload = self.record.unpack_from(self.map, HEADER_SIZE + slot * self.record_size)
+        return payload[:size]
+
+
+    def _write_link(self, slot, offset, target_slot):
+        LINK.pack_into(self.map, HEADER_SIZE + slot * self.record_size + offset, target_slot)
+        self._invalidate(slot)
+
+
+    def _write_record(self, slot, next_slot, previous_slot, payload):
+        self.record.pack_into(self.map, HEADER_SIZE + slot * self.record_size, next_slot, previous_slot, len(payload), payload)
+        self._invalidate(slot)
@@ -0,0 +1,303 @@
+import queue
+
+
+
+ON_FULL_POLICIES = ('reject', 'overwrite', 'grow')
+
+
+
+class RingBufferDeque:
+    ''' Implementation of the Double-ended Queue abstract data type (ADT) in a
+        circular buffer: a fixed-size array whose occupied part starts at
+        <head> and wraps around its end. Operations at both ends take O(1)
+        time and allocate nothing, so memory stays flat under steady churn.
+
+        <push> adds to the end and <pop> removes from the beginning, so used
+        with these two it is a FIFO queue. <push_front> and <pop_back> work on
+        the other ends. <put_many> and <get_many> copy whole contiguous
+        segments of the buffer (at most two, the second one after the wrap)
+        with slice assignment instead of one element at a time.
+
+        <on_full> tells what adding to a full deque does:
+
+            'reject'    -- raise <queue.Full>, leaving the deque unchanged
+            'overwrite' -- drop elements from the other end to make room, so
+                           the deque keeps the latest <capacity> elements
+            'grow'      -- double the capacity (the buffer never shrinks) '''
+
+    def __init__(self, capacity=16, on_full='reject', iterable=None):
+        if not (isinstance(capacity, int)):
+            raise TypeError('capacity must be an integer')
+
+        if capacity <= 0:
+            raise ValueError('capacity must be positive')
+
+        if on_full not in ON_FULL_POLICIES:
+            raise ValueError("on_full must be either 'reject', 'overwrite' or 'grow'")
+
+        self.buffer = [None] * capacity
+        self.capacity = capacity
+        self.on_full = on_full
+        self.head = 0   # Index of the first element in the buffer
+        self.length = 0
+
+        if iterable is not None:
+            self.put_many(iterable)
+
+
+    def __len__(self):
+        return self.length
+
+
+    def __iter__(self):
+        ''' Traverse throught the deque from the beginning to the end '''
+
+        buffer = self.buffer
+        capacity = self.capacity
+        index = self.head
+
+        for _ in range(self.length):
+            yield buffer[index]
+            index += 1
+
+            if index == capacity:
+                index = 0
+
+
+    def __getitem__(self, index):
+        ''' Get the element at given <index> of the deque in O(1) time '''
+
+        return self.buffer[self._buffer_index(index)]
+
+
+    def __setitem__(self, index, value):
+        ''' Replace the element at given <index> of the deque in O(1) time '''
+
+        self.buffer[self._buffer_index(index)] = value
+
+
+    def is_empty(self):
+        return self.length == 0
+
+
+    def is_full(self):
+        return self.length == self.capacity
+
+
+    def push(self, val):
+        ''' Add an element to the end of the deque in O(1) time (amortized
+            O(1) time when growing) '''
+
+        if self.length == self.capacity and not self._make_room(at_end=True):
+            raise queue.Full
+
+        index = self.head + self.length
+
+        if index >= self.capacity:
+            index -= self.capacity
+
+        self.buffer[index] = val
+        self.length += 1
+
+
+    def push_front(self, val):
+        ''' Add an element to the beginning of the deque in O(1) time
+            (amortized O(1) time when growing) '''
+
+        if self.length == self.capacity and not self._make_room(at_end=False):
+            raise queue.Full
+
+        self.head = self.head - 1 if self.head else self.capacity - 1
+        self.buffer[self.head] = val
+        self.length += 1
+
+
+    def pop(self):
+        ''' Remove and return the first element of the deque in O(1) time '''
+
+        if self.length == 0:
+            raise IndexError('pop from empty deque')
+
+        head = self.head
+        val = self.buffer[head]
+        self.buffer[head] = None   # Do not keep the element alive from the buffer
+        self.head = head + 1 if head + 1 < self.capacity else 0
+        self.length -= 1
+
+        return val
+
+
+    def pop_back(self):
+        ''' Remove and return the last element of the deque in O(1) time '''
+
+        if self.length == 0:
+            raise IndexError('pop from empty deque')
+
+        index = self.head + self.length - 1
+
+        if index >= self.capacity:
+            index -= self.capacity
+
+        val = self.buffer[index]
+        self.buffer[index] = None
+        self.length -= 1
+
+        return val
+
+
+    def peek(self):
+        ''' Get the first element without removing it, <None> if the deque is
+            empty '''
+
+        return self.buffer[self.head] if self.length else None
+
+
+    def peek_back(self):
+        ''' Get the last element without removing it, <None> if the deque is
+            empty '''
+
+        return self.buffer[self._buffer_index(-1)] if self.length else None
+
+
+    def put_many(self, iterable):
+        ''' Add all elements of <iterable> to the end of the deque in O(k) time,
+            copying them into at most two contiguous segments of the buffer.
+            With the 'reject' policy nothing is added if they do not all fit '''
+
+        values = iterable if isinstance(iterable, list) else list(iterable)
+        count = len(values)
+
+        if count > self.capacity - self.length:
+            if self.on_full == 'reject':
+                raise queue.Full
+
+            if self.on_full == 'grow':
+                self._resize(max(self.capacity * 2, self.length + count))
+
+            else:   # Overwrite, only the latest <capacity> elements survive
+                if count >= self.capacity:
+                    values = values[count - self.capacity:]
+                    count = self.capacity
+                    self.clear()
+
+                else:
+                    self._drop_front(self.length + count - self.capacity)
+
+        buffer = self.buffer
+        start = self.head + self.length
+
+        if start >= self.capacity:
+            start -= self.capacity
+
+        first_count = min(count, self.capacity - start)   # Elements fitting before the end of the buffer
+        buffer[start:start + first_count] = values[:first_count]
+        buffer[:count - first_count] = values[first_count:]
+        self.length += count
+
+
+    def get_many(self, n):
+        ''' Remove up to <n> elements from the beginning of the deque in O(n)
+            time and return them as a list, copying at most two contiguous
+            segments of the buffer '''
+
+        if not (isinstance(n, int)):
+            raise TypeError('count must be an integer')
+
+        if n < 0:
+            raise ValueError('count must be non-negative')
+
+        count = min(n, self.length)
+        values = self._segments(count)
+        self._drop_front(count)
+
+        return values
+
+
+    def clear(self):
+        ''' Remove all elements in O(capacity) time, keeping the buffer '''
+
+        self.buffer[:] = [None] * self.capacity
+        self.head = 0
+        self.length = 0
+
+
+    def _buffer_index(self, index):
+        ''' Utility method validating <index> of the deque and returning the
+            index of its element in the buffer '''
+
+        if not (isinstance(index, int)):
+            raise TypeError('deque indices must be integers')
+
+        if index < 0:
+            index += self.length
+
+        if not (0 <= index < self.length):
+            raise IndexError('deque index out of range')
+
+        index += self.head
+
+        return index - self.capacity if index >= self.capacity else index
+
+
+    def _segments(self, count):
+        ''' Utility method returning the first <count> elements as a list '''
+
+        head = self.head
+        end = head + count
+
+        if end <= self.capacity:
+            return self.buffer[head:end]
+
+        return self.buffer[head:] + self.buffer[:end - self.capacity]
+
+
+    def _drop_front(self, count):
+        ''' Utility method removing the first <count> elements, clearing their
+            slots segment by segment '''
+
+        head = self.head
+        end = head + count
+
+        if end <= self.capacity:
+            self.buffer[head:end] = [None] * count
+
+        else:
+            self.buffer[head:] = [None] * (self.capacity - head)
+            end -= self.capacity
+            self.buffer[:end] = [None] * end
+
+        self.head = end if end < self.capacity else 0
+        self.length -= count
+
+        if self.length == 0:
+            self.head = 0
+
+
+    def _make_room(self, at_end):
+        ''' Utility method applying the full policy before adding one element
+            at the end (<at_end>) or at the beginning of a full deque. Return
+            <False> if the element must be rejected '''
+
+        if self.on_full == 'reject':
+            return False
+
+        if self.on_full == 'grow':
+            self._resize(self.capacity * 2)
+
+        elif at_end:
+            self._drop_front(1)
+
+        else:
+            self.pop_back()
+
+        return True
+
+
+    def _resize(self, capacity):
+        ''' Utility method moving the elements to a new buffer of <capacity>
+            slots, the first element at its beginning '''
+
+        values = self._segments(self.length)
+        self.buffer = values + [None] * (capacity - self.length)
+        self.capacity = capacity
+        self.head = 0
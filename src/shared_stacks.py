@@ -0,0 +1,304 @@
+import array
+import multiprocessing
+import queue
+import struct
+from multiprocessing import shared_memory
+
+from compact_linked_lists import NIL
+
+
+
+MAGIC = b'SHLL'
+VERSION = 1
+
+HEADER = struct.Struct('<4sIqqB')   # Magic, version, capacity, payload size, kind
+HEADER_SIZE = 64
+FIELDS_OFFSET = 32   # Head, tail, length and free list head as 64-bit integers
+
+HEAD = 0
+TAIL = 1
+LENGTH = 2
+FREE_HEAD = 3
+
+
+
+class SharedBuffer:
+    ''' Common part of <SharedStack> and <SharedQueue>: a linked list of
+        fixed-size records kept in a <multiprocessing.shared_memory> block, so
+        several processes push and pop bytes without pickling them through a
+        manager process. The block is laid out as a "struct of arrays", like
+        <CompactDoublyLinkedList>:
+
+            header (64 bytes): magic, version, capacity, payload size,
+                               kind (stack or queue), head, tail, length
+                               and free list head slots
+            links:    <capacity> 64-bit slot numbers (<NIL> for none)
+            sizes:    <capacity> 32-bit payload lengths
+            payloads: <capacity> records of <payload_size> bytes
+
+        Every node is a slot, links hold slot numbers and free slots are
+        chained into a free list, so the block never grows: pushing to a full
+        buffer raises <queue.Full>. All state lives in the block and every
+        operation runs under one process-shared lock; <push_many> and
+        <pop_many> take it once for a whole batch.
+
+        The creating process owns the block and should <unlink> it when done.
+        Other processes get the buffer as an argument of <Process> or of a
+        <Pool> initializer (it pickles into its block name and lock, and a
+        lock can only be passed to a process when it is started), or call
+        <attach> with the name and the lock. <lock> defaults to a
+        <multiprocessing.Lock> of the default start method, processes started
+        through another context need a lock made by that context '''
+
+    def __init__(self, capacity, payload_size=64, lock=None, _name=None):
+        if _name is None:
+            if capacity <= 0:
+                raise ValueError('capacity must be positive')
+
+            if payload_size <= 0:
+                raise ValueError('payload_size must be positive')
+
+            size = HEADER_SIZE + capacity * (8 + 4 + payload_size)
+            self.memory = shared_memory.SharedMemory(create=True, size=size)
+            HEADER.pack_into(self.memory.buf, 0, MAGIC, VERSION, capacity, payload_size, self.KIND)
+            self.owner = True
+
+        else:
+            self.memory = _open_shared_memory(_name)
+            magic, version, capacity, payload_size, kind = HEADER.unpack_from(self.memory.buf, 0)
+
+            if magic != MAGIC or version != VERSION:
+                self.memory.close()
+                raise ValueError('not a shared buffer block')
+
+            if kind != self.KIND:   # E.g. a queue block attached as a stack would pop in the wrong order
+                self.memory.close()
+                raise ValueError(f'not a {self.__class__.__name__} block')
+
+            self.owner = False
+
+        self.name = self.memory.name
+        self.capacity = capacity
+        self.payload_size = payload_size
+        self.lock = multiprocessing.Lock() if lock is None else lock
+
+        buffer = self.memory.buf
+        links_offset = HEADER_SIZE
+        sizes_offset = links_offset + capacity * 8
+        payloads_offset = sizes_offset + capacity * 4
+
+        self.fields = buffer[FIELDS_OFFSET:FIELDS_OFFSET + 32].cast('q')
+        self.links = buffer[links_offset:sizes_offset].cast('q')
+        self.sizes = buffer[sizes_offset:payloads_offset].cast('I')
+        self.payloads = buffer[payloads_offset:payloads_offset + capacity * payload_size]
+
+        if _name is None:
+            self.fields[HEAD] = self.fields[TAIL] = NIL
+            self.fields[LENGTH] = 0
+            self.fields[FREE_HEAD] = 0
+            links = array.array('q', range(1, capacity + 1))   # Chain all slots into the free list
+            links[-1] = NIL
+            self.links[:] = links
+
+
+    @classmethod
+    def attach(cls, name, lock):
+        ''' Open the buffer created by another process under <name>, sharing
+            its <lock> '''
+
+        return cls(None, lock=lock, _name=name)
+
+
+    def __reduce__(self):
+        return (self.attach, (self.name, self.lock))
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+        if self.owner:
+            self.unlink()
+
+
+    def __len__(self):
+        return self.fields[LENGTH]
+
+
+    def is_empty(self):
+        return self.fields[LENGTH] == 0
+
+
+    def close(self):
+        ''' Detach this process from the block. The buffer cannot be used
+            afterwards '''
+
+        for view in (self.fields, self.links, self.sizes, self.payloads):
+            view.release()
+
+        self.memory.close()
+
+
+    def unlink(self):
+        ''' Free the block once every process has closed it '''
+
+        self.memory.unlink()
+
+
+    def push(self, payload):
+        ''' Add a bytes-like <payload> of at most <payload_size> bytes in O(1)
+            time, raise <queue.Full> if no slot is free '''
+
+        size = len(payload)
+
+        if size > self.payload_size:
+            raise ValueError('payload longer than payload_size')
+
+        with self.lock:
+            self._push(payload, size)
+
+
+    def push_many(self, payloads):
+        ''' Add all <payloads> in O(k) time under one lock acquisition. Raise
+            <queue.Full>, adding none of them, if they do not all fit '''
+
+        payloads = list(payloads)
+
+        if any(len(payload) > self.payload_size for payload in payloads):
+            raise ValueError('payload longer than payload_size')
+
+        with self.lock:
+            if len(payloads) > self.capacity - self.fields[LENGTH]:
+                raise queue.Full
+
+            for payload in payloads:
+                self._push(payload, len(payload))
+
+
+    def pop(self):
+        ''' Remove a payload in O(1) time and return it as <bytes> '''
+
+        with self.lock:
+            if self.fields[HEAD] == NIL:
+                raise IndexError('pop from empty buffer')
+
+            return self._pop()
+
+
+    def peek(self):
+        ''' Get the payload <pop> would return without removing it, <None> if
+            the buffer is empty '''
+
+        with self.lock:
+            slot = self.fields[HEAD]
+
+            if slot == NIL:
+                return None
+
+            start = slot * self.payload_size
+            return bytes(self.payloads[start:start + self.sizes[slot]])
+
+
+    def pop_many(self, n):
+        ''' Remove up to <n> payloads in O(n) time under one lock acquisition
+            and return them as a list, in the order <pop> would return them '''
+
+        if not (isinstance(n, int)):
+            raise TypeError('count must be an integer')
+
+        if n < 0:
+            raise ValueError('count must be non-negative')
+
+        with self.lock:
+            return [self._pop() for _ in range(min(n, self.fields[LENGTH]))]
+
+
+    def _new_slot(self, payload, size):
+        ''' Utility method taking a slot from the free list and writing
+            <payload> into it '''
+
+        fields = self.fields
+        slot = fields[FREE_HEAD]
+
+        if slot == NIL:
+            raise queue.Full
+
+        fields[FREE_HEAD] = self.links[slot]
+        self.sizes[slot] = size
+        start = slot * self.payload_size
+        self.payloads[start:start + size] = payload
+        fields[LENGTH] += 1
+
+        return slot
+
+
+    def _pop(self):
+        ''' Utility method unlinking the head slot, giving it back to the free
+            list and returning its payload '''
+
+        fields = self.fields
+        links = self.links
+        slot = fields[HEAD]
+        start = slot * self.payload_size
+        payload = bytes(self.payloads[start:start + self.sizes[slot]])
+
+        fields[HEAD] = links[slot]
+
+        if fields[HEAD] == NIL:
+            fields[TAIL] = NIL   # Only the queue uses the tail
+
+        links[slot] = fields[FREE_HEAD]
+        fields[FREE_HEAD] = slot
+        fields[LENGTH] -= 1
+
+        return payload
+
+
+
+class SharedStack(SharedBuffer):
+    ''' Stack of bytes payloads in shared memory, <pop> returns the most
+        recently pushed payload. See <SharedBuffer> '''
+
+    KIND = 1
+
+    def _push(self, payload, size):
+        slot = self._new_slot(payload, size)
+        self.links[slot] = self.fields[HEAD]
+        self.fields[HEAD] = slot
+
+
+
+class SharedQueue(SharedBuffer):
+    ''' FIFO queue of bytes payloads in shared memory, <pop> returns the
+        oldest payload. See <SharedBuffer> '''
+
+    KIND = 2
+
+    def _push(self, payload, size):
+        slot = self._new_slot(payload, size)
+        fields = self.fields
+        self.links[slot] = NIL
+
+        if fields[TAIL] == NIL:
+            fields[HEAD] = slot
+
+        else:
+            self.links[fields[TAIL]] = slot
+
+        fields[TAIL] = slot
+
+
+
+def _open_shared_memory(name):
+    ''' Utility function attaching to an existing block without registering it
+        with the resource tracker of this process where Python allows it, so
+        only the creating process unlinks it '''
+
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+
+    except TypeError:   # Python before 3.13
+        return shared_memory.SharedMemory(name=name)
@@ -1,38 +1,175 @@
+import operator
+
 from linked_lists import BasicSinglyLinkedList as LinkedList
+from linked_lists import PersistentSinglyLinkedList, SinglyLinkedNode
 
 
 
 class Stack:
-    ''' Implementation of Stack ADT '''
-    
-    def __init__(self):
-        self.items = LinkedList()
+    ''' Implementation of Stack ADT. Elements are kept either in a singly
+        linked list (<backend='linked'>) or in a contiguous, growable array
+        (<backend='array'>), which avoids allocating a node for every pushed
+        element. The linked backend can take its nodes from a shared
+        <NodePool> of <SinglyLinkedNode> nodes and give popped nodes back to it '''
+
+    def __init__(self, backend='linked', pool=None):
+        if backend == 'linked':
+            self.items = LinkedList()
+
+        elif backend == 'array':
+            self.items = []   # Top of the stack is the end of the array
+
+        else:
+            raise ValueError("backend must be either 'linked' or 'array'")
+
+        if pool is not None:
+            if backend != 'linked':
+                raise ValueError('node pool can only be used with the linked backend')
+
+            if pool.node_class is not SinglyLinkedNode:
+                raise ValueError('pool must hold SinglyLinkedNode nodes')
+
+        self.backend = backend
+        self.pool = pool
+        self._new_node = SinglyLinkedNode if pool is None else pool.acquire
+        self.length = 0   # Count of nodes of the linked backend
+
+
+    def __reduce__(self):
+        ''' Pickle the stack as a flat list of its elements, bottom first. A
+            node pool is not pickled '''
+
+        if self.backend == 'array':
+            values = self.items[:]
+
+        else:
+            values = []
+            current_node = self.items.head
+
+            while current_node is not None:
+                values.append(current_node.data)
+                current_node = current_node.next
+
+            values.reverse()
+
+        return (self.__class__, (self.backend,), values)
+
+
+    def __setstate__(self, values):
+        self.push_many(values)
+
+
+    def __len__(self):
+        return len(self.items) if self.backend == 'array' else self.length
 
 
     def push(self, val):
         ''' Add an element to the stack in O(1) time '''
-        
-        self.items.add(val)
+
+        if self.backend == 'array':
+            self.items.append(val)
+
+        else:
+            new_node = self._new_node(val)
+            new_node.next = self.items.head
+            self.items.head = new_node
+            self.length += 1
+
+
+    def push_many(self, iterable):
+        ''' Add all elements of <iterable> to the stack in O(k) time. The last
+            element of <iterable> ends up on the top of the stack '''
+
+        if self.backend == 'array':
+            self.items.extend(iterable)
+
+        else:
+            new_node_of = self._new_node
+            head = self.items.head
+            count = 0
+
+            for val in iterable:
+                new_node = new_node_of(val)
+                new_node.next = head
+                head = new_node
+                count += 1
+
+            self.items.head = head
+            self.length += count
 
 
     def pop(self):
         ''' Remove an element from the stack in O(1) time '''
-        
+
         val = None
 
-        if not self.is_empty():
-            val = self.items.head.data
-            self.items.remove(val)
+        if self.backend == 'array':
+            if self.items:
+                val = self.items.pop()
+
+        elif self.items.head is not None:   # Unlink the top node directly, no need to search for it by value
+            top_node = self.items.head
+            val = top_node.data
+            self.items.head = top_node.next
+            self.length -= 1
+
+            if self.pool is not None:
+                self.pool.release(top_node)
 
         return val
 
 
+    def pop_many(self, n):
+        ''' Remove up to <n> elements from the stack in O(n) time and return
+            them as a list, starting with the top element '''
+
+        if not (isinstance(n, int)):
+            raise TypeError('count must be an integer')
+
+        if n < 0:
+            raise ValueError('count must be non-negative')
+
+        if self.backend == 'array':
+            if n == 0:
+                return []
+
+            values = self.items[-n:]
+            del self.items[-n:]
+            values.reverse()
+
+            return values
+
+        values = []
+        current_node = self.items.head
+
+        for _ in range(n):
+            if current_node is None:
+                break
+
+            values.append(current_node.data)
+            next_node = current_node.next
+
+            if self.pool is not None:
+                self.pool.release(current_node)
+
+            current_node = next_node
+
+        self.items.head = current_node
+        self.length -= len(values)
+
+        return values
+
+
     def peek(self):
         ''' Get the top element without removing it from the stack in O(1) time '''
-        
+
         val = None
 
-        if not self.is_empty():
+        if self.backend == 'array':
+            if self.items:
+                val = self.items[-1]
+
+        elif self.items.head is not None:
             val = self.items.head.data
 
         return val
@@ -40,6 +177,199 @@ class Stack:
 
     def is_empty(self):
         ''' Check if stack has any elements in O(1) time '''
-        
+
+        if self.backend == 'array':
+            return not self.items
+
         return self.items.head is None
 
+
+    def snapshot(self):
+        ''' Return the current contents of the stack as an immutable
+            <PersistentSinglyLinkedList>, top element first. The linked backend
+            never changes a node once it is pushed, so the snapshot shares the
+            nodes of the stack and takes O(1) time, and the stack can go on
+            changing while other threads read the snapshot. The array backend
+            copies its elements in O(n) time '''
+
+        if self.backend == 'array':
+            return PersistentSinglyLinkedList(reversed(self.items))
+
+        if self.pool is not None:
+            raise ValueError('snapshot of a stack using a node pool would share recycled nodes')
+
+        return PersistentSinglyLinkedList._from_chain(self.items.head, self.length)
+
+
+
+def _minimum(a, b):
+    return b if b < a else a   # Two-argument comparison is much cheaper than a call of the <min> builtin
+
+
+def _maximum(a, b):
+    return b if b > a else a
+
+
+
+AGGREGATE_OPERATIONS = {'min': _minimum, 'max': _maximum, 'sum': operator.add}
+
+
+
+class AggregateStack:
+    ''' Stack keeping, next to every element, the aggregate of that element
+        and all elements below it, so the aggregate of the whole stack is
+        available in O(1) time. <operation> is 'min', 'max', 'sum' or any
+        two-argument associative function, which is applied as
+        <operation(aggregate of the elements below, element)>. Elements and
+        aggregates are kept in two parallel arrays '''
+
+    def __init__(self, operation='min'):
+        self.operation = operation
+        self.combine = _resolve_operation(operation)
+        self.items = []
+        self.aggregates = []   # aggregates[i] is the aggregate of items[0] ... items[i]
+
+
+    def __len__(self):
+        return len(self.items)
+
+
+    def push(self, val):
+        ''' Add an element to the stack in O(1) time '''
+
+        aggregates = self.aggregates
+        aggregates.append(self.combine(aggregates[-1], val) if aggregates else val)
+        self.items.append(val)
+
+
+    def pop(self):
+        ''' Remove an element from the stack in O(1) time, <None> if the stack
+            is empty '''
+
+        if not self.items:
+            return None
+
+        self.aggregates.pop()
+        return self.items.pop()
+
+
+    def peek(self):
+        ''' Get the top element without removing it from the stack in O(1) time '''
+
+        return self.items[-1] if self.items else None
+
+
+    def aggregate(self):
+        ''' Return the aggregate of all elements of the stack in O(1) time,
+            <None> if the stack is empty '''
+
+        return self.aggregates[-1] if self.aggregates else None
+
+
+    def is_empty(self):
+        ''' Check if stack has any elements in O(1) time '''
+
+        return not self.items
+
+
+
+class AggregateQueue:
+    ''' FIFO queue made of two <AggregateStack> stacks, which gives the
+        aggregate of all elements of the queue in O(1) time, e.g. the minimum
+        of a sliding window. New elements are pushed onto the back stack. When
+        the front stack runs out, the back stack is moved onto it, which
+        reverses the order, so every element is moved once and <push> and
+        <pop> take amortized O(1) time. The front stack applies <operation>
+        with its arguments swapped, so a non-commutative <operation> is still
+        applied to the elements in queue order '''
+
+    def __init__(self, operation='min'):
+        combine = _resolve_operation(operation)
+
+        self.operation = operation
+        self.combine = combine
+        self.back = AggregateStack(combine)    # Newest element on the top
+
+        if operation in AGGREGATE_OPERATIONS:
+            self.front = AggregateStack(combine)   # Oldest element on the top
+
+        else:
+            self.front = AggregateStack(lambda aggregate, val: combine(val, aggregate))
+
+
+    def __len__(self):
+        return len(self.front.items) + len(self.back.items)
+
+
+    def push(self, val):
+        ''' Add an element to the end of the queue in O(1) time '''
+
+        self.back.push(val)
+
+
+    def pop(self):
+        ''' Remove the oldest element from the queue in amortized O(1) time,
+            <None> if the queue is empty '''
+
+        if not self.front.items:
+            self._refill()
+
+        return self.front.pop()
+
+
+    def peek(self):
+        ''' Get the oldest element without removing it from the queue '''
+
+        if not self.front.items:
+            self._refill()
+
+        return self.front.peek()
+
+
+    def aggregate(self):
+        ''' Return the aggregate of all elements of the queue, oldest first,
+            in O(1) time, <None> if the queue is empty '''
+
+        front_aggregates = self.front.aggregates
+        back_aggregates = self.back.aggregates
+
+        if not front_aggregates:
+            return back_aggregates[-1] if back_aggregates else None
+
+        if not back_aggregates:
+            return front_aggregates[-1]
+
+        return self.combine(front_aggregates[-1], back_aggregates[-1])
+
+
+    def is_empty(self):
+        ''' Check if queue has any elements in O(1) time '''
+
+        return not self.front.items and not self.back.items
+
+
+    def _refill(self):
+        ''' Utility method moving all elements of the back stack onto the
+            front stack, newest first '''
+
+        push = self.front.push
+        items = self.back.items
+
+        for val in reversed(items):
+            push(val)
+
+        items.clear()
+        self.back.aggregates.clear()
+
+
+
+def _resolve_operation(operation):
+    ''' Utility function returning the two-argument function of <operation> '''
+
+    if operation in AGGREGATE_OPERATIONS:
+        return AGGREGATE_OPERATIONS[operation]
+
+    if not callable(operation):
+        raise ValueError("operation must be 'min', 'max', 'sum' or a function")
+
+    return operation
@@ -0,0 +1,125 @@
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from asynchronous import AsyncDeque, AsyncStack
+
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_deque_ends():
+    async def main():
+        d = AsyncDeque()
+        await d.push(1)
+        await d.push(2)
+        await d.push_front(0)
+
+        return [await d.pop(), await d.pop_back(), d.pop_nowait(), len(d)]
+
+    assert run(main()) == [0, 2, 1, 0]
+
+
+def test_stack_is_last_in_first_out():
+    async def main():
+        s = AsyncStack(backend='array')
+
+        for value in range(3):
+            s.push_nowait(value)
+
+        return [s.peek(), await s.pop(), await s.get_many(5)]
+
+    assert run(main()) == [2, 2, [1, 0]]
+
+
+def test_waiting_pop_is_woken_by_push():
+    async def main():
+        d = AsyncDeque()
+        consumer = asyncio.ensure_future(asyncio.wait_for(d.pop(), 5))
+        await asyncio.sleep(0.01)
+
+        assert not consumer.done()
+
+        await d.push('value')
+
+        return await consumer
+
+    assert run(main()) == 'value'
+
+
+def test_waiting_push_is_woken_by_pop():
+    async def main():
+        d = AsyncDeque(capacity=1)
+        await d.push('first')
+        producer = asyncio.ensure_future(asyncio.wait_for(d.push('second'), 5))
+        await asyncio.sleep(0.01)
+
+        assert not producer.done() and d.is_full()
+
+        first = await d.pop()
+        await producer
+
+        return [first, await d.pop()]
+
+    assert run(main()) == ['first', 'second']
+
+
+def test_waiters_are_woken_in_order():
+    async def main():
+        d = AsyncDeque()
+        consumers = [asyncio.ensure_future(d.pop()) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        for value in range(3):
+            await d.push(value)
+
+        return await asyncio.gather(*consumers)
+
+    assert run(main()) == [0, 1, 2]
+
+
+def test_timeouts():
+    async def main():
+        d = AsyncDeque(capacity=1)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(d.pop(), 0.01)
+
+        assert await d.get_many(3, timeout=0.01) == []
+
+        d.push_nowait('a')
+
+        with pytest.raises(asyncio.QueueFull):
+            d.push_nowait('b')
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(d.push('b'), 0.01)
+
+        assert d.getters.head is None and d.putters.head is None   # Timed out waiters left the lines
+
+        return await d.pop()
+
+    assert run(main()) == 'a'
+
+
+def test_close_ends_iteration():
+    async def main():
+        d = AsyncDeque()
+        waiting = asyncio.ensure_future(d.pop())
+        await asyncio.sleep(0)
+        await d.push('a')
+        await d.push('b')
+        d.close()
+
+        with pytest.raises(ValueError):
+            await d.push('c')
+
+        return [await waiting] + [value async for value in d]
+
+    assert run(main()) == ['a', 'b']
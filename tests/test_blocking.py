@@ -0,0 +1,124 @@
+import os
+import queue
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from blocking import BlockingQueue, BlockingStack
+
+
+
+def test_queue_is_first_in_first_out():
+    q = BlockingQueue()
+
+    for value in range(5):
+        q.push(value)
+
+    assert len(q) == 5 and q.peek() == 0
+    assert q.pop() == 0
+    assert q.pop_many(3) == [1, 2, 3]
+    assert q.pop_many(10) == [4]
+    assert q.is_empty() and q.peek() is None
+
+
+def test_stack_is_last_in_first_out():
+    s = BlockingStack(backend='array')
+
+    for value in range(5):
+        s.push(value)
+
+    assert s.peek() == 4
+    assert s.pop() == 4
+    assert s.pop_many(10) == [3, 2, 1, 0]
+    assert s.is_empty()
+
+
+@pytest.mark.parametrize('cls', (BlockingQueue, BlockingStack))
+def test_timeouts(cls):
+    container = cls(capacity=1)
+
+    with pytest.raises(queue.Empty):
+        container.pop(timeout=0.01)
+
+    with pytest.raises(queue.Empty):
+        container.pop(block=False)
+
+    assert container.pop_many(3, timeout=0.01) == []
+
+    container.push('a')
+
+    with pytest.raises(queue.Full):
+        container.push('b', timeout=0.01)
+
+    with pytest.raises(queue.Full):
+        container.push('b', block=False)
+
+    assert container.pop() == 'a'
+
+
+@pytest.mark.parametrize('cls', (BlockingQueue, BlockingStack))
+def test_waiting_pop_is_woken_by_push(cls):
+    container = cls()
+    results = []
+    consumer = threading.Thread(target=lambda: results.append(container.pop(timeout=5)))
+    consumer.start()
+    time.sleep(0.05)
+
+    container.push('value')
+    consumer.join(5)
+
+    assert results == ['value']
+
+
+@pytest.mark.parametrize('cls', (BlockingQueue, BlockingStack))
+def test_waiting_push_is_woken_by_pop(cls):
+    container = cls(capacity=1)
+    container.push('first')
+    producer = threading.Thread(target=lambda: container.push('second', timeout=5))
+    producer.start()
+    time.sleep(0.05)
+
+    assert container.pop() == 'first'
+
+    producer.join(5)
+
+    assert not producer.is_alive()
+    assert container.pop(timeout=1) == 'second'
+
+
+def test_queue_keeps_every_element_across_threads():
+    q = BlockingQueue(capacity=16)
+    received = []
+
+    def consume():
+        while True:
+            values = q.pop_many(8, timeout=5)
+
+            if None in values:
+                received.extend(values[:values.index(None)])
+                return
+
+            received.extend(values)
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+
+    for value in range(2000):
+        q.push(value, timeout=5)
+
+    q.push(None)
+    consumer.join(10)
+
+    assert received == list(range(2000))   # One producer, so the order is kept
+
+
+def test_capacity_must_be_positive():
+    with pytest.raises(ValueError):
+        BlockingQueue(0)
+
+    with pytest.raises(ValueError):
+        BlockingStack(0)
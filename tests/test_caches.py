@@ -0,0 +1,101 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from caches import LFUCache, LRUCache
+
+
+
+def test_lfu_new_entry_is_not_its_own_victim():
+    evicted = []
+    cache = LFUCache(2, on_evict=lambda key, value: evicted.append(key))
+
+    cache.put('a', 1)
+    cache.get('a')
+    cache.put('b', 2)
+    cache.get('b')
+    cache.put('c', 3)
+
+    assert 'c' in cache
+    assert evicted == ['a']   # Both used twice, the least recently used goes
+    assert cache.evictions == 1
+    assert len(cache) == 2
+
+
+def test_lfu_evicts_least_frequently_used():
+    cache = LFUCache(2)
+
+    cache.put('a', 1)
+    cache.get('a')
+    cache.put('b', 2)
+    cache.put('c', 3)
+
+    assert 'a' in cache and 'c' in cache and 'b' not in cache
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(2)
+
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.get('a')
+    cache.put('c', 3)
+
+    assert 'a' in cache and 'c' in cache and 'b' not in cache
+
+
+def test_weight_limit_evicts_before_insert():
+    cache = LFUCache(max_weight=10, weigher=lambda key, value: value)
+
+    cache.put('a', 4)
+    cache.put('b', 4)
+    cache.put('c', 4)
+
+    assert 'c' in cache and 'a' not in cache
+    assert cache.total_weight == 8
+
+
+@pytest.mark.parametrize('cls', (LRUCache, LFUCache))
+def test_oversized_entry_is_not_kept(cls):
+    evicted = []
+    cache = cls(max_weight=10, weigher=lambda key, value: value, on_evict=lambda key, value: evicted.append(key))
+
+    for key in 'abc':
+        cache.put(key, 3)
+
+    cache.put('big', 11)
+
+    assert 'big' not in cache
+    assert len(cache) == 3 and cache.total_weight == 9
+    assert evicted == [] and cache.evictions == 0
+
+    cache.put('a', 11)   # Too heavy for an existing key, only its old entry goes
+
+    assert 'a' not in cache and 'b' in cache and 'c' in cache
+    assert cache.total_weight == 6
+
+
+@pytest.mark.parametrize('cls', (LRUCache, LFUCache))
+def test_zero_capacity_caches_nothing(cls):
+    cache = cls(0)
+    cache.put('a', 1)
+
+    assert len(cache) == 0 and cache.evictions == 0
+
+
+@pytest.mark.parametrize('cls', (LRUCache, LFUCache))
+def test_heavier_update_evicts_others(cls):
+    cache = cls(max_weight=10, weigher=lambda key, value: value)
+
+    cache.put('a', 3)
+    cache.put('b', 3)
+    cache.get('a')
+    cache.get('b')
+    cache.get('b')
+    cache.put('a', 8)   # 'a' is now less frequently used than 'b' but must stay
+
+    assert 'a' in cache and 'b' not in cache
+    assert cache.total_weight == 8
@@ -0,0 +1,112 @@
+import os
+import pickle
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from compact_linked_lists import CompactDoublyLinkedList, NIL
+from linked_lists import AdvancedDoublyLinkedList
+
+
+
+def test_matches_list():
+    rng = random.Random(9)
+    l = CompactDoublyLinkedList()
+    expected = []
+
+    for step in range(2000):
+        operation = rng.random()
+
+        if operation < 0.4 or not expected:
+            index = rng.randrange(len(expected) + 1)
+            l.insert_at_index(index, step)
+            expected.insert(index, step)
+
+        elif operation < 0.6:
+            index = rng.randrange(len(expected))
+            assert l.remove_at_index(index) == expected.pop(index)
+
+        elif operation < 0.7:
+            value = rng.choice(expected)
+            l.remove_by_value(value)
+            expected.remove(value)
+
+        elif operation < 0.8:
+            l.insert_at_beginning(step)
+            expected.insert(0, step)
+
+        else:
+            index = rng.randrange(len(expected))
+            assert l[index] == expected[index]
+            l[index] = -step
+            expected[index] = -step
+
+    assert list(l) == expected
+    assert list(reversed(l)) == expected[::-1]
+    assert len(l) == len(expected)
+    assert len(l.data) - len(l.free_slots) == len(expected)   # Removed slots are reused
+
+
+def test_compact_keeps_slots_in_list_order():
+    l = CompactDoublyLinkedList([4, 2, 3])
+    l.move_to_beginning(l.node_at(2))
+
+    assert not l.is_compact and list(l) == [3, 4, 2]
+
+    l.compact()
+
+    assert l.is_compact and list(l.data) == [3, 4, 2]
+    assert list(l.view()) == [3, 4, 2]
+
+    l.sort()
+
+    assert list(l) == [2, 3, 4] and l.is_sorted
+    assert list(l.to_array()) == [2, 3, 4]
+
+
+def test_handles():
+    l = CompactDoublyLinkedList([1, 2, 3], typecode='d')
+    slot = l.insert_after(l.node_at(0), 1.5)
+    l.insert_after(NIL, 0.5)
+    l.move_to_end(l.node_at(1))
+
+    assert list(l) == [0.5, 1.5, 2.0, 3.0, 1.0]
+    assert l.remove_node(slot) == 1.5
+    assert list(l) == [0.5, 2.0, 3.0, 1.0]
+    assert 3.0 in l and 1.5 not in l
+
+
+def test_rejects_values_of_the_wrong_type():
+    l = CompactDoublyLinkedList([1, 2])
+
+    with pytest.raises(TypeError):
+        l.insert_at_end('a')
+
+    with pytest.raises(IndexError):
+        l[2]
+
+    assert list(l) == [1, 2]
+
+
+
+def test_bytes_are_shared_with_the_pointer_lists():
+    l = CompactDoublyLinkedList([1.5, -2.0], typecode='d')
+    l.move_to_beginning(l.node_at(1))
+
+    buffer = l.to_bytes()
+
+    assert list(AdvancedDoublyLinkedList.from_buffer(buffer)) == [-2.0, 1.5]
+    assert list(CompactDoublyLinkedList.from_buffer(buffer)) == [-2.0, 1.5]
+    assert CompactDoublyLinkedList.from_buffer(AdvancedDoublyLinkedList([7]).to_bytes()).typecode == 'q'
+
+
+def test_pickle_compacts():
+    l = CompactDoublyLinkedList([1, 2, 3])
+    l.move_to_beginning(l.node_at(2))
+
+    copy = pickle.loads(pickle.dumps(l))
+
+    assert list(copy) == [3, 1, 2] and copy.is_compact
@@ -0,0 +1,88 @@
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from heaps import PriorityQueue
+
+
+
+@pytest.mark.parametrize('arity', (2, 3, 4, 8))
+def test_pops_in_priority_order(arity):
+    rng = random.Random(23)
+    values = [rng.randrange(1000) for _ in range(500)]
+    q = PriorityQueue(values[:100], arity=arity)
+
+    for value in values[100:]:
+        q.push(value)
+
+    assert q.nsmallest(5) == sorted(values)[:5]
+    assert q.nlargest(3) == sorted(values, reverse=True)[:3]
+    assert [q.pop() for _ in range(len(values))] == sorted(values)
+    assert q.is_empty() and q.peek() is None
+
+
+def test_stable_mode_keeps_push_order_of_ties():
+    q = PriorityQueue(stable=True, key=lambda pair: pair[0])
+    pairs = [(priority, index) for index, priority in enumerate([2, 1, 2, 0, 1, 2, 0] * 20)]
+
+    q.extend(pairs[:70])
+
+    for pair in pairs[70:]:
+        q.push(pair)
+
+    assert [q.pop() for _ in range(len(pairs))] == sorted(pairs, key=lambda pair: pair[0])
+
+
+def test_decrease_key_and_remove_through_handles():
+    q = PriorityQueue(arity=2)
+    handles = {name: q.push(name, priority) for priority, name in enumerate('abcdefgh')}
+
+    q.decrease_key(handles['g'], -1)
+
+    assert q.peek() == 'g' and handles['g'].priority == -1
+    assert q.remove(handles['c']) == 'c'
+
+    for name in 'abcdefh':   # The other handles still find their elements after the moves
+        if name != 'c':
+            assert q.entries[handles[name].index] is handles[name]
+
+    assert [q.pop() for _ in range(len(q))] == list('gabdefh')
+
+
+def test_stale_handles_are_rejected():
+    q = PriorityQueue()
+    entry = q.push('a', 1)
+    q.push('b', 2)
+
+    with pytest.raises(ValueError):
+        q.decrease_key(entry, 3)   # Greater priority
+
+    assert q.pop() == 'a'
+
+    with pytest.raises(ValueError):
+        q.remove(entry)
+
+    with pytest.raises(ValueError):
+        q.decrease_key(entry, 0)
+
+    with pytest.raises(ValueError):
+        PriorityQueue().remove(q.peek_entry())
+
+
+def test_pushpop_and_replace():
+    q = PriorityQueue([5, 3, 7])
+
+    assert q.pushpop(1) == 1
+    assert q.pushpop(4) == 3
+    assert q.replace(9) == 4
+    assert [q.pop() for _ in range(3)] == [5, 7, 9]
+
+    with pytest.raises(IndexError):
+        q.pop()
+
+    with pytest.raises(IndexError):
+        q.replace(1)
@@ -0,0 +1,85 @@
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import instrumentation
+import linked_lists
+from instrumentation import instrument, uninstrument
+from linked_lists import (AdvancedDoublyLinkedList, AdvancedSinglyLinkedList, PersistentSinglyLinkedList,
+                          SinglyLinkedNode)
+
+
+
+def test_failed_instrument_leaves_links_alone():
+    next_link = SinglyLinkedNode.__dict__['next']
+
+    with pytest.raises(TypeError):
+        instrument(PersistentSinglyLinkedList([1, 2, 3]))
+
+    assert SinglyLinkedNode.__dict__['next'] is next_link
+    assert instrumentation._instrumented_objects == 0
+
+
+@pytest.mark.parametrize('cls', (AdvancedSinglyLinkedList, AdvancedDoublyLinkedList))
+def test_sort_counts_comparisons_on_the_plain_path(cls, monkeypatch):
+    values = [random.randrange(100) for _ in range(200)]
+    l = cls(values)
+    stats = instrument(l)
+
+    monkeypatch.setattr(linked_lists, 'KeyedNode', None)   # The keyed path would fail
+    l.sort()
+    uninstrument(l)
+
+    assert list(l) == sorted(values)
+    assert l.is_sorted
+    assert stats.comparisons > 0
+    assert not any(isinstance(node.data, instrumentation.CountedKey) for node in _nodes(l))
+
+
+def test_sort_with_key_counts_comparisons():
+    l = AdvancedDoublyLinkedList(['ccc', 'a', 'bb'])
+    stats = instrument(l)
+    l.sort(key=len, reverse=True)
+    uninstrument(l)
+
+    assert list(l) == ['ccc', 'bb', 'a']
+    assert not l.is_sorted
+    assert stats.sorts == 1 and stats.comparisons > 0
+
+
+
+def _nodes(l):
+    node = l.head
+
+    while node is not None:
+        yield node
+        node = node.next
+
+
+def test_new_lists_keep_the_original_class():
+    l = AdvancedDoublyLinkedList([3, 1, 2])
+    instrument(l)
+
+    left, right = l.split_at(1)
+    merged = l.concat(left, right)
+    uninstrument(l)
+
+    assert type(left) is type(right) is type(merged) is AdvancedDoublyLinkedList
+    assert list(merged) == [3, 1, 2]
+
+
+
+def test_set_operations_keep_the_original_class():
+    l = AdvancedDoublyLinkedList([1, 3, 5])
+    instrument(l)
+
+    union = l.union(AdvancedDoublyLinkedList([4]))
+    difference = l.difference(AdvancedDoublyLinkedList([3]))
+    uninstrument(l)
+
+    assert type(union) is type(difference) is AdvancedDoublyLinkedList
+    assert list(union) == [1, 3, 4, 5] and list(difference) == [1, 5]
@@ -0,0 +1,800 @@
+import array
+import os
+import pickle
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from linked_lists import (AdvancedDoublyLinkedList, AdvancedSinglyLinkedList, BUFFER_HEADER,
+                          BasicSinglyLinkedList, DoublyLinkedNode, HashedDoublyLinkedList,
+                          HashedSinglyLinkedList, IndexedDoublyLinkedList, LinkedListView, NodePool,
+                          PersistentSinglyLinkedList, SinglyLinkedNode, SortedLinkedList,
+                          UnrolledDoublyLinkedList)
+
+
+
+def test_unrolled_matches_list():
+    rng = random.Random(2)
+    l = UnrolledDoublyLinkedList(block_size=4)
+    expected = []
+
+    for _ in range(2000):
+        operation = rng.random()
+
+        if operation < 0.5 or not expected:
+            index = rng.randrange(len(expected) + 1)
+            value = rng.randrange(100)
+            l.insert_at_index(index, value)
+            expected.insert(index, value)
+
+        elif operation < 0.8:
+            index = rng.randrange(len(expected))
+            assert l.remove_at_index(index) == expected.pop(index)
+
+        else:
+            value = rng.choice(expected)
+            l.remove_by_value(value)
+            expected.remove(value)
+
+    assert list(l) == expected
+    assert list(reversed(l)) == expected[::-1]
+    assert len(l) == len(expected)
+
+    block = l.head
+
+    while block is not None:   # No empty or overfull blocks, and the links agree both ways
+        assert 1 <= len(block.items) <= 4
+        assert block.next is None or block.next.prev is block
+        block = block.next
+
+
+def test_unrolled_ends_sort_and_reverse():
+    l = UnrolledDoublyLinkedList([5, 3, 8, 1, 9, 2, 7], block_size=3)
+    l.insert_at_beginning(0)
+    l.insert_at_end(4)
+
+    assert 8 in l and 6 not in l
+    assert l.remove_at_beginning() == 0
+    assert l.remove_at_end() == 4
+
+    l.sort()
+    l.insert_sorted(6)
+
+    assert list(l) == [1, 2, 3, 5, 6, 7, 8, 9]
+
+    l.reverse()
+
+    assert list(l) == [9, 8, 7, 6, 5, 3, 2, 1]
+
+    l.delete()
+
+    assert len(l) == 0 and list(l) == []
+
+
+def test_unrolled_checks_arguments():
+    with pytest.raises(ValueError):
+        UnrolledDoublyLinkedList(block_size=1)
+
+    l = UnrolledDoublyLinkedList([1, 2])
+
+    with pytest.raises(IndexError):
+        l.insert_at_index(3, 0)
+
+    with pytest.raises(IndexError):
+        l.remove_at_index(2)
+
+    with pytest.raises(ValueError):
+        l.remove_by_value(3)
+
+
+
+def test_indexed_positional_access_matches_list():
+    rng = random.Random(3)
+    l = IndexedDoublyLinkedList(range(300))
+    expected = list(range(300))
+
+    for step in range(1500):
+        operation = rng.random()
+
+        if operation < 0.3:
+            index = rng.randrange(len(expected) + 1)
+            l.insert_at_index(index, -step)
+            expected.insert(index, -step)
+
+        elif operation < 0.5 and expected:
+            index = rng.randrange(len(expected))
+            assert l.remove_at_index(index) == expected.pop(index)
+
+        elif operation < 0.6:
+            l.insert_at_beginning(step)
+            l.insert_at_end(-step)
+            expected = [step] + expected + [-step]
+
+        elif operation < 0.7 and len(expected) > 1:
+            assert l.remove_at_beginning() == expected.pop(0)
+            assert l.remove_at_end() == expected.pop()
+
+        elif expected:
+            index = rng.randrange(-len(expected), len(expected))
+            assert l[index] == expected[index]
+            l[index] = step
+            expected[index] = step
+
+    assert not l._lanes_stale   # Updated in place, never rebuilt
+    assert [l[i] for i in range(len(l))] == expected == list(l)
+
+
+def test_indexed_checks_indexes():
+    l = IndexedDoublyLinkedList([1, 2, 3])
+
+    assert l[-1] == 3
+
+    with pytest.raises(IndexError):
+        l[3]
+
+    with pytest.raises(IndexError):
+        l[-4]
+
+    with pytest.raises(TypeError):
+        l['0']
+
+
+
+def nodes_of(linked_list):
+    nodes = []
+    current_node = linked_list.head
+
+    while current_node is not None:
+        nodes.append(current_node)
+        current_node = current_node.next
+
+    return nodes
+
+
+def test_hashed_singly_remove_unlinks_the_first_occurrence():
+    l = HashedSinglyLinkedList()
+
+    for value in ['c', 'a', 'b', 'a', 'c']:
+        l.insert_at_end(value)
+
+    nodes = nodes_of(l)
+
+    l.remove('a')
+    l.remove('c')
+    l.remove('c')   # The tail
+
+    assert list(l) == ['b', 'a']
+    assert nodes_of(l) == [nodes[2], nodes[3]]   # The remaining nodes are the same objects
+    assert l.nodes_by_value == {'b': {nodes[2]: None}, 'a': {nodes[3]: None}}
+
+    l.reverse()
+    l.remove('a')
+
+    assert list(l) == ['b'] and l.head is l.tail is nodes[2]
+
+    with pytest.raises(ValueError):
+        l.remove('a')
+
+
+def test_hashed_doubly_remove_by_value_removes_the_first_occurrence():
+    l = HashedDoublyLinkedList([2, 1])
+    l.insert_at_beginning(1)
+    first = l.head
+
+    l.remove_by_value(1)
+
+    assert list(l) == [2, 1]
+    assert first not in l.nodes_by_value[1]
+
+
+@pytest.mark.parametrize('cls', (HashedSinglyLinkedList, HashedDoublyLinkedList))
+def test_hashed_index_follows_the_list(cls):
+    l = cls()
+
+    for value in [3, 1, 2, 1]:
+        l.insert_at_end(value)
+
+    l.insert_at_index(1, 4)
+    l.sort()
+
+    assert list(l) == [1, 1, 2, 3, 4]
+    assert 4 in l and 5 not in l
+    assert {value: len(nodes) for value, nodes in l.nodes_by_value.items()} == {1: 2, 2: 1, 3: 1, 4: 1}
+
+
+
+def make_list(cls, values):
+    l = cls()
+
+    for value in values:
+        l.insert_at_end(value)
+
+    return l
+
+
+@pytest.mark.parametrize('cls', (AdvancedSinglyLinkedList, AdvancedDoublyLinkedList))
+@pytest.mark.parametrize('reverse', (False, True))
+def test_sort_is_stable_with_equal_keys(cls, reverse):
+    rng = random.Random(6)
+    pairs = [(rng.randrange(10), index) for index in range(500)]
+    l = make_list(cls, pairs)
+
+    l.sort(key=lambda pair: pair[0], reverse=reverse)
+
+    assert list(l) == sorted(pairs, key=lambda pair: pair[0], reverse=reverse)
+    assert l.tail.data == list(l)[-1]
+
+
+@pytest.mark.parametrize('cls', (AdvancedSinglyLinkedList, AdvancedDoublyLinkedList))
+@pytest.mark.parametrize('reverse', (False, True))
+def test_sort_is_stable_with_equal_values(cls, reverse):
+    values = [3, 1.0, 2, 1, 3.0, 2.0, 1, 3] * 10   # 1 == 1.0, the type shows the order of ties
+    l = make_list(cls, values)
+
+    l.sort(reverse=reverse)
+
+    assert [(value, type(value)) for value in l] == [(value, type(value)) for value in sorted(values, reverse=reverse)]
+
+
+@pytest.mark.parametrize('cls', (AdvancedSinglyLinkedList, AdvancedDoublyLinkedList))
+@pytest.mark.parametrize('values', ([], [1], list(range(50)), list(range(50, 0, -1)), [3, 1, 2] * 40))
+def test_sort_natural_runs(cls, values):
+    l = make_list(cls, values)
+
+    l.sort()
+
+    assert list(l) == sorted(values)
+    assert l.is_sorted
+
+    l.sort(reverse=True)
+
+    assert list(l) == sorted(values, reverse=True)
+    assert not l.is_sorted
+
+
+def test_doubly_sort_keeps_back_links():
+    l = make_list(AdvancedDoublyLinkedList, ['b', 'C', 'a', 'D'])
+
+    l.sort(key=str.lower)
+
+    assert list(l) == ['a', 'b', 'C', 'D']
+    assert list(reversed(l)) == ['D', 'C', 'b', 'a']
+    assert not l.is_sorted   # Sorted by a key, not by the values themselves
+
+
+
+def test_sorted_list_keeps_order():
+    s = SortedLinkedList([5, 1, 4])
+
+    for value in [3, 4, 0, 9]:
+        s.add(value)
+
+    assert list(s) == [0, 1, 3, 4, 4, 5, 9]
+    assert list(reversed(s)) == [9, 5, 4, 4, 3, 1, 0]
+    assert s[2] == 3 and s[-1] == 9
+    assert 4 in s and 2 not in s
+    assert s.bisect_left(4) == 3 and s.bisect_right(4) == 5
+
+    s.remove(4)
+    s.discard(2)
+    s.discard(0)
+
+    assert list(s) == [1, 3, 4, 5, 9]
+    assert s.pop_min() == 1 and s.pop_max() == 9
+    assert len(s) == 3
+
+    with pytest.raises(ValueError):
+        s.remove(2)
+
+
+def test_sorted_list_irange():
+    s = SortedLinkedList(range(10))
+
+    assert list(s.irange(3, 6)) == [3, 4, 5, 6]
+    assert list(s.irange(3, 6, inclusive=(False, False))) == [4, 5]
+    assert list(s.irange(maximum=2, reverse=True)) == [2, 1, 0]
+    assert list(s.irange(minimum=8)) == [8, 9]
+    assert list(s.irange(6, 3)) == []
+
+
+def test_sorted_list_pop_from_empty():
+    with pytest.raises(IndexError):
+        SortedLinkedList().pop_min()
+
+
+def test_indexed_handle_edits_keep_lanes():
+    l = IndexedDoublyLinkedList(range(1000))
+    expected = list(range(1000))
+    l[0]   # Build the lanes
+
+    for i in range(0, 900, 7):
+        node = l.node_at(i)
+        l.move_to_end(node)
+        expected.append(expected.pop(i))
+        l.insert_after(l.node_at(i), -i)
+        expected.insert(i + 1, -i)
+        l.remove_node(l.node_at(i + 2))
+        del expected[i + 2]
+
+    l.insert_at_beginning('head')
+    l.insert_at_end('tail')
+    expected = ['head'] + expected + ['tail']
+
+    assert not l._lanes_stale
+    assert [l[i] for i in range(len(l))] == expected == list(l)
+    assert l.remove_at_beginning() == 'head'
+    assert l.remove_at_end() == 'tail'
+    assert [l[i] for i in range(0, len(l), 13)] == expected[1:-1:13]
+
+
+
+BULK_CLASSES = (AdvancedSinglyLinkedList, AdvancedDoublyLinkedList, HashedSinglyLinkedList,
+                HashedDoublyLinkedList, IndexedDoublyLinkedList)
+
+
+
+@pytest.mark.parametrize('cls', BULK_CLASSES)
+def test_extend_and_extendleft(cls):
+    l = cls(range(3))
+
+    l.extend([3, 4])
+    l.extendleft([-1, -2])
+    l.extend([])
+
+    assert list(l) == [-2, -1, 0, 1, 2, 3, 4]
+    assert len(l) == 7 and l.tail.data == 4
+
+
+@pytest.mark.parametrize('cls', BULK_CLASSES)
+def test_splice_and_concat_move_the_nodes(cls):
+    first, second, third = cls([1, 2]), cls([3]), cls([4, 5])
+
+    first.splice(second)
+
+    assert list(first) == [1, 2, 3] and len(second) == 0 and second.head is None
+
+    result = cls.concat(first, cls(), third)
+
+    assert list(result) == [1, 2, 3, 4, 5] and len(result) == 5
+    assert len(first) == len(third) == 0
+
+    with pytest.raises(ValueError):
+        result.splice(result)
+
+
+@pytest.mark.parametrize('cls', BULK_CLASSES)
+@pytest.mark.parametrize('index', (0, 1, 3, 5))
+def test_split_at(cls, index):
+    l = cls(range(5))
+
+    left, right = l.split_at(index)
+
+    assert list(left) == list(range(index)) and list(right) == list(range(index, 5))
+    assert len(left) == index and len(right) == 5 - index
+    assert len(l) == 0
+
+    left.extend(right)
+
+    assert list(left) == list(range(5))
+
+
+def test_split_at_checks_the_index():
+    with pytest.raises(IndexError):
+        AdvancedSinglyLinkedList([1]).split_at(2)
+
+
+def test_splice_keeps_sorted_flag():
+    l = AdvancedDoublyLinkedList([1, 2])
+    l.sort()
+    other = AdvancedDoublyLinkedList([3])
+    other.sort()
+
+    l.splice(other)
+
+    assert l.is_sorted
+
+    other = AdvancedDoublyLinkedList([0])
+    other.sort()
+    l.splice(other)
+
+    assert not l.is_sorted
+
+
+
+def test_pool_reuses_released_nodes():
+    pool = NodePool(DoublyLinkedNode, max_size=2)
+    l = AdvancedDoublyLinkedList(range(4), pool=pool)
+    nodes = [l.node_at(i) for i in range(3)]
+
+    for _ in range(3):
+        l.remove_at_beginning()
+
+    assert len(pool) == 2 and pool.discards == 1
+    assert nodes[0].data is None and nodes[0].next is None   # Released nodes keep no references
+
+    l.insert_at_end('a')
+    l.insert_at_end('b')
+    l.insert_at_end('c')
+
+    assert list(l) == [3, 'a', 'b', 'c']
+    assert pool.stats() == {'hits': 2, 'misses': 5, 'releases': 2, 'discards': 1, 'hit_rate': 2 / 7, 'size': 0}
+
+
+def test_pool_must_match_the_node_class():
+    with pytest.raises(ValueError):
+        AdvancedSinglyLinkedList(pool=NodePool(DoublyLinkedNode))
+
+
+@pytest.mark.parametrize('cls, node_class, remove', ((AdvancedSinglyLinkedList, SinglyLinkedNode, 'remove'),
+                                                     (AdvancedDoublyLinkedList, DoublyLinkedNode, 'remove_by_value'),
+                                                     (IndexedDoublyLinkedList, DoublyLinkedNode, 'remove_by_value')))
+def test_split_at_keeps_pool(cls, node_class, remove):
+    pool = NodePool(node_class, 10)
+    left, right = cls(range(6), pool=pool).split_at(2)
+
+    assert list(left) == [0, 1] and list(right) == [2, 3, 4, 5]
+    assert left.pool is pool and right.pool is pool
+
+    getattr(right, remove)(2)
+
+    assert len(pool) == 1
+
+
+
+def test_persistent_versions_share_nodes():
+    empty = PersistentSinglyLinkedList()
+    first = empty.push(2).push(1)
+    second = first.push(0)
+    third = second.pop().pop()
+
+    assert list(empty) == [] and empty.is_empty()
+    assert list(first) == [1, 2] and list(second) == [0, 1, 2] and list(third) == [2]
+    assert second.head.next is first.head and third.head is first.head.next
+    assert second.peek() == 0 and second[2] == 2 and second[-3] == 0
+    assert first == PersistentSinglyLinkedList([1, 2]) != second
+    assert hash(first) == hash(PersistentSinglyLinkedList([1, 2]))
+    assert list(second.reverse()) == [2, 1, 0] and list(second) == [0, 1, 2]
+
+
+def test_persistent_is_immutable():
+    l = PersistentSinglyLinkedList([1])
+
+    with pytest.raises(AttributeError):
+        l.extra = 1
+
+    with pytest.raises(IndexError):
+        l.pop().pop()
+
+    with pytest.raises(IndexError):
+        l[1]
+
+
+
+def swap_byte_order(buffer):
+    ''' Rewrite the output of <to_bytes> as a host of the other byte order
+        would have written it '''
+
+    header = bytearray(buffer[:BUFFER_HEADER.size])
+    header[4:5] = b'>' if sys.byteorder == 'little' else b'<'
+    values = array.array(chr(header[2]))
+    values.frombytes(buffer[BUFFER_HEADER.size:])
+    values.byteswap()
+
+    return bytes(header) + values.tobytes()
+
+
+@pytest.mark.parametrize('cls', BULK_CLASSES)
+@pytest.mark.parametrize('typecode, values', (('q', [3, -1, 2 ** 40]), ('d', [0.5, -2.0]), ('B', [])))
+def test_to_bytes_round_trip(cls, typecode, values):
+    buffer = cls(values).to_bytes(typecode)
+
+    assert list(cls.from_buffer(buffer)) == values
+    assert list(cls.from_buffer(bytearray(buffer))) == values
+    assert list(cls.from_buffer(swap_byte_order(buffer))) == values
+
+
+def test_from_buffer_rejects_other_data():
+    buffer = AdvancedSinglyLinkedList([1, 2]).to_bytes()
+
+    with pytest.raises(ValueError):
+        AdvancedSinglyLinkedList.from_buffer(b'XY' + buffer[2:])
+
+    with pytest.raises(ValueError):
+        AdvancedSinglyLinkedList.from_buffer(buffer[:4])
+
+    with pytest.raises(ValueError):
+        AdvancedSinglyLinkedList.from_buffer(buffer[:4] + b'?' + buffer[5:])
+
+    with pytest.raises(OverflowError):
+        AdvancedSinglyLinkedList([256]).to_bytes('B')
+
+
+@pytest.mark.parametrize('cls', BULK_CLASSES + (UnrolledDoublyLinkedList,))
+def test_pickle_round_trip(cls):
+    l = cls([3, 1, 2])
+    l.sort()
+
+    copy = pickle.loads(pickle.dumps(l))
+
+    assert type(copy) is cls
+    assert list(copy) == [1, 2, 3] and len(copy) == 3 and copy.is_sorted
+
+    copy.insert_at_end(4)
+
+    assert list(copy) == [1, 2, 3, 4]
+
+
+def test_pickle_of_long_lists_does_not_recurse():
+    l = AdvancedSinglyLinkedList(range(100_000))
+
+    assert list(pickle.loads(pickle.dumps(l))) == list(range(100_000))
+
+
+def test_pickle_basic_and_persistent():
+    basic = BasicSinglyLinkedList()
+
+    for value in [1, 2, 3]:
+        basic.add(value)
+
+    persistent = PersistentSinglyLinkedList([1, 2, 3])
+
+    assert pickle.loads(pickle.dumps(basic)).get_size() == 3
+    assert pickle.loads(pickle.dumps(persistent)) == persistent
+
+
+
+SLICES = (slice(None), slice(2, 7), slice(-3, None), slice(None, None, 3), slice(8, 1, -2), slice(None, None, -1),
+          slice(5, 5), slice(-100, 100))
+
+
+
+@pytest.mark.parametrize('cls', BULK_CLASSES)
+@pytest.mark.parametrize('index', SLICES)
+def test_slice_views_match_list_slices(cls, index):
+    values = list(range(10))
+    view = cls(values)[index]
+
+    assert isinstance(view, LinkedListView)
+    assert list(view) == values[index] and len(view) == len(values[index])
+    assert list(reversed(view)) == values[index][::-1]
+    assert view == values[index]
+    assert view[1:] == values[index][1:] and view[::-1] == values[index][::-1]
+
+    if values[index]:
+        assert view[-1] == values[index][-1]
+
+
+def test_view_shows_replaced_values():
+    l = AdvancedDoublyLinkedList(range(5))
+    view = l[1:4]
+
+    l[2] = 'two'
+
+    assert list(view) == [1, 'two', 3]
+
+
+@pytest.mark.parametrize('cls', (AdvancedSinglyLinkedList, AdvancedDoublyLinkedList, IndexedDoublyLinkedList))
+def test_view_is_invalidated_by_structural_changes(cls):
+    l = cls(range(5))
+    view = l[1:]
+    walk = iter(l[::2])
+    next(walk)
+
+    l.insert_at_end(5)
+
+    with pytest.raises(RuntimeError):
+        list(view)
+
+    with pytest.raises(RuntimeError):
+        len(view)
+
+    with pytest.raises(RuntimeError):
+        next(walk)
+
+    assert list(l[1:]) == [1, 2, 3, 4, 5]
+
+
+
+@pytest.mark.parametrize('cls', BULK_CLASSES)
+def test_cursor_edits_around_its_position(cls):
+    l = cls([1, 2, 3, 4])
+    cursor = l.cursor(1)
+
+    assert cursor.value == 2
+
+    cursor.insert_before('a')
+    cursor.insert_after('b')
+
+    assert cursor.value == 2 and cursor.index == 2
+
+    assert cursor.remove_current() == 2
+    assert cursor.value == 'b'
+    assert cursor.replace('c') == 'b'
+
+    cursor.next()
+    cursor.next()
+    cursor.remove_current()
+
+    assert cursor.at_end()
+
+    cursor.insert_before(5)
+
+    assert list(l) == [1, 'a', 'c', 3, 5] and len(l) == 5 and l.tail.data == 5
+    assert l[4] == 5
+
+    with pytest.raises(IndexError):
+        cursor.value
+
+
+@pytest.mark.parametrize('cls', (AdvancedDoublyLinkedList, IndexedDoublyLinkedList))
+def test_doubly_cursor_moves_back(cls):
+    l = cls([1, 2, 3])
+    cursor = l.cursor(3)
+    cursor.prev()
+    cursor.prev()
+
+    assert cursor.value == 2 and cursor.index == 1
+
+    cursor.prev()
+
+    with pytest.raises(IndexError):
+        cursor.prev()
+
+
+@pytest.mark.parametrize('cls', (AdvancedSinglyLinkedList, AdvancedDoublyLinkedList))
+def test_cursor_is_invalidated_by_other_changes(cls):
+    l = cls([1, 2, 3])
+    cursor = l.cursor()
+
+    l.insert_at_beginning(0)
+
+    with pytest.raises(RuntimeError):
+        cursor.next()
+
+    with pytest.raises(IndexError):
+        l.cursor(5)
+
+
+def test_cursor_keeps_hashed_index():
+    l = HashedSinglyLinkedList(['a', 'b'])
+    cursor = l.cursor(1)
+    cursor.replace('c')
+    cursor.insert_before('d')
+
+    assert 'b' not in l and 'c' in l and 'd' in l
+
+    l.remove('c')
+
+    assert list(l) == ['a', 'd']
+
+
+@pytest.mark.parametrize('cls', BULK_CLASSES)
+def test_remove_if(cls):
+    l = cls(range(10))
+
+    assert l.remove_if(lambda value: value % 3 == 0) == 4
+    assert list(l) == [1, 2, 4, 5, 7, 8] and len(l) == 6 and l.tail.data == 8
+    assert l.remove_if(lambda value: False) == 0
+    assert [l[i] for i in range(len(l))] == [1, 2, 4, 5, 7, 8]
+
+
+@pytest.mark.parametrize('cls', BULK_CLASSES)
+def test_remove_all(cls):
+    l = cls([1, 2, 3, 2, 1, 4])
+
+    assert l.remove_all([1, 2]) == 4
+    assert list(l) == [3, 4]
+
+
+@pytest.mark.parametrize('cls', (AdvancedSinglyLinkedList, AdvancedDoublyLinkedList, IndexedDoublyLinkedList))
+def test_remove_all_unhashable_payloads(cls):
+    l = cls([[1], [2], [3], [1]])
+
+    assert l.remove_all([1]) == 0
+    assert l.remove_all([[1], 3]) == 2
+    assert list(l) == [[2], [3]]
+
+
+
+@pytest.mark.parametrize('cls', BULK_CLASSES)
+def test_merge_sorted_is_stable(cls):
+    first = cls([(1, 'a'), (3, 'a')])
+    second = cls([(3, 'b'), (0, 'b'), (1, 'b')])   # Not sorted, sorted first
+    first.sort()
+
+    merged = cls.merge_sorted(first, cls(), second)
+
+    assert list(merged) == [(0, 'b'), (1, 'a'), (1, 'b'), (3, 'a'), (3, 'b')]
+    assert merged.is_sorted and len(merged) == 5 and merged.tail.data == (3, 'b')
+    assert len(first) == len(second) == 0
+
+
+@pytest.mark.parametrize('cls', (AdvancedSinglyLinkedList, AdvancedDoublyLinkedList))
+@pytest.mark.parametrize('operation, expected', (('union', [1, 2, 3, 4, 5]), ('intersection', [2, 3]),
+                                                 ('difference', [1, 4])))
+def test_set_operations_leave_operands_intact(cls, operation, expected):
+    left = cls([4, 2, 1, 2, 3])
+    right = cls([5, 3, 3, 2])
+
+    result = getattr(left, operation)(right)
+
+    assert list(result) == expected and result.is_sorted
+    assert list(left) == [4, 2, 1, 2, 3] and list(right) == [5, 3, 3, 2]
+    assert list(getattr(left, operation)(left)) == ([] if operation == 'difference' else [1, 2, 3, 4])
+
+
+@pytest.mark.parametrize('cls', (AdvancedSinglyLinkedList, AdvancedDoublyLinkedList))
+def test_set_operations_consume(cls):
+    left = cls([3, 1, 2])
+    right = cls([2, 4])
+
+    result = left.union(right, consume=True)
+
+    assert list(result) == [1, 2, 3, 4] and len(result) == 4
+    assert len(left) == len(right) == 0 and left.head is None
+
+
+@pytest.mark.parametrize('cls, node_class', ((AdvancedSinglyLinkedList, SinglyLinkedNode),
+                                             (AdvancedDoublyLinkedList, DoublyLinkedNode)))
+def test_set_operations_consume_release_to_the_origin_pool(cls, node_class):
+    left_pool = NodePool(node_class, 10)
+    right_pool = NodePool(node_class, 10)
+    left = cls([1, 2, 2, 3], pool=left_pool)
+    right = cls([2, 3, 3, 4], pool=right_pool)
+
+    result = left.intersection(right, consume=True)
+
+    assert list(result) == [2, 3] and result.pool is left_pool
+    assert len(left) == len(right) == 0
+    assert len(left_pool) == 2    # 1 and the second 2
+    assert len(right_pool) == 4   # All of them, 2 and 3 are kept from the left
+
+
+@pytest.mark.parametrize('cls', BULK_CLASSES)
+def test_dedupe(cls):
+    l = cls([3, 1, 3, 2, 1, 1])
+
+    assert l.dedupe() == 3
+    assert list(l) == [1, 2, 3] and len(l) == 3 and l.is_sorted
+    assert [l[i] for i in range(3)] == [1, 2, 3]
+
+
+
+@pytest.mark.parametrize('cls', BULK_CLASSES)
+@pytest.mark.parametrize('reverse', (False, True))
+def test_parallel_sort_is_stable(cls, reverse):
+    rng = random.Random(25)
+    values = [rng.randrange(20) for _ in range(1000)]
+    values[::2] = map(float, values[::2])   # 3 == 3.0, the type shows the order of ties
+    expected = sorted(values, reverse=reverse)
+    l = cls(values)
+    nodes = set(map(id, nodes_of(l)))
+
+    l.parallel_sort(workers=3, threshold=0, reverse=reverse)
+
+    assert [(value, type(value)) for value in l] == [(value, type(value)) for value in expected]
+    assert set(map(id, nodes_of(l))) == nodes   # The nodes are relinked, not replaced
+    assert len(l) == 1000 and l.tail.data == expected[-1] and l.is_sorted == (not reverse)
+    assert [l[i] for i in range(0, 1000, 37)] == expected[::37]
+
+
+
+@pytest.mark.parametrize('cls', (HashedSinglyLinkedList, HashedDoublyLinkedList))
+def test_parallel_sort_keeps_the_hash_index(cls):
+    l = cls([3, 1, 2, 1])
+
+    l.parallel_sort(workers=2, threshold=0)
+    l.remove_all([1])
+
+    assert list(l) == [2, 3] and 1 not in l
+
+
+def test_parallel_sort_falls_back_to_sort_for_short_lists():
+    l = AdvancedDoublyLinkedList([3, 1, 2])
+
+    l.parallel_sort(workers=4)
+
+    assert list(l) == [1, 2, 3] and list(reversed(l)) == [3, 2, 1]
@@ -0,0 +1,42 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from mapped_linked_lists import HEADER_SIZE, MappedDoublyLinkedList
+
+
+
+def test_reopen(tmp_path):
+    path = str(tmp_path / 'list.mdll')
+
+    with MappedDoublyLinkedList(path, payload_size=8) as l:
+        l.insert_at_end(b'a')
+        l.insert_at_end(b'b')
+        l.insert_at_beginning(b'c')
+
+    with MappedDoublyLinkedList.open(path) as l:
+        assert list(l) == [b'c', b'a', b'b']
+
+
+def test_truncated_file(tmp_path):
+    path = tmp_path / 'truncated.mdll'
+    path.write_bytes(b'MDLL' + bytes(HEADER_SIZE // 2))
+
+    with pytest.raises(ValueError):
+        MappedDoublyLinkedList(str(path))
+
+    assert path.read_bytes() == b'MDLL' + bytes(HEADER_SIZE // 2)
+
+
+def test_foreign_file(tmp_path):
+    path = tmp_path / 'foreign.bin'
+    content = os.urandom(4096)
+    path.write_bytes(content)
+
+    with pytest.raises(ValueError):
+        MappedDoublyLinkedList(str(path))
+
+    assert path.read_bytes() == content   # The header must not be written over the file
@@ -0,0 +1,124 @@
+import os
+import queue
+import random
+import sys
+from collections import deque
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from queues import RingBufferDeque
+
+
+
+def test_matches_deque_across_the_wrap():
+    rng = random.Random(22)
+    ring = RingBufferDeque(8, on_full='grow')
+    expected = deque()
+
+    for step in range(3000):
+        operation = rng.random()
+
+        if operation < 0.3:
+            ring.push(step)
+            expected.append(step)
+
+        elif operation < 0.45:
+            ring.push_front(step)
+            expected.appendleft(step)
+
+        elif operation < 0.55:
+            values = list(range(step, step + rng.randrange(5)))
+            ring.put_many(values)
+            expected.extend(values)
+
+        elif operation < 0.7 and expected:
+            assert ring.pop() == expected.popleft()
+
+        elif operation < 0.8 and expected:
+            assert ring.pop_back() == expected.pop()
+
+        elif operation < 0.9:
+            count = rng.randrange(5)
+            assert ring.get_many(count) == [expected.popleft() for _ in range(min(count, len(expected)))]
+
+        elif expected:
+            index = rng.randrange(-len(expected), len(expected))
+            assert ring[index] == expected[index]
+
+    assert list(ring) == list(expected) and len(ring) == len(expected)
+    assert ring.peek() == expected[0] and ring.peek_back() == expected[-1]
+
+
+def test_reject_policy():
+    ring = RingBufferDeque(3, iterable=[1, 2, 3])
+
+    with pytest.raises(queue.Full):
+        ring.push(4)
+
+    with pytest.raises(queue.Full):
+        ring.push_front(0)
+
+    ring.pop()
+
+    with pytest.raises(queue.Full):
+        ring.put_many([4, 5])   # Nothing is added unless all fit
+
+    assert list(ring) == [2, 3] and ring.capacity == 3
+
+
+def test_overwrite_policy_keeps_the_latest_elements():
+    ring = RingBufferDeque(3, on_full='overwrite', iterable=[1, 2, 3])
+
+    ring.push(4)
+
+    assert list(ring) == [2, 3, 4]
+
+    ring.push_front(1)
+
+    assert list(ring) == [1, 2, 3]
+
+    ring.put_many([4, 5])
+
+    assert list(ring) == [3, 4, 5]
+
+    ring.put_many(range(10))
+
+    assert list(ring) == [7, 8, 9] and ring.capacity == 3 and ring.is_full()
+
+
+def test_grow_policy_doubles_the_capacity():
+    ring = RingBufferDeque(2, on_full='grow')
+    ring.push(1)
+    ring.push(2)
+    ring.push_front(0)
+
+    assert list(ring) == [0, 1, 2] and ring.capacity == 4
+
+    ring.put_many(range(3, 10))
+
+    assert list(ring) == list(range(10)) and ring.capacity == 10
+
+
+def test_removed_slots_are_cleared():
+    ring = RingBufferDeque(4, iterable=['a', 'b', 'c'])
+    ring.pop()
+    ring.pop_back()
+    ring.get_many(1)
+
+    assert ring.buffer == [None] * 4 and ring.is_empty() and ring.peek() is None
+
+    with pytest.raises(IndexError):
+        ring.pop()
+
+
+def test_checks_arguments():
+    with pytest.raises(ValueError):
+        RingBufferDeque(0)
+
+    with pytest.raises(ValueError):
+        RingBufferDeque(4, on_full='drop')
+
+    with pytest.raises(IndexError):
+        RingBufferDeque(4)[0]
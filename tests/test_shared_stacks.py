@@ -0,0 +1,103 @@
+import multiprocessing
+import os
+import queue
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from shared_stacks import SharedQueue, SharedStack
+
+
+
+def produce(buffer, start, count):
+    for value in range(start, start + count):
+        while True:
+            try:
+                buffer.push(value.to_bytes(4, 'little'))
+                break
+
+            except queue.Full:   # The buffer never blocks, wait for the consumer
+                pass
+
+    buffer.close()
+
+
+def consume(buffer, count, results):
+    values = []
+
+    while len(values) < count:
+        values.extend(int.from_bytes(payload, 'little') for payload in buffer.pop_many(count - len(values)))
+
+    results.put(values)
+    buffer.close()
+
+
+def test_stack_and_queue_order():
+    with SharedStack(4, payload_size=8) as stack, SharedQueue(4, payload_size=8) as q:
+        for buffer in (stack, q):
+            buffer.push(b'a')
+            buffer.push_many([b'bb', b'ccc'])
+
+        assert stack.peek() == b'ccc' and q.peek() == b'a'
+        assert stack.pop_many(5) == [b'ccc', b'bb', b'a']
+        assert q.pop_many(5) == [b'a', b'bb', b'ccc']
+        assert stack.is_empty() and len(q) == 0
+
+
+def test_capacity_and_payload_size_are_enforced():
+    with SharedQueue(2, payload_size=4) as q:
+        q.push(b'1234')
+
+        with pytest.raises(ValueError):
+            q.push(b'12345')
+
+        with pytest.raises(queue.Full):
+            q.push_many([b'a', b'b'])
+
+        q.push(b'b')
+
+        with pytest.raises(queue.Full):
+            q.push(b'c')
+
+        assert q.pop() == b'1234'
+
+        q.push(b'c')   # The freed slot is reused
+
+        assert q.pop_many(2) == [b'b', b'c']
+
+        with pytest.raises(IndexError):
+            q.pop()
+
+
+def test_attach_checks_the_kind():
+    with SharedQueue(2) as q:
+        attached = SharedQueue.attach(q.name, q.lock)
+        q.push(b'x')
+
+        assert attached.pop() == b'x'
+
+        attached.close()
+
+        with pytest.raises(ValueError):
+            SharedStack.attach(q.name, q.lock)
+
+
+@pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(), reason='needs the fork start method')
+def test_queue_is_first_in_first_out_across_processes():
+    context = multiprocessing.get_context('fork')
+    results = context.Queue()
+
+    with SharedQueue(16, payload_size=4, lock=context.Lock()) as q:
+        consumer = context.Process(target=consume, args=(q, 500, results), daemon=True)
+        producer = context.Process(target=produce, args=(q, 0, 500), daemon=True)
+        consumer.start()
+        producer.start()
+
+        values = results.get(timeout=30)
+        producer.join(30)
+        consumer.join(30)
+
+    assert values == list(range(500))
+    assert producer.exitcode == consumer.exitcode == 0
@@ -0,0 +1,187 @@
+import os
+import pickle
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from linked_lists import NodePool, SinglyLinkedNode
+from stacks import AggregateQueue, AggregateStack, Stack
+
+
+
+BACKENDS = ('linked', 'array')
+
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_push_and_pop_are_last_in_first_out(backend):
+    stack = Stack(backend)
+
+    for value in range(5):
+        stack.push(value)
+
+    assert stack.peek() == 4
+    assert [stack.pop() for _ in range(5)] == [4, 3, 2, 1, 0]
+    assert stack.is_empty()
+    assert stack.pop() is None
+    assert stack.peek() is None
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_push_many_and_pop_many(backend):
+    stack = Stack(backend)
+    stack.push(-1)
+    stack.push_many(range(5))
+
+    assert stack.peek() == 4
+    assert stack.pop_many(0) == []
+    assert stack.pop_many(3) == [4, 3, 2]
+    assert stack.pop_many(10) == [1, 0, -1]
+    assert stack.is_empty()
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_pop_many_checks_the_count(backend):
+    stack = Stack(backend)
+
+    with pytest.raises(TypeError):
+        stack.pop_many(1.5)
+
+    with pytest.raises(ValueError):
+        stack.pop_many(-1)
+
+
+def test_backends_agree():
+    stacks = [Stack(backend) for backend in BACKENDS]
+
+    for stack in stacks:
+        stack.push_many('abc')
+        stack.push('d')
+        stack.pop()
+        stack.push_many('ef')
+
+    assert stacks[0].pop_many(10) == stacks[1].pop_many(10) == list('fecba')
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        Stack('tree')
+
+
+
+def test_linked_stack_recycles_pool_nodes():
+    pool = NodePool(SinglyLinkedNode, 8)
+    stack = Stack(pool=pool)
+    stack.push_many(range(5))
+
+    assert stack.pop() == 4
+    assert stack.pop_many(2) == [3, 2]
+    assert len(pool) == 3
+
+    stack.push('a')
+
+    assert len(pool) == 2 and pool.hits == 1
+    assert stack.pop_many(10) == ['a', 1, 0]
+
+
+def test_pool_needs_the_linked_backend():
+    with pytest.raises(ValueError):
+        Stack('array', pool=NodePool(SinglyLinkedNode))
+
+    with pytest.raises(ValueError):
+        Stack(pool=NodePool())
+
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_snapshot_is_not_changed_by_the_stack(backend):
+    stack = Stack(backend)
+    stack.push_many([1, 2, 3])
+
+    snapshot = stack.snapshot()
+    stack.pop()
+    stack.push(4)
+
+    assert list(snapshot) == [3, 2, 1]
+    assert list(stack.snapshot()) == [4, 2, 1]
+
+
+def test_linked_snapshot_shares_the_nodes():
+    stack = Stack()
+    stack.push_many([1, 2])
+
+    assert stack.snapshot().head is stack.items.head
+
+
+def test_snapshot_refuses_pooled_stacks():
+    with pytest.raises(ValueError):
+        Stack(pool=NodePool(SinglyLinkedNode)).snapshot()
+
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_pickle_keeps_the_order(backend):
+    stack = Stack(backend)
+    stack.push_many([1, 2, 3])
+
+    copy = pickle.loads(pickle.dumps(stack))
+
+    assert copy.backend == backend
+    assert copy.pop_many(3) == [3, 2, 1]
+
+
+
+@pytest.mark.parametrize('operation, function', (('min', min), ('max', max), ('sum', sum)))
+def test_aggregate_stack(operation, function):
+    stack = AggregateStack(operation)
+    values = [5, 3, 8, 1, 9]
+
+    assert stack.aggregate() is None
+
+    for value in values:
+        stack.push(value)
+
+    assert stack.aggregate() == function(values)
+
+    stack.pop()
+    stack.pop()
+
+    assert stack.aggregate() == function(values[:3]) and stack.peek() == 8
+
+
+@pytest.mark.parametrize('operation, function', (('min', min), ('max', max), ('sum', sum)))
+def test_aggregate_queue_sliding_window(operation, function):
+    rng = random.Random(21)
+    values = [rng.randrange(100) for _ in range(300)]
+    window = AggregateQueue(operation)
+
+    for index, value in enumerate(values):
+        window.push(value)
+
+        if len(window) > 7:
+            assert window.pop() == values[index - 7]
+
+        assert window.aggregate() == function(values[max(0, index - 6):index + 1])
+
+
+def test_aggregate_queue_keeps_order_of_non_commutative_operations():
+    window = AggregateQueue(lambda left, right: left + right)
+
+    for value in 'abc':
+        window.push(value)
+
+    assert window.pop() == 'a'
+
+    window.push('d')
+
+    assert window.aggregate() == 'bcd' and window.peek() == 'b'
+    assert [window.pop() for _ in range(3)] == ['b', 'c', 'd']
+    assert window.is_empty() and window.pop() is None and window.aggregate() is None
+
+
+def test_aggregate_needs_a_known_operation():
+    with pytest.raises(ValueError):
+        AggregateStack('median')